@@ -0,0 +1,34 @@
+"""add keyset pagination indexes to user table
+
+Revision ID: 3f9c2a71d4e8
+Revises: 1a5a4ee6226c
+Create Date: 2026-10-18 09:12:41.208413
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a71d4e8"
+down_revision: Union[str, None] = "1a5a4ee6226c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_created_at_id", "user", ["created_at", "id"], unique=False)
+    op.create_index("ix_user_is_active_created_at_id", "user", ["is_active", "created_at", "id"], unique=False)
+    op.create_index("ix_user_is_onboarding_created_at_id", "user", ["is_onboarding", "created_at", "id"], unique=False)
+    op.create_index("ix_user_roles_created_at_id", "user", ["roles", "created_at", "id"], unique=False)
+    op.create_index("ix_user_last_login", "user", ["last_login"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_last_login", table_name="user")
+    op.drop_index("ix_user_roles_created_at_id", table_name="user")
+    op.drop_index("ix_user_is_onboarding_created_at_id", table_name="user")
+    op.drop_index("ix_user_is_active_created_at_id", table_name="user")
+    op.drop_index("ix_user_created_at_id", table_name="user")
@@ -0,0 +1,45 @@
+"""add soft delete to user table
+
+Revision ID: c84e1d9b5f27
+Revises: 3f9c2a71d4e8
+Create Date: 2026-10-18 18:31:07.502216
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c84e1d9b5f27"
+down_revision: Union[str, None] = "3f9c2a71d4e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LISTING_INDEXES = {
+    "ix_user_created_at_id": ["created_at", "id"],
+    "ix_user_is_active_created_at_id": ["is_active", "created_at", "id"],
+    "ix_user_is_onboarding_created_at_id": ["is_onboarding", "created_at", "id"],
+    "ix_user_roles_created_at_id": ["roles", "created_at", "id"],
+    "ix_user_last_login": ["last_login"],
+}
+
+
+def upgrade() -> None:
+    op.add_column("user", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    # Reads skip soft-deleted users, so the listing indexes leave them out
+    for index_name, columns in LISTING_INDEXES.items():
+        op.drop_index(index_name, table_name="user")
+        op.create_index(index_name, "user", columns, unique=False, postgresql_where=sa.text("deleted_at IS NULL"))
+    op.create_index(
+        "ix_user_deleted_at", "user", ["deleted_at"], unique=False, postgresql_where=sa.text("deleted_at IS NOT NULL")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_deleted_at", table_name="user")
+    for index_name, columns in LISTING_INDEXES.items():
+        op.drop_index(index_name, table_name="user")
+        op.create_index(index_name, "user", columns, unique=False)
+    op.drop_column("user", "deleted_at")
@@ -0,0 +1,26 @@
+"""add changed-at index to user table
+
+Revision ID: d3a7f0c9b214
+Revises: c84e1d9b5f27
+Create Date: 2026-10-18 21:04:52.118307
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a7f0c9b214"
+down_revision: Union[str, None] = "c84e1d9b5f27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_changed_at", "user", [sa.text("coalesce(updated_at, created_at)")], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_changed_at", table_name="user")
@@ -1,21 +1,36 @@
 import typing
 
 import fastapi
-from sqlalchemy.ext.asyncio import (
-    async_sessionmaker as sqlalchemy_async_sessionmaker,
-    AsyncSession as SQLAlchemyAsyncSession,
-)
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
 
-# from src.api.dependencies.repository. import get_async_session
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.cache.manager import get_cache
 from src.repository.crud.base import BaseCRUDRepository
 from src.repository.database import get_session
+from src.repository.unit_of_work import UnitOfWork
+
+
+async def get_unit_of_work(
+    async_session: SQLAlchemyAsyncSession = fastapi.Depends(get_session),
+    cache: BaseCacheBackend = fastapi.Depends(get_cache),
+) -> typing.AsyncGenerator[UnitOfWork, None]:
+    async with UnitOfWork(async_session=async_session, cache=cache) as unit_of_work:
+        yield unit_of_work
+
 
 def get_repository(
     repo_type: typing.Type[BaseCRUDRepository],
-) -> typing.Callable[[SQLAlchemyAsyncSession], BaseCRUDRepository]:
+    scope: typing.Literal["function", "request"] = "function",
+) -> typing.Callable[[UnitOfWork], BaseCRUDRepository]:
+    """
+    Resolve `repo_type` from the request's unit of work; every repository of one request shares it.
+
+    With the default `scope="function"` the unit of work commits right after the path operation returns, before
+    the response is sent. Streaming responses that keep reading after that need `scope="request"`.
+    """
     def _get_repo(
-        async_session: SQLAlchemyAsyncSession = fastapi.Depends(get_session),
+        unit_of_work: UnitOfWork = fastapi.Depends(get_unit_of_work, scope=scope),
     ) -> BaseCRUDRepository:
-        return repo_type(async_session=async_session)
+        return unit_of_work.repository(repo_type)
 
     return _get_repo
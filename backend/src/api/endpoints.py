@@ -1,9 +1,15 @@
 import fastapi
 
-from src.api.routes.user import router as user_router
+from src.api.routes.export import router as export_router
+from src.api.routes.health import router as health_router
+from src.api.routes.metrics import router as metrics_router
 from src.api.routes.onboarding import router as user_onboarding
+from src.api.routes.user import router as user_router
 
 router = fastapi.APIRouter()
 
 router.include_router(router=user_router)
 router.include_router(router=user_onboarding)
+router.include_router(router=health_router)
+router.include_router(router=export_router)
+router.include_router(router=metrics_router)
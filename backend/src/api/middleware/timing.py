@@ -0,0 +1,76 @@
+import contextlib
+import time
+import typing
+
+from src.repository.diagnostics import query_log_scope
+from src.utilities.metrics.request_timing import current_request_timings, RequestTimings, route_metrics
+
+Scope = typing.MutableMapping[str, typing.Any]
+Message = typing.MutableMapping[str, typing.Any]
+Receive = typing.Callable[[], typing.Awaitable[Message]]
+Send = typing.Callable[[Message], typing.Awaitable[None]]
+ASGIApp = typing.Callable[[Scope, Receive, Send], typing.Awaitable[None]]
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def format_server_timing(timings: RequestTimings, elapsed: float) -> bytes:
+    """
+    `Server-Timing` value in milliseconds: database, pool wait and the rest of the handler up to the response start.
+    """
+    handler_time = max(elapsed - timings.db_time - timings.pool_wait, 0.0)
+    return (
+        f'db;dur={timings.db_time * 1000:.2f};desc="statements: {timings.statements}", '
+        f"pool;dur={timings.pool_wait * 1000:.2f}, "
+        f"app;dur={handler_time * 1000:.2f}, "
+        f"total;dur={elapsed * 1000:.2f}"
+    ).encode()
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware timing every HTTP request: the engine hooks and pool queue add to the `RequestTimings` it
+    sets as the current context, the response gets a `Server-Timing` header, and `route_metrics` gets one sample per
+    request labelled with the matched route's name, e.g. `users:get-user`.
+
+    With `is_query_log_enabled`, each request is also a `query_log_scope`, so the query detector can tell repeated
+    statements of one request apart from the same statement across requests.
+
+    Pure ASGI instead of `BaseHTTPMiddleware`, so there is no extra task or response body copy per request.
+    """
+
+    def __init__(
+        self, app: ASGIApp, is_server_timing_enabled: bool = True, is_query_log_enabled: bool = False
+    ) -> None:
+        self.app = app
+        self.is_server_timing_enabled = is_server_timing_enabled
+        self.is_query_log_enabled = is_query_log_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_request_timings.set(timings)
+        started = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.is_server_timing_enabled:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(timings, time.perf_counter() - started)))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            with query_log_scope() if self.is_query_log_enabled else contextlib.nullcontext():
+                await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_request_timings.reset(token)
+            route = scope.get("route")
+            route_metrics.observe(
+                method=scope["method"],
+                route=getattr(route, "name", UNMATCHED_ROUTE),
+                duration=time.perf_counter() - started,
+                timings=timings,
+            )
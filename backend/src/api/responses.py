@@ -0,0 +1,33 @@
+import typing
+
+import fastapi
+from fastapi.responses import JSONResponse
+
+from src.models.schemas.base import BaseSchemaModel
+from src.utilities.formatters.json_formatter import dumps_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    `JSONResponse` encoding with orjson, datetimes formatted like `BaseSchemaModel`'s `json_encoders`.
+    """
+
+    def render(self, content: typing.Any) -> bytes:
+        return dumps_json(content)
+
+
+def respond_from_attributes(
+    schema: type[BaseSchemaModel], obj: typing.Any, status_code: int = fastapi.status.HTTP_200_OK
+) -> FastJSONResponse:
+    """
+    Validate `obj` (an ORM row, or a dict holding them) into `schema` once and encode it. Returning a `Response`
+    makes FastAPI skip the second `response_model` validation, so `response_model` only documents the route.
+    """
+    return FastJSONResponse(content=schema.model_validate(obj).model_dump(), status_code=status_code)
+
+
+def respond_with_json(payload: str | bytes, status_code: int = fastapi.status.HTTP_200_OK) -> fastapi.Response:
+    """
+    Send an already encoded JSON payload, e.g. straight from the cache.
+    """
+    return fastapi.Response(content=payload, status_code=status_code, media_type="application/json")
@@ -0,0 +1,36 @@
+import datetime
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies.repository import get_repository
+from src.models.schemas.export import ExportFormat
+from src.repository.crud.user import USER_EXPORT_COLUMNS, UserCRUDRepository
+from src.utilities.formatters.export_formatter import encode_export_rows, EXPORT_MEDIA_TYPES, gzip_chunks
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+@router.get(
+    path="/users",
+    name="exports:export-users",
+    response_class=StreamingResponse,
+)
+async def export_users(
+    format: ExportFormat = ExportFormat.NDJSON,
+    updated_since: datetime.datetime | None = None,
+    gzip: bool = False,
+    # The body streams after the handler returns, so the session has to live for the whole request
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository, scope="request")),
+) -> StreamingResponse:
+    body = encode_export_rows(
+        partitions=user_repo.stream_users_with_onboarding(updated_since=updated_since),
+        export_format=format,
+        columns=[column.key for column in USER_EXPORT_COLUMNS],
+    )
+    headers = {"Content-Disposition": f'attachment; filename="users.{format.value}"'}
+    if gzip:
+        body = gzip_chunks(chunks=body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(content=body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends
+
+from src.config.manager import settings
+from src.models.schemas.health import (
+    CacheStatsInResponse,
+    HistogramInResponse,
+    PoolStatsInResponse,
+    StatementCacheStatsInResponse,
+    StatementStatsInResponse,
+)
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.cache.manager import get_cache
+from src.repository.database import engine
+from src.repository.metrics import pool_metrics
+from src.repository.statements import statement_registry
+from src.utilities.metrics.histogram import Histogram
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get(
+    path="/cache",
+    name="health:cache",
+    response_model=CacheStatsInResponse,
+)
+async def get_cache_stats(cache: BaseCacheBackend = Depends(get_cache)) -> CacheStatsInResponse:
+    return CacheStatsInResponse(
+        backend=cache.name,
+        hits=cache.stats.hits,
+        misses=cache.stats.misses,
+        evictions=cache.stats.evictions,
+        expirations=cache.stats.expirations,
+        hit_ratio=cache.stats.hit_ratio,
+        size=await cache.size(),
+    )
+
+
+def _histogram_in_response(histogram: Histogram) -> HistogramInResponse:
+    return HistogramInResponse(
+        count=histogram.count,
+        sum=histogram.sum,
+        p50=histogram.quantile(0.5),
+        p95=histogram.quantile(0.95),
+        p99=histogram.quantile(0.99),
+        buckets=histogram.cumulative_buckets(),
+    )
+
+
+@router.get(
+    path="/db",
+    name="health:db",
+    response_model=PoolStatsInResponse,
+)
+async def get_db_pool_stats() -> PoolStatsInResponse:
+    pool = engine.pool
+    return PoolStatsInResponse(
+        pool_class=type(pool).__name__,
+        size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_OVERFLOW,
+        timeout=settings.DB_TIMEOUT,
+        checked_out=pool.checkedout(),  # type: ignore
+        checked_in=pool.checkedin(),  # type: ignore
+        overflow=max(pool.overflow(), 0),  # type: ignore
+        checkouts=pool_metrics.checkouts,
+        connects=pool_metrics.connects,
+        timeouts=pool_metrics.timeouts,
+        invalidations=pool_metrics.invalidations,
+        wait_time=_histogram_in_response(pool_metrics.wait_time),
+        connect_latency=_histogram_in_response(pool_metrics.connect_latency),
+    )
+
+
+@router.get(
+    path="/statements",
+    name="health:statements",
+    response_model=StatementCacheStatsInResponse,
+)
+async def get_statement_cache_stats() -> StatementCacheStatsInResponse:
+    return StatementCacheStatsInResponse(
+        prepared_statement_cache_size=settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        statements=[
+            StatementStatsInResponse(
+                name=name,
+                executions=stats.executions,
+                compiled_cache_hits=stats.compiled_cache_hits,
+                compiled_cache_hit_ratio=stats.compiled_cache_hit_ratio,
+                prepared_cache_hits=stats.prepared_cache_hits,
+                prepared_cache_hit_ratio=stats.prepared_cache_hit_ratio,
+            )
+            for name, stats in statement_registry.stats.items()
+        ],
+    )
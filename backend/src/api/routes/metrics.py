@@ -0,0 +1,50 @@
+import fastapi
+from fastapi import APIRouter
+
+from src.repository.metrics import pool_metrics
+from src.utilities.formatters.prometheus_formatter import format_counter, format_histogram
+from src.utilities.metrics.request_timing import route_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for name, help, histograms in (
+        ("http_request_duration_seconds", "Time until the response was sent.", route_metrics.duration),
+        ("http_request_handler_seconds", "Time not spent on the database or pool.", route_metrics.handler_time),
+        ("http_request_db_seconds", "Time spent executing statements.", route_metrics.db_time),
+        ("http_request_pool_wait_seconds", "Time spent waiting for a pooled connection.", route_metrics.pool_wait),
+        ("http_request_db_statements", "Statements executed per request.", route_metrics.statements),
+    ):
+        lines += format_histogram(
+            name=name,
+            help=help,
+            histograms=[
+                ({"method": method, "route": route}, histogram)
+                for (method, route), histogram in list(histograms.items())
+            ],
+        )
+    lines += format_histogram(
+        name="db_pool_wait_seconds", help="Connection checkout wait time.", histograms=[({}, pool_metrics.wait_time)]
+    )
+    lines += format_histogram(
+        name="db_pool_connect_seconds", help="New connection latency.", histograms=[({}, pool_metrics.connect_latency)]
+    )
+    lines += format_counter(name="db_pool_checkouts_total", help="Connection checkouts.", value=pool_metrics.checkouts)
+    lines += format_counter(name="db_pool_timeouts_total", help="Timed out checkouts.", value=pool_metrics.timeouts)
+    lines += format_counter(
+        name="db_pool_invalidations_total", help="Invalidated connections.", value=pool_metrics.invalidations
+    )
+    return "\n".join(lines) + "\n"
+
+
+@router.get(
+    path="/metrics",
+    name="metrics:prometheus",
+    response_class=fastapi.responses.PlainTextResponse,
+)
+async def get_metrics() -> fastapi.Response:
+    return fastapi.Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -3,10 +3,20 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.onboarding import OnboardingRequest, OnboardingResponse, OnboardingFeedback
+from src.config.manager import settings
+from src.models.schemas.onboarding import (
+    OnboardingBatchItemResponse,
+    OnboardingBatchStatus,
+    OnboardingFeedback,
+    OnboardingRequest,
+    OnboardingResponse,
+)
 from src.repository.crud.onboarding import OnboardingCRUDRepository
-from src.utilities.onboarding.calculate_points import calculate_points
+from src.repository.write_behind import FeedbackBuffer, get_feedback_buffer
+from src.utilities.exceptions.database import WriteBufferFull
+from src.utilities.onboarding.batch_scoring import is_valid_submission, score_submissions
 from src.utilities.onboarding.calculate_percentage import calculate_percentage
+from src.utilities.onboarding.calculate_points import calculate_points
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
@@ -52,24 +62,95 @@ async def create_or_update_onboarding(
 
 
 @router.post(
-    path="/save-feedback",
-    name="onboarding:save-feedback",
+    path="/submit-answers/batch",
+    name="onboarding:create-onboarding-batch",
+    response_model=list[OnboardingBatchItemResponse],
+    status_code=status.HTTP_200_OK,
 )
-async def save_feedback(
-    feedback_create: OnboardingFeedback,
+async def create_or_update_onboarding_batch(
+    onboarding_creates: list[OnboardingRequest],
     onboarding_repo: OnboardingCRUDRepository = Depends(
         get_repository(
             repo_type=OnboardingCRUDRepository
         )
-    ), 
+    ),
+) -> list[OnboardingBatchItemResponse]:
+    # One bad questionnaire must not fail the rest of the batch, so only valid submissions are scored
+    valid_indexes = [
+        index
+        for index, onboarding_create in enumerate(onboarding_creates)
+        if is_valid_submission(onboarding_create.items)
+    ]
+    valid_creates = [onboarding_creates[index] for index in valid_indexes]
+    # Score every valid submission in one vectorized pass
+    scores = score_submissions([onboarding_create.items for onboarding_create in valid_creates])
+    for onboarding_create, primary, specific in zip(
+        valid_creates, scores.primary_personalities, scores.specific_personalities
+    ):
+        onboarding_create.primaryPersonality = primary
+        onboarding_create.specificPersonality = specific
+
+    try:
+        saved_user_ids = await onboarding_repo.create_or_update_onboarding_batch(onboarding_creates=valid_creates)
+    except SystemError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    last_index_by_user = {onboarding_creates[index].userId: index for index in valid_indexes}
+    valid_index_set = set(valid_indexes)
+    results = []
+    for index, onboarding_create in enumerate(onboarding_creates):
+        if index not in valid_index_set:
+            results.append(
+                OnboardingBatchItemResponse(
+                    userId=onboarding_create.userId, status=OnboardingBatchStatus.INVALID_ANSWERS
+                )
+            )
+            continue
+        if onboarding_create.userId not in saved_user_ids:
+            results.append(
+                OnboardingBatchItemResponse(
+                    userId=onboarding_create.userId, status=OnboardingBatchStatus.USER_NOT_FOUND
+                )
+            )
+            continue
+        results.append(
+            OnboardingBatchItemResponse(
+                userId=onboarding_create.userId,
+                status=(
+                    OnboardingBatchStatus.SAVED
+                    if last_index_by_user[onboarding_create.userId] == index
+                    else OnboardingBatchStatus.SUPERSEDED
+                ),
+                primaryPersonality=onboarding_create.primaryPersonality,
+                specificPersonality=onboarding_create.specificPersonality,
+            )
+        )
+    return results
+
+
+@router.post(
+    path="/save-feedback",
+    name="onboarding:save-feedback",
+)
+async def save_feedback(
+    feedback_create: OnboardingFeedback,
+    onboarding_repo: OnboardingCRUDRepository = Depends(get_repository(repo_type=OnboardingCRUDRepository)),
+    feedback_buffer: FeedbackBuffer = Depends(get_feedback_buffer),
 ) -> JSONResponse:
+    if settings.IS_FEEDBACK_WRITE_BEHIND_ENABLED:
+        # Saved by the next flush; nobody reads feedback back in real time
+        try:
+            await feedback_buffer.submit(user_id=feedback_create.userId, feedback=feedback_create.feedback)
+        except WriteBufferFull as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"}
+            )
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content={"message": "Feedback accepted"})
+
     try:
         # Save feedback using the repository
         await onboarding_repo.save_feedback(feedback_create)
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={"message": "Feedback saved successfully"}
-        )
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"message": "Feedback saved successfully"})
     except NoResultFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
@@ -1,23 +1,42 @@
+import datetime
+
 import fastapi
 import pydantic
-from fastapi import status, HTTPException, Depends, APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.user import UserInResponse, UserInCreate, UserInUpdate
+from src.api.responses import FastJSONResponse, respond_from_attributes, respond_with_json
+from src.config.manager import settings
 from src.models.db.user import User
-from src.repository.crud.user import UserCRUDRepository
-from src.utilities.exceptions.database import EmailAlreadyExists, UsernameAlreadyExists
-from src.utilities.exceptions.http.exc_404 import (
-    http_404_exc_id_not_found_request
+from src.models.schemas.user import (
+    UserAvailabilityFilterInResponse,
+    UserAvailabilityInResponse,
+    UserBulkCreateStatus,
+    UserInBulkCreateResponse,
+    UserInCreate,
+    UserInPageResponse,
+    UserInResponse,
+    UserInUpdate,
+    UserProfileInResponse,
 )
+from src.repository.activity import ActivityTracker, get_activity_tracker
+from src.repository.availability import AvailabilityIndex, get_availability_index
+from src.repository.crud.user import parse_profile_fields, UserCRUDRepository
+from src.utilities.exceptions.database import EmailAlreadyExists, UsernameAlreadyExists
 from src.utilities.exceptions.http.exc_400 import (
+    http_400_exc_bad_availability_request,
+    http_400_exc_bad_cursor_request,
     http_400_exc_bad_email_request,
-    http_400_exc_bad_username_request
+    http_400_exc_bad_fields_request,
+    http_400_exc_bad_username_request,
 )
-from src.utilities.exceptions.http.exc_409 import  (
-    http_409_exc_bad_user_collision_request
+from src.utilities.exceptions.http.exc_404 import http_404_exc_id_not_found_request
+from src.utilities.exceptions.http.exc_409 import (
+    http_409_exc_bad_user_collision_request,
+    http_409_exc_rebuild_in_progress_request,
 )
+from src.utilities.formatters.cursor_formatter import decode_keyset_cursor, encode_keyset_cursor
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -30,31 +49,78 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def create_user(
     user_create: UserInCreate,
     user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
-) -> UserInResponse:
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
+) -> fastapi.Response:
     try:
-        await user_repo.is_email_taken(email=user_create.email)
-        await user_repo.is_username_taken(username=user_create.username)
         new_user = await user_repo.create_user(user_create=user_create)
     except EmailAlreadyExists:
         raise await http_400_exc_bad_email_request(email=user_create.email)
     except UsernameAlreadyExists:
         raise await http_400_exc_bad_username_request(username=user_create.username)
-    
-    return UserInResponse(
-        id=new_user.id,
-        email=new_user.email,
-        username=new_user.username,
-        first_name=new_user.first_name,
-        last_name=new_user.last_name,
-        roles=new_user.roles,
-        auth_id=new_user.auth_id,
-        is_active=new_user.is_active,
-        is_onboarding=new_user.is_onboarding,
-        is_logged_in=new_user.is_logged_in,
-        last_login=new_user.last_login,
-        created_at=new_user.created_at,
-        updated_at=new_user.updated_at,
-    )
+    availability_index.add(username=new_user.username, email=new_user.email)
+
+    return respond_from_attributes(UserInResponse, new_user, status_code=fastapi.status.HTTP_201_CREATED)
+
+@router.post(
+    path="/bulk",
+    name="users:create-users-bulk",
+    response_model=UserInBulkCreateResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def create_users_bulk(
+    users_create: list[UserInCreate],
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
+) -> UserInBulkCreateResponse:
+    try:
+        results = await user_repo.create_users_bulk(users_create=users_create)
+    except SystemError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    created = 0
+    for result in results:
+        if result.status == UserBulkCreateStatus.CREATED:
+            availability_index.add(username=result.username, email=result.email)
+            created += 1
+    return UserInBulkCreateResponse(created=created, rejected=len(results) - created, results=results)
+
+@router.get(
+    path="/availability",
+    name="users:check-availability",
+    response_model=UserAvailabilityInResponse,
+)
+async def check_availability(
+    username: str | None = None,
+    email: str | None = None,
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
+) -> UserAvailabilityInResponse:
+    if username is None and email is None:
+        raise await http_400_exc_bad_availability_request()
+
+    # Answered by this worker's filter; the database is only asked about probably taken values
+    availability = UserAvailabilityInResponse(username=username, email=email)
+    if username is not None:
+        availability.is_username_available = await availability_index.is_username_available(
+            username=username, user_repo=user_repo
+        )
+    if email is not None:
+        availability.is_email_available = await availability_index.is_email_available(email=email, user_repo=user_repo)
+    return availability
+
+@router.post(
+    path="/availability/rebuild",
+    name="users:rebuild-availability-filter",
+    response_model=UserAvailabilityFilterInResponse,
+)
+async def rebuild_availability_filter(
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
+) -> UserAvailabilityFilterInResponse:
+    # Rebuilds the filter of the worker serving the request only; a second full scan is refused, not queued
+    if availability_index.is_rebuilding:
+        raise await http_409_exc_rebuild_in_progress_request()
+    await availability_index.rebuild()
+    return UserAvailabilityFilterInResponse(**availability_index.describe())
 
 @router.put(
     path="/{user_id}",
@@ -65,36 +131,25 @@ async def update_user(
     user_id: int,
     user_update: UserInUpdate,
     user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
-) -> UserInResponse:
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
+) -> fastapi.Response:
     try:
-        if user_update.email:
-            await user_repo.is_email_taken(email=user_update.email)
-        if user_update.username:
-            await user_repo.is_username_taken(username=user_update.username)
         updated_user = await user_repo.update_user(user_id=user_id, user_update=user_update)
     except EmailAlreadyExists:
-        raise await http_400_exc_bad_email_request(email=user_update.email)
+        raise await http_400_exc_bad_email_request(email=user_update.email or "")
     except UsernameAlreadyExists:
-        raise await http_400_exc_bad_username_request(username=user_update.username)
+        raise await http_400_exc_bad_username_request(username=user_update.username or "")
     except IntegrityError:
-        raise await http_409_exc_bad_user_collision_request(id=user_id)
-    
-    if not updated_user:
-        raise await http_404_exc_id_not_found_request(user_id=user_id)
-    return UserInResponse(
-        id=updated_user.id,
-        email=updated_user.email,
-        username=updated_user.username,
-        first_name=updated_user.first_name,
-        last_name=updated_user.last_name,
-        auth_id=updated_user.auth_id,
-        is_onboarding=updated_user.is_onboarding,
-        is_active=updated_user.is_active,
-        is_logged_in=updated_user.is_logged_in,
-        last_login=updated_user.last_login,
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at
-    )
+        raise await http_409_exc_bad_user_collision_request(id=str(user_id))
+    except NoResultFound:
+        raise await http_404_exc_id_not_found_request(id=user_id)
+    # The previous username / email may be free now, but a Bloom filter cannot drop them
+    renamed = {"username", "email"} & user_update.dict(exclude_unset=True).keys()
+    if renamed:
+        availability_index.add(username=updated_user.username, email=updated_user.email)
+        availability_index.mark_stale(count=len(renamed))
+
+    return respond_from_attributes(UserInResponse, updated_user)
 
 @router.delete(
     path="/{user_id}",
@@ -104,15 +159,86 @@ async def update_user(
 async def delete_user(
     user_id: int,
     user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+    availability_index: AvailabilityIndex = Depends(get_availability_index),
 ) -> None:
     try:
-        await user_repo.delete_user(user_id=user_id)
+        if settings.IS_USER_SOFT_DELETE_ENABLED:
+            # Hidden right away and removed with its onboarding row by `src.jobs.purge_deleted_users`
+            await user_repo.soft_delete_user(user_id=user_id)
+        else:
+            await user_repo.delete_user(user_id=user_id)
     except NoResultFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except SystemError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    # A soft-deleted user keeps its username and email until it is purged
+    if not settings.IS_USER_SOFT_DELETE_ENABLED:
+        availability_index.mark_stale(count=2)
+
+@router.post(
+    path="/{user_id}/login",
+    name="users:login",
+    status_code=fastapi.status.HTTP_202_ACCEPTED,
+)
+async def login_user(
+    user_id: int,
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+    activity_tracker: ActivityTracker = Depends(get_activity_tracker),
+) -> None:
+    try:
+        await user_repo.read_user_row_by_id(user_id=user_id)
+    except NoResultFound:
+        raise await http_404_exc_id_not_found_request(id=user_id)
+    # `is_logged_in` and `last_login` are written by the tracker's next flush
+    activity_tracker.record_activity(user_id=user_id)
+
+@router.post(
+    path="/{user_id}/heartbeat",
+    name="users:heartbeat",
+    status_code=fastapi.status.HTTP_202_ACCEPTED,
+)
+async def heartbeat_user(
+    user_id: int,
+    activity_tracker: ActivityTracker = Depends(get_activity_tracker),
+) -> None:
+    activity_tracker.record_activity(user_id=user_id)
+
+@router.post(
+    path="/{user_id}/logout",
+    name="users:logout",
+    status_code=fastapi.status.HTTP_202_ACCEPTED,
+)
+async def logout_user(
+    user_id: int,
+    activity_tracker: ActivityTracker = Depends(get_activity_tracker),
+) -> None:
+    activity_tracker.record_logout(user_id=user_id)
+
+@router.get(
+    path="/{user_id}/profile",
+    name="users:get-user-profile",
+    response_model=UserProfileInResponse,
+)
+async def get_user_profile(
+    user_id: int,
+    fields: str | None = Query(default=None, description="Comma-separated, e.g. `id,email,onboarding.feedback`."),
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+) -> fastapi.Response:
+    try:
+        user_fields, onboarding_fields = parse_profile_fields(fields=fields)
+    except ValueError:
+        raise await http_400_exc_bad_fields_request(fields=fields or "")
+
+    try:
+        profile = await user_repo.read_user_profile_by_id(
+            user_id=user_id, user_fields=user_fields, onboarding_fields=onboarding_fields
+        )
+    except NoResultFound:
+        raise await http_404_exc_id_not_found_request(id=user_id)
+    # A projection is a partial `UserProfileInResponse`, so it is encoded as is instead of validated
+    return FastJSONResponse(content=profile)
 
 @router.get(
     path="/{user_id}",
@@ -122,24 +248,47 @@ async def delete_user(
 async def get_user(
     user_id: int,
     user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
-) -> UserInResponse:
+) -> fastapi.Response:
     try:
-        user: User = await user_repo.get_user_by_id(user_id=user_id)
-        return UserInResponse(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            auth_id=user.auth_id,
-            is_onboarding=user.is_onboarding,
-            is_active=user.is_active,
-            is_logged_in=user.is_logged_in,
-            last_login=user.last_login,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
+        return respond_with_json(await user_repo.read_user_json_by_id(user_id=user_id))
     except NoResultFound:
         raise await http_404_exc_id_not_found_request(id=user_id)
     except SystemError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.get(
+    path="",
+    name="users:list-users",
+    response_model=UserInPageResponse,
+)
+async def list_users(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    is_active: bool | None = None,
+    is_onboarding: bool | None = None,
+    roles: list[int] | None = Query(default=None),
+    last_login_from: datetime.datetime | None = None,
+    last_login_to: datetime.datetime | None = None,
+    user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
+) -> fastapi.Response:
+    try:
+        after = decode_keyset_cursor(cursor=cursor) if cursor else None
+    except ValueError:
+        raise await http_400_exc_bad_cursor_request(cursor=cursor or "")
+
+    users = await user_repo.list_users(
+        limit=limit,
+        after=after,
+        is_active=is_active,
+        is_onboarding=is_onboarding,
+        roles=roles,
+        last_login_from=last_login_from,
+        last_login_to=last_login_to,
+    )
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = encode_keyset_cursor(created_at=users[-1].created_at, id=users[-1].id)
+
+    # Core rows already hold exactly the `UserInResponse` fields, no model needed in between
+    return FastJSONResponse(content={"items": [user.to_dict() for user in users], "next_cursor": next_cursor})
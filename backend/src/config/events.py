@@ -1,21 +1,52 @@
-# import typing
-
-# import fastapi
-# import loguru
-
-# from src.repository.events import dispose_db_connection, initialize_db_connection
-
-
-# def execute_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
-#     async def launch_backend_server_events() -> None:
-#         await initialize_db_connection(backend_app=backend_app)
-
-#     return launch_backend_server_events
-
-
-# def terminate_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
-#     @loguru.logger.catch
-#     async def stop_backend_server_events() -> None:
-#         await dispose_db_connection(backend_app=backend_app)
-
-#     return stop_backend_server_events
+import contextlib
+import typing
+
+import fastapi
+import loguru
+
+from src.config.manager import settings
+from src.repository.activity import get_activity_tracker
+from src.repository.availability import get_availability_index
+from src.repository.cache.manager import get_cache
+from src.repository.database import engine, replica_engines, session_tracker
+from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.repository.write_behind import get_feedback_buffer
+
+
+@contextlib.asynccontextmanager
+async def lifespan(backend_app: fastapi.FastAPI) -> typing.AsyncIterator[None]:
+    """
+    Warm the pool before the worker accepts traffic; on shutdown drain in-flight sessions, save buffered writes, then
+    dispose the engine.
+    """
+    await initialize_db_connection(backend_app=backend_app, async_engine=engine)
+    if settings.IS_FEEDBACK_WRITE_BEHIND_ENABLED:
+        get_feedback_buffer().start()
+    with loguru.logger.catch():
+        await get_activity_tracker().start()
+    # Built while the worker already serves; availability checks go to the database until it is ready
+    get_availability_index().start()
+
+    yield
+
+    with loguru.logger.catch():
+        await get_availability_index().close()
+
+    async def flush_write_behind() -> None:
+        if settings.IS_FEEDBACK_WRITE_BEHIND_ENABLED:
+            with loguru.logger.catch():
+                await get_feedback_buffer().close()
+        with loguru.logger.catch():
+            await get_activity_tracker().close()
+
+    with loguru.logger.catch():
+        await dispose_db_connection(
+            backend_app=backend_app,
+            session_tracker=session_tracker,
+            before_dispose=flush_write_behind,
+        )
+    for replica_engine in replica_engines:
+        with loguru.logger.catch():
+            await replica_engine.dispose()
+    with loguru.logger.catch():
+        await get_cache().close()
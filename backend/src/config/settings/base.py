@@ -26,7 +26,47 @@ class BackendBaseSettings(BaseSettings):
     OPENAPI_PREFIX: str = ""
 
     DB_ASYNC_URL: str = decouple.config("DB_ASYNC_URL", cast=str)  # type: ignore
+    DB_REPLICA_URLS: str = decouple.config("DB_REPLICA_URLS", default="", cast=str)  # type: ignore
+    DB_REPLICA_SELECTION: str = decouple.config("DB_REPLICA_SELECTION", default="round_robin", cast=str)  # type: ignore
+    DB_READ_YOUR_WRITES_WINDOW: float = decouple.config("DB_READ_YOUR_WRITES_WINDOW", default=5, cast=float)  # type: ignore
+    DB_POOL_SIZE: int = decouple.config("DB_POOL_SIZE", default=10, cast=int)  # type: ignore
+    DB_POOL_OVERFLOW: int = decouple.config("DB_POOL_OVERFLOW", default=10, cast=int)  # type: ignore
+    DB_TIMEOUT: float = decouple.config("DB_TIMEOUT", default=30, cast=float)  # type: ignore
+    DB_POOL_RECYCLE: int = decouple.config("DB_POOL_RECYCLE", default=1800, cast=int)  # type: ignore
+    DB_POOL_PRE_PING: bool = decouple.config("DB_POOL_PRE_PING", default=True, cast=bool)  # type: ignore
+    DB_POOL_USE_LIFO: bool = decouple.config("DB_POOL_USE_LIFO", default=False, cast=bool)  # type: ignore
+    DB_POOL_WARM_SIZE: int = decouple.config("DB_POOL_WARM_SIZE", default=5, cast=int)  # type: ignore
+    DB_DRAIN_TIMEOUT: float = decouple.config("DB_DRAIN_TIMEOUT", default=10, cast=float)  # type: ignore
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = decouple.config("DB_PREPARED_STATEMENT_CACHE_SIZE", default=500, cast=int)  # type: ignore
+    IS_DB_ECHO_LOG: bool = decouple.config("IS_DB_ECHO_LOG", default=False, cast=bool)  # type: ignore
+    IS_DB_QUERY_DETECTOR_ENABLED: bool = decouple.config("IS_DB_QUERY_DETECTOR_ENABLED", default=False, cast=bool)  # type: ignore
+    DB_SLOW_QUERY_THRESHOLD: float = decouple.config("DB_SLOW_QUERY_THRESHOLD", default=0.2, cast=float)  # type: ignore
+    DB_REPEATED_QUERY_THRESHOLD: int = decouple.config("DB_REPEATED_QUERY_THRESHOLD", default=3, cast=int)  # type: ignore
+    DB_BULK_CHUNK_SIZE: int = decouple.config("DB_BULK_CHUNK_SIZE", default=1000, cast=int)  # type: ignore
+    DB_STREAM_CHUNK_SIZE: int = decouple.config("DB_STREAM_CHUNK_SIZE", default=1000, cast=int)  # type: ignore
 
+    IS_FEEDBACK_WRITE_BEHIND_ENABLED: bool = decouple.config("IS_FEEDBACK_WRITE_BEHIND_ENABLED", default=False, cast=bool)  # type: ignore
+    FEEDBACK_BUFFER_SIZE: int = decouple.config("FEEDBACK_BUFFER_SIZE", default=10000, cast=int)  # type: ignore
+    FEEDBACK_FLUSH_BATCH_SIZE: int = decouple.config("FEEDBACK_FLUSH_BATCH_SIZE", default=500, cast=int)  # type: ignore
+    FEEDBACK_FLUSH_INTERVAL_MS: int = decouple.config("FEEDBACK_FLUSH_INTERVAL_MS", default=200, cast=int)  # type: ignore
+    FEEDBACK_ENQUEUE_TIMEOUT: float = decouple.config("FEEDBACK_ENQUEUE_TIMEOUT", default=1, cast=float)  # type: ignore
+    ACTIVITY_FLUSH_INTERVAL: float = decouple.config("ACTIVITY_FLUSH_INTERVAL", default=30, cast=float)  # type: ignore
+    ACTIVITY_SESSION_TIMEOUT: float = decouple.config("ACTIVITY_SESSION_TIMEOUT", default=900, cast=float)  # type: ignore
+    AVAILABILITY_FILTER_CAPACITY: int = decouple.config("AVAILABILITY_FILTER_CAPACITY", default=1000000, cast=int)  # type: ignore
+    AVAILABILITY_FILTER_FALSE_POSITIVE_RATE: float = decouple.config("AVAILABILITY_FILTER_FALSE_POSITIVE_RATE", default=0.01, cast=float)  # type: ignore
+    AVAILABILITY_FILTER_REBUILD_STALE_RATIO: float = decouple.config("AVAILABILITY_FILTER_REBUILD_STALE_RATIO", default=0.1, cast=float)  # type: ignore
+    AVAILABILITY_FILTER_REFRESH_INTERVAL: float = decouple.config("AVAILABILITY_FILTER_REFRESH_INTERVAL", default=30, cast=float)  # type: ignore
+    IS_USER_SOFT_DELETE_ENABLED: bool = decouple.config("IS_USER_SOFT_DELETE_ENABLED", default=False, cast=bool)  # type: ignore
+    USER_PURGE_GRACE_PERIOD: float = decouple.config("USER_PURGE_GRACE_PERIOD", default=86400, cast=float)  # type: ignore
+    USER_PURGE_BATCH_SIZE: int = decouple.config("USER_PURGE_BATCH_SIZE", default=500, cast=int)  # type: ignore
+    USER_PURGE_BATCH_INTERVAL: float = decouple.config("USER_PURGE_BATCH_INTERVAL", default=1, cast=float)  # type: ignore
+
+    CACHE_BACKEND: str = decouple.config("CACHE_BACKEND", default="memory", cast=str)  # type: ignore
+    CACHE_TTL: int = decouple.config("CACHE_TTL", default=60, cast=int)  # type: ignore
+    CACHE_MAX_ENTRIES: int = decouple.config("CACHE_MAX_ENTRIES", default=10000, cast=int)  # type: ignore
+    CACHE_REDIS_URL: str = decouple.config("CACHE_REDIS_URL", default="redis://localhost:6379/0", cast=str)  # type: ignore
+
+    IS_SERVER_TIMING_ENABLED: bool = decouple.config("IS_SERVER_TIMING_ENABLED", default=True, cast=bool)  # type: ignore
 
     IS_ALLOWED_CREDENTIALS: bool = decouple.config("IS_ALLOWED_CREDENTIALS", cast=bool)  # type: ignore
     ALLOWED_ORIGINS: list[str] = [
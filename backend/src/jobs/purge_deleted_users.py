@@ -0,0 +1,99 @@
+"""
+Hard-delete soft-deleted users, and their onboarding rows, in small rate-limited batches. Meant to run off-peak, e.g.
+from cron at night:
+
+    python -m src.jobs.purge_deleted_users --batch-size 500 --batch-interval 1 --until 05:00
+
+Only users deleted more than `USER_PURGE_GRACE_PERIOD` seconds ago are purged. Every batch is its own short
+transaction, followed by a pause of `--batch-interval` seconds, so the locks on `user` and `onboarding` are held
+briefly and replicas can keep up. The job stops when nothing is left, after `--max-batches`, or at `--until`.
+"""
+
+import argparse
+import asyncio
+import datetime
+import typing
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.database import SessionLocal
+from src.repository.unit_of_work import UnitOfWork
+
+
+class PurgeSummary:
+    def __init__(self) -> None:
+        self.purged: int = 0
+        self.batches: int = 0
+
+
+async def purge_deleted_users(
+    session_factory: typing.Callable[[], AsyncSession],
+    grace_period: float,
+    batch_size: int = 500,
+    batch_interval: float = 1.0,
+    max_batches: int | None = None,
+    deadline: datetime.datetime | None = None,
+) -> PurgeSummary:
+    summary = PurgeSummary()
+    deleted_before = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(seconds=grace_period)
+
+    while max_batches is None or summary.batches < max_batches:
+        if deadline is not None and datetime.datetime.now(tz=datetime.timezone.utc) >= deadline:
+            loguru.logger.info("Purge --- reached the end of the window, stopping")
+            break
+
+        async with session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            user_ids = await unit_of_work.repository(UserCRUDRepository).purge_deleted_users(
+                deleted_before=deleted_before, limit=batch_size
+            )
+        if not user_ids:
+            break
+
+        summary.purged += len(user_ids)
+        summary.batches += 1
+        loguru.logger.info(f"Purge --- {summary.purged} users purged in {summary.batches} batches")
+        if len(user_ids) < batch_size:
+            break
+        await asyncio.sleep(batch_interval)
+
+    return summary
+
+
+def parse_deadline(until: str | None) -> datetime.datetime | None:
+    """
+    The next local occurrence of `HH:MM`.
+    """
+    if until is None:
+        return None
+    now = datetime.datetime.now().astimezone()
+    deadline = datetime.datetime.combine(now.date(), datetime.time.fromisoformat(until), tzinfo=now.tzinfo)
+    if deadline <= now:
+        deadline += datetime.timedelta(days=1)
+    return deadline
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Hard-delete soft-deleted users in rate-limited batches.")
+    parser.add_argument("--grace-period", type=float, default=settings.USER_PURGE_GRACE_PERIOD, help="Seconds.")
+    parser.add_argument("--batch-size", type=int, default=settings.USER_PURGE_BATCH_SIZE)
+    parser.add_argument("--batch-interval", type=float, default=settings.USER_PURGE_BATCH_INTERVAL, help="Seconds.")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--until", default=None, help="Local `HH:MM` at which to stop, e.g. the end of off-peak.")
+    args = parser.parse_args()
+
+    summary = await purge_deleted_users(
+        session_factory=SessionLocal,
+        grace_period=args.grace_period,
+        batch_size=args.batch_size,
+        batch_interval=args.batch_interval,
+        max_batches=args.max_batches,
+        deadline=parse_deadline(until=args.until),
+    )
+    loguru.logger.info(f"Purge --- done, {summary.purged} users purged in {summary.batches} batches.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
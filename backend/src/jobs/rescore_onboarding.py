@@ -0,0 +1,156 @@
+"""
+Re-score every stored onboarding questionnaire with the current `ANSWER_TYPE_WEIGHTS`.
+
+    python -m src.jobs.rescore_onboarding --chunk-size 5000 --workers 8 --checkpoint rescore.json
+    python -m src.jobs.rescore_onboarding --dry-run
+
+Rows are read in keyset chunks on `onboarding.id`, scored by the batch engine (in a process pool with
+`--workers`), and only the rows whose result changed are written back. The last committed `id` is stored in the
+checkpoint file so an interrupted run resumes where it stopped.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import pathlib
+import typing
+
+import loguru
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.database import SessionLocal
+from src.repository.unit_of_work import UnitOfWork
+from src.utilities.onboarding.batch_scoring import score_submissions
+from src.utilities.onboarding.detailed_qa import load_detailed_qa
+
+
+class RescoreSummary:
+    def __init__(self) -> None:
+        self.scanned: int = 0
+        self.changed: int = 0
+        self.last_id: int = 0
+        self.diffs: list[str] = []
+
+
+def score_detailed_qa(detailed_qa_values: list[typing.Any]) -> tuple[list[str], list[dict[str, float]]]:
+    # Module-level so it can be pickled into the process pool
+    scores = score_submissions([load_detailed_qa(detailed_qa) for detailed_qa in detailed_qa_values])
+    return scores.primary_personalities, scores.specific_personalities
+
+
+def read_checkpoint(checkpoint_path: pathlib.Path | None) -> int:
+    if checkpoint_path is None or not checkpoint_path.exists():
+        return 0
+    return int(json.loads(checkpoint_path.read_text())["last_id"])
+
+
+def write_checkpoint(checkpoint_path: pathlib.Path | None, last_id: int) -> None:
+    if checkpoint_path is None:
+        return
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"last_id": last_id}))
+    os.replace(tmp_path, checkpoint_path)
+
+
+async def rescore_onboarding(
+    session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    chunk_size: int = 1000,
+    workers: int = 0,
+    checkpoint_path: pathlib.Path | None = None,
+    dry_run: bool = False,
+) -> RescoreSummary:
+    """
+    Run the job. `workers=0` scores in-process; otherwise up to `workers` chunks are scored in parallel processes
+    while results are written back in `id` order.
+    """
+    summary = RescoreSummary()
+    summary.last_id = read_checkpoint(checkpoint_path=checkpoint_path)
+    loop = asyncio.get_running_loop()
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+
+    try:
+        while True:
+            chunks = []
+            after_id = summary.last_id
+            for _ in range(max(workers, 1)):
+                async with session_factory() as session:
+                    rows = await OnboardingCRUDRepository(async_session=session).read_detailed_qa_chunk(
+                        after_id=after_id, limit=chunk_size
+                    )
+                if not rows:
+                    break
+                chunks.append(rows)
+                after_id = rows[-1].id
+            if not chunks:
+                break
+
+            detailed_qa_chunks = [[row.detailed_qa for row in rows] for rows in chunks]
+            if pool is None:
+                scored_chunks = [score_detailed_qa(detailed_qa_values) for detailed_qa_values in detailed_qa_chunks]
+            else:
+                scored_chunks = await asyncio.gather(
+                    *(loop.run_in_executor(pool, score_detailed_qa, values) for values in detailed_qa_chunks)
+                )
+
+            for rows, (primaries, specifics) in zip(chunks, scored_chunks):
+                changed = [
+                    (row.id, primary, specific)
+                    for row, primary, specific in zip(rows, primaries, specifics)
+                    if (row.primary_personality, row.specific_personality) != (primary, specific)
+                ]
+                summary.scanned += len(rows)
+                summary.changed += len(changed)
+
+                if dry_run:
+                    previous = {row.id: row for row in rows}
+                    for onboarding_id, primary, specific in changed:
+                        summary.diffs.append(
+                            f"onboarding {onboarding_id}: {previous[onboarding_id].primary_personality} -> {primary}, "
+                            f"{previous[onboarding_id].specific_personality} -> {specific}"
+                        )
+                else:
+                    async with session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+                        await unit_of_work.repository(OnboardingCRUDRepository).update_personalities(
+                            personalities=changed
+                        )
+                    write_checkpoint(checkpoint_path=checkpoint_path, last_id=rows[-1].id)
+
+                summary.last_id = rows[-1].id
+                loguru.logger.info(
+                    f"Rescore --- {summary.scanned} scanned, {summary.changed} changed, up to id {summary.last_id}"
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return summary
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score stored onboarding answers.")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="0 scores in-process.")
+    parser.add_argument("--checkpoint", type=pathlib.Path, default=None, help="JSON file holding the last `id`.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the changes instead of writing them.")
+    args = parser.parse_args()
+
+    summary = await rescore_onboarding(
+        session_factory=SessionLocal,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        dry_run=args.dry_run,
+    )
+    for diff in summary.diffs:
+        print(diff)
+    loguru.logger.info(f"Rescore --- done, {summary.changed} of {summary.scanned} rows changed.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
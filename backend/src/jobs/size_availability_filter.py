@@ -0,0 +1,78 @@
+"""
+Build the username / email availability filter from the current `user` table and report its size and measured false
+positive rate, to pick `AVAILABILITY_FILTER_CAPACITY` and `AVAILABILITY_FILTER_FALSE_POSITIVE_RATE`.
+
+    python -m src.jobs.size_availability_filter --false-positive-rate 0.001 --probes 100000
+
+The filters live in each worker's memory, so this does not touch running workers; they build on startup, pick up new
+users every `AVAILABILITY_FILTER_REFRESH_INTERVAL` seconds and rebuild with `POST /api/users/availability/rebuild`.
+"""
+
+import argparse
+import asyncio
+import secrets
+import typing
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.availability import AvailabilityIndex
+from src.repository.database import SessionLocal
+
+
+class FilterSizing:
+    def __init__(self, description: dict[str, typing.Any], probes: int, false_positives: int) -> None:
+        self.entries: int = description["entries"]
+        self.size_bytes: int = description["size_bytes"]
+        self.estimated_false_positive_rate: float = description["estimated_false_positive_rate"]
+        self.probes = probes
+        self.measured_false_positive_rate = false_positives / probes if probes else 0.0
+
+
+async def size_availability_filter(
+    session_factory: typing.Callable[[], AsyncSession],
+    capacity: int,
+    false_positive_rate: float,
+    probes: int = 10000,
+) -> FilterSizing:
+    """
+    Build the filters and probe the username one with random names, which are all unregistered, so every hit is a
+    false positive.
+    """
+    availability_index = AvailabilityIndex(
+        session_factory=session_factory,
+        capacity=capacity,
+        false_positive_rate=false_positive_rate,
+        rebuild_stale_ratio=settings.AVAILABILITY_FILTER_REBUILD_STALE_RATIO,
+        refresh_interval=settings.AVAILABILITY_FILTER_REFRESH_INTERVAL,
+    )
+    await availability_index.rebuild()
+    false_positives = sum(
+        f"probe-{secrets.token_hex(8)}" in availability_index.usernames for _ in range(probes)  # type: ignore
+    )
+    return FilterSizing(description=availability_index.describe(), probes=probes, false_positives=false_positives)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Size the username / email availability filter.")
+    parser.add_argument("--capacity", type=int, default=settings.AVAILABILITY_FILTER_CAPACITY)
+    parser.add_argument("--false-positive-rate", type=float, default=settings.AVAILABILITY_FILTER_FALSE_POSITIVE_RATE)
+    parser.add_argument("--probes", type=int, default=10000, help="Random names checked against the filter.")
+    args = parser.parse_args()
+
+    sizing = await size_availability_filter(
+        session_factory=SessionLocal,
+        capacity=args.capacity,
+        false_positive_rate=args.false_positive_rate,
+        probes=args.probes,
+    )
+    loguru.logger.info(
+        f"Availability filter --- {sizing.entries} entries in {sizing.size_bytes / 1024:.0f} KiB, false positives"
+        f" {sizing.estimated_false_positive_rate:.3%} estimated, {sizing.measured_false_positive_rate:.3%} measured"
+        f" over {sizing.probes} probes"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,11 +3,18 @@ import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.endpoints import router as api_endpoint_router
+from src.api.middleware.timing import TimingMiddleware
+from src.api.responses import FastJSONResponse
+from src.config.events import lifespan
 from src.config.manager import settings
 
 
 def initialize_backend_application() -> fastapi.FastAPI:
-    app = fastapi.FastAPI(**settings.set_backend_app_attributes)  # type: ignore
+    app = fastapi.FastAPI(
+        **settings.set_backend_app_attributes,  # type: ignore
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -17,6 +24,13 @@ def initialize_backend_application() -> fastapi.FastAPI:
         allow_headers=settings.ALLOWED_HEADERS,
     )
 
+    # Added last so it is the outermost middleware and its timings cover everything else
+    app.add_middleware(
+        TimingMiddleware,
+        is_server_timing_enabled=settings.IS_SERVER_TIMING_ENABLED,
+        is_query_log_enabled=settings.IS_DB_QUERY_DETECTOR_ENABLED,
+    )
+
     app.include_router(router=api_endpoint_router, prefix=settings.API_PREFIX)
 
     return app
@@ -8,6 +8,10 @@ from src.repository.table import Base
 from src.models.db.onboarding import Onboarding
 
 
+# Predicate of the partial indexes, matching the `User.deleted_at.is_(None)` filter of every read
+IS_NOT_DELETED = sqlalchemy.text("deleted_at IS NULL")
+
+
 class User(Base):  # type: ignore
     __tablename__ = "user"
 
@@ -27,7 +31,9 @@ class User(Base):  # type: ignore
     is_onboarding: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=True)
     is_active: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
     is_logged_in: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
-    last_login: SQLAlchemyMapped[datetime.date] = sqlalchemy_mapped_column(sqlalchemy.DateTime(timezone=True), nullable=True)
+    last_login: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
+    )
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
     )
@@ -36,8 +42,31 @@ class User(Base):  # type: ignore
         nullable=True,
         server_onupdate=sqlalchemy.schema.FetchedValue(for_update=True),
     )
+    # Set by a soft delete; the row is hidden from reads until the purge job removes it
+    deleted_at: SQLAlchemyMapped[datetime.datetime | None] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
+    )
     
     # One-to-One relationship with Onboarding
     onboarding = relationship("Onboarding", back_populates="user")
 
-    __mapper_args__ = {"eager_defaults": True}
\ No newline at end of file
+    # Keyset pagination walks `(created_at, id)`, optionally narrowed by one equality filter first. Listings never
+    # show soft-deleted users, so those indexes leave them out; the purge job finds them through `ix_user_deleted_at`.
+    __table_args__ = (
+        sqlalchemy.Index("ix_user_created_at_id", "created_at", "id", postgresql_where=IS_NOT_DELETED),
+        sqlalchemy.Index(
+            "ix_user_is_active_created_at_id", "is_active", "created_at", "id", postgresql_where=IS_NOT_DELETED
+        ),
+        sqlalchemy.Index(
+            "ix_user_is_onboarding_created_at_id", "is_onboarding", "created_at", "id", postgresql_where=IS_NOT_DELETED
+        ),
+        sqlalchemy.Index("ix_user_roles_created_at_id", "roles", "created_at", "id", postgresql_where=IS_NOT_DELETED),
+        sqlalchemy.Index("ix_user_last_login", "last_login", postgresql_where=IS_NOT_DELETED),
+        sqlalchemy.Index(
+            "ix_user_deleted_at", "deleted_at", postgresql_where=sqlalchemy.text("deleted_at IS NOT NULL")
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+# Users created or changed since a point in time, for incremental scans; `updated_at` is NULL until the first update
+sqlalchemy.Index("ix_user_changed_at", sqlalchemy.func.coalesce(User.updated_at, User.created_at))
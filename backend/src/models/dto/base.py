@@ -0,0 +1,26 @@
+import typing
+
+
+class BaseRowDTO:
+    """
+    Plain `__slots__` record filled positionally from a Core `Row` whose columns were selected in `__slots__` order.
+
+    No `__dict__`, no identity map, no instrumentation: a read-only request allocates one small object per row.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    def __init__(self, *values: typing.Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_row(cls, row: typing.Sequence[typing.Any]) -> typing.Self:
+        return cls(*row)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
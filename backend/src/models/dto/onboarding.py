@@ -0,0 +1,24 @@
+import datetime
+import typing
+
+from src.models.dto.base import BaseRowDTO
+
+
+class OnboardingRow(BaseRowDTO):
+    __slots__ = (
+        "user_id",
+        "primary_personality",
+        "specific_personality",
+        "detailed_qa",
+        "feedback",
+        "created_at",
+        "updated_at",
+    )
+
+    user_id: int
+    primary_personality: str | None
+    specific_personality: dict[str, float] | None
+    detailed_qa: list[dict[str, typing.Any]] | None
+    feedback: str | None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
@@ -0,0 +1,34 @@
+import datetime
+
+from src.models.dto.base import BaseRowDTO
+
+
+class UserRow(BaseRowDTO):
+    # Same fields, same order as `UserInResponse`, so `to_dict()` is the response body
+    __slots__ = (
+        "id",
+        "email",
+        "username",
+        "first_name",
+        "last_name",
+        "auth_id",
+        "is_onboarding",
+        "is_active",
+        "is_logged_in",
+        "last_login",
+        "created_at",
+        "updated_at",
+    )
+
+    id: int
+    email: str
+    username: str
+    first_name: str | None
+    last_name: str | None
+    auth_id: str | None
+    is_onboarding: bool
+    is_active: bool
+    is_logged_in: bool
+    last_login: datetime.datetime | None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
@@ -0,0 +1,6 @@
+import enum
+
+
+class ExportFormat(str, enum.Enum):
+    NDJSON: str = "ndjson"  # type: ignore
+    CSV: str = "csv"  # type: ignore
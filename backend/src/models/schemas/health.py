@@ -0,0 +1,52 @@
+from typing import Optional
+
+from src.models.schemas.base import BaseSchemaModel
+
+
+class CacheStatsInResponse(BaseSchemaModel):
+    backend: str
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_ratio: float
+    size: Optional[int]
+
+
+class HistogramInResponse(BaseSchemaModel):
+    count: int
+    sum: float
+    p50: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+    buckets: dict[str, int]
+
+
+class PoolStatsInResponse(BaseSchemaModel):
+    pool_class: str
+    size: int
+    max_overflow: int
+    timeout: float
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    connects: int
+    timeouts: int
+    invalidations: int
+    wait_time: HistogramInResponse
+    connect_latency: HistogramInResponse
+
+
+class StatementStatsInResponse(BaseSchemaModel):
+    name: str
+    executions: int
+    compiled_cache_hits: int
+    compiled_cache_hit_ratio: float
+    prepared_cache_hits: int
+    prepared_cache_hit_ratio: float
+
+
+class StatementCacheStatsInResponse(BaseSchemaModel):
+    prepared_statement_cache_size: int
+    statements: list[StatementStatsInResponse]
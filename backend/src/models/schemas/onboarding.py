@@ -1,3 +1,4 @@
+import enum
 from typing import List, Dict, Optional, Union
 
 from src.models.schemas.base import BaseSchemaModel
@@ -11,7 +12,7 @@ class OnboardingRequest(BaseSchemaModel):
     items: List[AnswerItem]
     userId: int
     primaryPersonality: Optional[str] = None
-    specificPersonality: Optional[Dict[str, str]] = None
+    specificPersonality: Optional[Dict[str, float]] = None
     
 class OnboardingFeedback(BaseSchemaModel):
     feedback: Optional[str] = None
@@ -19,4 +20,16 @@ class OnboardingFeedback(BaseSchemaModel):
 
 class OnboardingResponse(BaseSchemaModel):
     primaryPersonality: Optional[str]
-    specificPersonality: Optional[Dict[str, float]]
\ No newline at end of file
+    specificPersonality: Optional[Dict[str, float]]
+
+class OnboardingBatchStatus(str, enum.Enum):
+    SAVED: str = "saved"  # type: ignore
+    SUPERSEDED: str = "superseded"  # type: ignore
+    USER_NOT_FOUND: str = "user_not_found"  # type: ignore
+    INVALID_ANSWERS: str = "invalid_answers"  # type: ignore
+
+class OnboardingBatchItemResponse(BaseSchemaModel):
+    userId: int
+    status: OnboardingBatchStatus
+    primaryPersonality: Optional[str] = None
+    specificPersonality: Optional[Dict[str, float]] = None
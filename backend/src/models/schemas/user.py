@@ -1,4 +1,5 @@
 import datetime
+import enum
 from typing import Optional
 
 import pydantic
@@ -43,5 +44,53 @@ class UserInResponse(BaseSchemaModel):
     created_at: datetime.datetime
     updated_at: Optional[datetime.datetime]
 
+class OnboardingInProfileResponse(BaseSchemaModel):
+    primary_personality: Optional[str]
+    specific_personality: Optional[dict[str, float]]
+    feedback: Optional[str]
+
+class UserProfileInResponse(UserInResponse):
+    onboarding: Optional[OnboardingInProfileResponse]
+
+class UserInPageResponse(BaseSchemaModel):
+    items: list[UserInResponse]
+    next_cursor: Optional[str]
+
 class UserOnboardingUpdate(BaseSchemaModel):
-    onboarding: bool
\ No newline at end of file
+    onboarding: bool
+
+class UserAvailabilityInResponse(BaseSchemaModel):
+    username: Optional[str] = None
+    is_username_available: Optional[bool] = None
+    email: Optional[str] = None
+    is_email_available: Optional[bool] = None
+
+class UserAvailabilityFilterInResponse(BaseSchemaModel):
+    is_ready: bool
+    entries: int
+    stale: int
+    needs_rebuild: bool
+    size_bytes: int
+    estimated_false_positive_rate: Optional[float] = None
+
+class UserBulkCreateStatus(str, enum.Enum):
+    CREATED: str = "created"  # type: ignore
+    EMAIL_TAKEN: str = "email_taken"  # type: ignore
+    USERNAME_TAKEN: str = "username_taken"  # type: ignore
+    DUPLICATE_EMAIL: str = "duplicate_email"  # type: ignore
+    DUPLICATE_USERNAME: str = "duplicate_username"  # type: ignore
+    CONFLICT: str = "conflict"  # type: ignore
+
+
+class UserInBulkCreateResult(BaseSchemaModel):
+    index: int
+    email: str
+    username: str
+    status: UserBulkCreateStatus
+    id: Optional[int] = None
+
+
+class UserInBulkCreateResponse(BaseSchemaModel):
+    created: int
+    rejected: int
+    results: list[UserInBulkCreateResult]
@@ -0,0 +1,141 @@
+import asyncio
+import datetime
+import time
+import typing
+from functools import lru_cache
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.cache.manager import get_cache
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.database import SessionLocal
+from src.repository.unit_of_work import UnitOfWork
+
+
+class ActivityTracker:
+    """
+    Presence of logged-in users, kept in memory and written to `user.is_logged_in` / `user.last_login` in one bulk
+    statement every `flush_interval` seconds.
+
+    Logins and heartbeats only overwrite the user's entry in `_pending`, so a user sending many heartbeats in one
+    interval still costs a single row in the next flush. Sessions without activity for `session_timeout` seconds are
+    logged out by the same statement.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], AsyncSession],
+        flush_interval: float,
+        session_timeout: float,
+        cache: BaseCacheBackend | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.session_timeout = session_timeout
+        self.cache = cache
+        # Monotonic time of the last activity of every session this process knows about
+        self._sessions: dict[int, float] = {}
+        self._pending: dict[int, datetime.datetime] = {}
+        self._logged_out: set[int] = set()
+        self._task: asyncio.Task | None = None
+        self._flushing: asyncio.Future | None = None
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._sessions)
+
+    def record_activity(self, user_id: int) -> None:
+        """
+        A login or heartbeat: (re)open the user's session and queue its `last_login` for the next flush.
+        """
+        self._sessions[user_id] = time.monotonic()
+        self._pending[user_id] = datetime.datetime.now(tz=datetime.timezone.utc)
+        self._logged_out.discard(user_id)
+
+    def record_logout(self, user_id: int) -> None:
+        self._sessions.pop(user_id, None)
+        self._pending.pop(user_id, None)
+        self._logged_out.add(user_id)
+
+    def _pop_expired(self) -> set[int]:
+        cutoff = time.monotonic() - self.session_timeout
+        expired = {user_id for user_id, seen_at in self._sessions.items() if seen_at < cutoff}
+        for user_id in expired:
+            del self._sessions[user_id]
+        return expired
+
+    async def flush(self) -> None:
+        # Swapped out before the first await, so activity arriving during the flush goes into the next one
+        pending, self._pending = self._pending, {}
+        logged_out, self._logged_out = self._logged_out, set()
+        expired = self._pop_expired()
+        if not pending and not logged_out and not expired:
+            return
+
+        try:
+            async with (
+                self.session_factory() as session,
+                UnitOfWork(async_session=session, cache=self.cache) as unit_of_work,
+            ):
+                await unit_of_work.repository(UserCRUDRepository).save_activity_batch(
+                    last_seen=pending, logged_out=logged_out, expired=expired, session_timeout=self.session_timeout
+                )
+        except Exception as e:
+            dropped = len(pending) + len(logged_out) + len(expired)
+            loguru.logger.error(f"Activity flush --- dropped {dropped} updates --- {e}")
+
+    async def start(self) -> None:
+        """
+        Log out the sessions nobody has kept alive (e.g. tracked by a worker that has since stopped), then flush
+        periodically in the background.
+        """
+        try:
+            async with (
+                self.session_factory() as session,
+                UnitOfWork(async_session=session, cache=self.cache) as unit_of_work,
+            ):
+                await unit_of_work.repository(UserCRUDRepository).expire_stale_sessions(
+                    session_timeout=self.session_timeout
+                )
+        except Exception as e:
+            loguru.logger.warning(f"Activity --- could not expire stale sessions --- {e}")
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="activity-flush")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            # Shielded, so a shutdown mid-flush lets the statement finish; `close()` waits for it
+            self._flushing = asyncio.ensure_future(self.flush())
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+
+    async def close(self) -> None:
+        """
+        Stop the background task and write the pending activity. Open sessions stay logged in; with several workers
+        another one may still be serving them, and `start()` expires the ones nobody does.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        await self.flush()
+
+
+@lru_cache()
+def get_activity_tracker() -> ActivityTracker:
+    return ActivityTracker(
+        session_factory=SessionLocal,
+        flush_interval=settings.ACTIVITY_FLUSH_INTERVAL,
+        session_timeout=settings.ACTIVITY_SESSION_TIMEOUT,
+        cache=get_cache(),
+    )
@@ -0,0 +1,240 @@
+import asyncio
+import datetime
+import typing
+from functools import lru_cache
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.database import SessionLocal
+from src.repository.unit_of_work import UnitOfWork
+from src.utilities.lookup.bloom_filter import BloomFilter
+
+
+class AvailabilityStats:
+    def __init__(self) -> None:
+        self.checks: int = 0
+        self.filtered: int = 0
+        self.database_checks: int = 0
+        self.false_positives: int = 0
+        self.rebuilds: int = 0
+
+
+# Re-scanned by every refresh, for rows whose transaction started before the previous scan but committed after it,
+# and for rows a rebuild's replica had not replayed yet
+REFRESH_OVERLAP = datetime.timedelta(seconds=60)
+
+
+def add_once(bloom_filter: BloomFilter, value: str) -> None:
+    """
+    Refreshes see the same rows again, and re-adding would inflate `count`, the false positive estimate and the
+    stale ratio with uptime. A value whose bits are all set already is skipped, a false positive included.
+    """
+    if value not in bloom_filter:
+        bloom_filter.add(value)
+
+
+class AvailabilityIndex:
+    """
+    Per-worker Bloom filters of the taken usernames and emails, so an availability check only queries the database on
+    a probable hit, and a miss is answered as available without a query.
+
+    The routes of this worker `add()` the values they write right away. Values written through other workers or by
+    jobs reach the filters with the next `refresh()`, every `refresh_interval` seconds: until then such a value can
+    be reported available, and creating it still fails on the unique constraint. A filter cannot forget, so values
+    freed by a rename or a delete stay "probably taken" and only cost a lookup; they are counted in `stale`, and
+    `needs_rebuild` tells when a full scan is worth it. Until the first `rebuild()` has finished every check goes to
+    the database.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], AsyncSession],
+        capacity: int,
+        false_positive_rate: float,
+        rebuild_stale_ratio: float,
+        refresh_interval: float,
+    ) -> None:
+        self.session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.rebuild_stale_ratio = rebuild_stale_ratio
+        self.stats = AvailabilityStats()
+        self.stale: int = 0
+        self.usernames: BloomFilter | None = None
+        self.emails: BloomFilter | None = None
+        # Values written while a rebuild scans, replayed into the new filters since the scan may have missed them
+        self._added_during_rebuild: list[tuple[str | None, str | None]] | None = None
+        self._rebuilding = asyncio.Lock()
+        # Database time of the last scan, where the next `refresh()` picks up
+        self._scanned_at: datetime.datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.usernames is not None and self.emails is not None
+
+    @property
+    def is_rebuilding(self) -> bool:
+        return self._rebuilding.locked()
+
+    @property
+    def entries(self) -> int:
+        if self.usernames is None or self.emails is None:
+            return 0
+        return self.usernames.count + self.emails.count
+
+    @property
+    def needs_rebuild(self) -> bool:
+        return not self.is_ready or self.stale > self.entries * self.rebuild_stale_ratio
+
+    def add(self, username: str | None = None, email: str | None = None) -> None:
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.append((username, email))
+        if username is not None and self.usernames is not None:
+            add_once(self.usernames, username)
+        if email is not None and self.emails is not None:
+            add_once(self.emails, email)
+
+    def mark_stale(self, count: int = 1) -> None:
+        self.stale += count
+
+    def describe(self) -> dict[str, typing.Any]:
+        if self.usernames is None or self.emails is None:
+            return {"is_ready": False, "entries": 0, "stale": self.stale, "needs_rebuild": True, "size_bytes": 0}
+        return {
+            "is_ready": True,
+            "entries": self.entries,
+            "stale": self.stale,
+            "needs_rebuild": self.needs_rebuild,
+            "size_bytes": self.usernames.size_bytes + self.emails.size_bytes,
+            "estimated_false_positive_rate": max(
+                self.usernames.estimated_false_positive_rate(), self.emails.estimated_false_positive_rate()
+            ),
+        }
+
+    async def _is_available(
+        self,
+        value: str,
+        bloom_filter: BloomFilter | None,
+        is_registered: typing.Callable[[str], typing.Awaitable[bool]],
+    ) -> bool:
+        self.stats.checks += 1
+        if bloom_filter is not None and value not in bloom_filter:
+            self.stats.filtered += 1
+            return True
+
+        self.stats.database_checks += 1
+        registered = await is_registered(value)
+        if not registered and bloom_filter is not None:
+            self.stats.false_positives += 1
+        return not registered
+
+    async def is_username_available(self, username: str, user_repo: UserCRUDRepository) -> bool:
+        return await self._is_available(
+            value=username, bloom_filter=self.usernames, is_registered=user_repo.is_username_registered
+        )
+
+    async def is_email_available(self, email: str, user_repo: UserCRUDRepository) -> bool:
+        return await self._is_available(
+            value=email, bloom_filter=self.emails, is_registered=user_repo.is_email_registered
+        )
+
+    async def rebuild(self) -> None:
+        """
+        Build fresh filters from a streaming scan of `user` and swap them in; checks keep using the old ones meanwhile.
+        The filters are sized for twice the current user count (at least `capacity`), so the false positive rate
+        stays near the configured one while the table grows.
+        """
+        async with self._rebuilding:
+            self._added_during_rebuild = []
+            try:
+                async with self.session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+                    user_repo = unit_of_work.repository(UserCRUDRepository)
+                    scanned_at = await user_repo.read_database_time(use_replica=False)
+                    capacity = max(self.capacity, 2 * await user_repo.count_users())
+                    usernames = BloomFilter(capacity=capacity, false_positive_rate=self.false_positive_rate)
+                    emails = BloomFilter(capacity=capacity, false_positive_rate=self.false_positive_rate)
+                    async for partition in user_repo.stream_usernames_and_emails():
+                        for username, email in partition:
+                            usernames.add(username)
+                            emails.add(email)
+                for username, email in self._added_during_rebuild:
+                    if username is not None:
+                        add_once(usernames, username)
+                    if email is not None:
+                        add_once(emails, email)
+            finally:
+                self._added_during_rebuild = None
+
+            self.usernames, self.emails, self.stale = usernames, emails, 0
+            self._scanned_at = scanned_at
+            self.stats.rebuilds += 1
+        description = self.describe()
+        loguru.logger.info(
+            f"Availability filter --- {usernames.count} users, {description['size_bytes'] // 1024} KiB,"
+            f" ~{description['estimated_false_positive_rate']:.3%} false positives"
+        )
+
+    async def refresh(self) -> int:
+        """
+        Add the users created or updated since the last scan, e.g. through another worker, and return how many.
+        Does a full `rebuild()` instead when the filters are not built yet or have gone stale.
+        """
+        if self.is_rebuilding:
+            return 0
+        if self.needs_rebuild or self._scanned_at is None:
+            await self.rebuild()
+            return 0
+
+        added = 0
+        async with self.session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            user_repo = unit_of_work.repository(UserCRUDRepository)
+            # On the primary, so the watermark and the rows come from the same server
+            scanned_at = await user_repo.read_database_time(use_replica=False)
+            async for partition in user_repo.stream_usernames_and_emails(
+                changed_since=self._scanned_at - REFRESH_OVERLAP, use_replica=False
+            ):
+                for username, email in partition:
+                    self.add(username=username, email=email)
+                added += len(partition)
+        self._scanned_at = scanned_at
+        return added
+
+    def start(self) -> None:
+        """
+        Build the filters in the background, then keep them current with a `refresh()` every `refresh_interval`.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="availability-filter")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                loguru.logger.error(f"Availability filter --- refresh failed --- {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+@lru_cache()
+def get_availability_index() -> AvailabilityIndex:
+    return AvailabilityIndex(
+        session_factory=SessionLocal,
+        capacity=settings.AVAILABILITY_FILTER_CAPACITY,
+        false_positive_rate=settings.AVAILABILITY_FILTER_FALSE_POSITIVE_RATE,
+        rebuild_stale_ratio=settings.AVAILABILITY_FILTER_REBUILD_STALE_RATIO,
+        refresh_interval=settings.AVAILABILITY_FILTER_REFRESH_INTERVAL,
+    )
@@ -0,0 +1,49 @@
+import abc
+
+
+def build_user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BaseCacheBackend(abc.ABC):
+    """
+    Async key/value cache holding serialized payloads (JSON strings) under a per-entry TTL in seconds.
+    """
+
+    name: str = "base"
+
+    def __init__(self, default_ttl: float):
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> str | None: ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    async def delete_many(self, keys: list[str]) -> None:
+        for key in keys:
+            await self.delete(key)
+
+    async def size(self) -> int | None:
+        return None
+
+    async def close(self) -> None:
+        return None
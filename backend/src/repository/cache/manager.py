@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from src.config.manager import settings
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.cache.redis import RedisCacheBackend
+
+
+@lru_cache()
+def get_cache() -> BaseCacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(url=settings.CACHE_REDIS_URL, default_ttl=settings.CACHE_TTL)
+    return InMemoryCacheBackend(default_ttl=settings.CACHE_TTL, max_entries=settings.CACHE_MAX_ENTRIES)
@@ -0,0 +1,49 @@
+import collections
+import time
+
+from src.repository.cache.base import BaseCacheBackend
+
+
+class InMemoryCacheBackend(BaseCacheBackend):
+    """
+    Per-worker TTL + LRU cache. Entries are invalidated only in the worker that served the write, other workers
+    keep serving their copy until it expires, so keep the TTL short when running several `SERVER_WORKERS`.
+    """
+
+    name: str = "memory"
+
+    def __init__(self, default_ttl: float, max_entries: int):
+        super().__init__(default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[str, tuple[float, str]] = collections.OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def size(self) -> int | None:
+        return len(self._entries)
@@ -0,0 +1,153 @@
+import asyncio
+import typing
+import urllib.parse
+
+import loguru
+
+from src.repository.cache.base import BaseCacheBackend
+
+
+class RedisProtocolError(Exception):
+    """
+    Throw an exception when the server answers a command with a RESP error reply.
+    """
+
+
+def encode_command(*args: str | int) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = str(arg).encode()
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> typing.Any:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by the Redis server.")
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        raise RedisProtocolError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2].decode()
+    if prefix == b"*":
+        length = int(payload)
+        if length == -1:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RedisProtocolError(f"Unexpected reply prefix {prefix!r}.")
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Cache backend speaking plain RESP over one connection, one command at a time, so any Redis-compatible server
+    works (Redis, Valkey, KeyDB, or a local fake in tests) without a client library.
+
+    Evictions happen server-side and are not visible to the client, read them from `INFO stats` instead.
+    Connection failures are logged and degrade to cache misses rather than failing the request.
+    """
+
+    name: str = "redis"
+
+    def __init__(self, url: str, default_ttl: float):
+        super().__init__(default_ttl=default_ttl)
+        parsed_url = urllib.parse.urlsplit(url)
+        self.host = parsed_url.hostname or "localhost"
+        self.port = parsed_url.port or 6379
+        self.password = parsed_url.password
+        self.db = int(parsed_url.path.lstrip("/") or 0)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(host=self.host, port=self.port)
+        try:
+            if self.password:
+                await self._send("AUTH", self.password)
+            if self.db:
+                await self._send("SELECT", self.db)
+        except BaseException:
+            # A socket that failed AUTH or SELECT would run the next commands unauthenticated or on the wrong db
+            await self._reset()
+            raise
+
+    async def _send(self, *args: str | int) -> typing.Any:
+        assert self._reader is not None and self._writer is not None
+        self._writer.write(encode_command(*args))
+        await self._writer.drain()
+        return await read_reply(self._reader)
+
+    async def execute(self, *args: str | int) -> typing.Any:
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await self._connect()
+                return await self._send(*args)
+            except RedisProtocolError:
+                # An error reply was read in full, the connection is still in step
+                raise
+            except BaseException:
+                # Also on cancellation: a reply left unread in the stream would be taken as the next command's reply
+                await self._reset()
+                raise
+
+    async def _reset(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader, self._writer = None, None
+
+    async def get(self, key: str) -> str | None:
+        try:
+            value = await self.execute("GET", key)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, RedisProtocolError) as e:
+            loguru.logger.warning(f"Cache GET `{key}` failed --- {e}")
+            value = None
+
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        ttl_ms = int((self.default_ttl if ttl is None else ttl) * 1000)
+        try:
+            await self.execute("SET", key, value, "PX", max(ttl_ms, 1))
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, RedisProtocolError) as e:
+            loguru.logger.warning(f"Cache SET `{key}` failed --- {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.execute("DEL", key)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, RedisProtocolError) as e:
+            loguru.logger.error(f"Cache DEL `{key}` failed, the entry stays until its TTL runs out --- {e}")
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        try:
+            await self.execute("DEL", *keys)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, RedisProtocolError) as e:
+            loguru.logger.error(
+                f"Cache DEL of {len(keys)} keys failed, the entries stay until their TTL runs out --- {e}"
+            )
+
+    async def size(self) -> int | None:
+        try:
+            return await self.execute("DBSIZE")
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, RedisProtocolError):
+            return None
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._reset()
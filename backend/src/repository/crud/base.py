@@ -1,6 +1,65 @@
+import typing
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
 
+from src.config.manager import settings
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.routing import PENDING_WRITES_KEY, ReadYourWritesTracker, REPLICA_BIND_ARGUMENT
+
+
+def get_violated_constraint_name(error: IntegrityError) -> str | None:
+    """
+    Dig the name of the violated constraint out of the DBAPI error wrapped by `IntegrityError`.
+
+    asyncpg exposes it on the original driver exception (chained as `__cause__` by SQLAlchemy's adapter),
+    psycopg2 exposes it through `diag`.
+    """
+    for db_error in (error.orig, getattr(error.orig, "__cause__", None)):
+        constraint_name = getattr(db_error, "constraint_name", None) or getattr(
+            getattr(db_error, "diag", None), "constraint_name", None
+        )
+        if constraint_name:
+            return constraint_name
+    return None
+
+
+read_your_writes = ReadYourWritesTracker(window=settings.DB_READ_YOUR_WRITES_WINDOW)
+
+# `Session.info` key collecting the cache keys to drop once the unit of work commits
+PENDING_INVALIDATIONS_KEY = "pending_cache_invalidations"
+
+
+def pop_pending_invalidations(async_session: SQLAlchemyAsyncSession) -> set[str]:
+    return async_session.info.pop(PENDING_INVALIDATIONS_KEY, set())
+
 
 class BaseCRUDRepository:
-    def __init__(self, async_session: SQLAlchemyAsyncSession):
+    def __init__(self, async_session: SQLAlchemyAsyncSession, cache: BaseCacheBackend | None = None):
         self.async_session = async_session
+        self.cache = cache
+
+    def invalidate_cached(self, key: str) -> None:
+        self.invalidate_cached_many(keys=[key])
+
+    def invalidate_cached_many(self, keys: typing.Iterable[str]) -> None:
+        """
+        Mark cache entries stale. They are dropped by `UnitOfWork.commit`, so no reader can re-cache the old row
+        between the write and the commit.
+        """
+        self.async_session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).update(keys)
+
+    def read_bind_arguments(self, user_id: int | None = None) -> dict[str, typing.Any]:
+        """
+        `bind_arguments` sending a read-only statement to a replica, unless it reads a user written within the
+        read-your-writes window.
+        """
+        if user_id is not None and read_your_writes.is_recent(user_id):
+            return {}
+        return {REPLICA_BIND_ARGUMENT: True}
+
+    def mark_written(self, user_ids: typing.Iterable[int]) -> None:
+        """
+        Keep reads of these users on the primary for `DB_READ_YOUR_WRITES_WINDOW` seconds once the unit of work commits.
+        """
+        self.async_session.info.setdefault(PENDING_WRITES_KEY, set()).update(user_ids)
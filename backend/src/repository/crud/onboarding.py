@@ -1,100 +1,220 @@
 import json
+import typing
 
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.future import select
 from sqlalchemy.exc import NoResultFound
 
 
+from src.config.manager import settings
 from src.models.db.onboarding import Onboarding
 from src.models.db.user import User
+from src.models.dto.onboarding import OnboardingRow
 from src.models.schemas.onboarding import OnboardingRequest, OnboardingFeedback
+from src.repository.cache.base import build_user_cache_key
 from src.repository.crud.base import BaseCRUDRepository
+from src.repository.statements import ONBOARDING_BY_USER_ID, ONBOARDING_ROW_BY_USER_ID, ONBOARDING_UPSERT
 
 
 class OnboardingCRUDRepository(BaseCRUDRepository):    
     async def create_or_update_onboarding(self, onboarding_create: OnboardingRequest) -> None:
-        async with self.async_session as session:
-            try:
-                async with session.begin():
-                    result = await session.execute(
-                        select(Onboarding)
-                        .where(Onboarding.user_id == onboarding_create.userId)
-                    )
-                    existing_onboarding = result.scalars().first()
-                    
-                    items_list = list(onboarding_create.items)
-                    detailed_qa_list = [item.__dict__ for item in items_list]  # Convert to list of dicts
-                    detailed_qa_serialized = json.dumps(detailed_qa_list)  # Serialize to JSON
-                    
-                    if existing_onboarding:
-                        existing_onboarding.primary_personality = onboarding_create.primaryPersonality
-                        existing_onboarding.specific_personality = onboarding_create.specificPersonality
-                        existing_onboarding.detailed_qa = detailed_qa_serialized
-                        new_onboarding=None
-                    else:
-                        # Create a new onboarding record
-                        new_onboarding = Onboarding(
-                            user_id=onboarding_create.userId,
-                            primary_personality=onboarding_create.primaryPersonality,
-                            specific_personality=onboarding_create.specificPersonality,
-                            detailed_qa = detailed_qa_serialized
+        """
+        Upsert the onboarding row and flip `user.is_onboarding` in one statement, see `ONBOARDING_UPSERT`.
+        An unknown user makes the CTE empty, so nothing is inserted and no `id` comes back.
+        """
+        detailed_qa_list = [item.__dict__ for item in onboarding_create.items]  # Convert to list of dicts
+        detailed_qa_serialized = json.dumps(detailed_qa_list)  # Serialize to JSON
+
+        try:
+            result = await self.async_session.execute(
+                ONBOARDING_UPSERT,
+                {
+                    "user_id": onboarding_create.userId,
+                    "primary_personality": onboarding_create.primaryPersonality,
+                    "specific_personality": onboarding_create.specificPersonality,
+                    "detailed_qa": detailed_qa_serialized,
+                },
+            )
+            if result.scalar_one_or_none() is None:
+                raise NoResultFound(f"User with ID not found.")
+        except NoResultFound:
+            raise NoResultFound(f"User with ID not found.")
+        except ValueError as ve:
+            raise ValueError(f"Invalid data: {str(ve)}")
+        except Exception as e:
+            raise SystemError(f"Unexpected error during onboarding save: {str(e)}")
+
+        # The cached profile still carries `is_onboarding=True`
+        self.mark_written(user_ids=[onboarding_create.userId])
+        self.invalidate_cached(key=build_user_cache_key(user_id=onboarding_create.userId))
+
+    async def create_or_update_onboarding_batch(self, onboarding_creates: list[OnboardingRequest]) -> set[int]:
+        """
+        Save many scored submissions at once and return the `userId`s that exist and were saved.
+
+        Per chunk of `DB_BULK_CHUNK_SIZE` users this is one `SELECT ... WHERE id IN ... FOR KEY SHARE`, one multi-row
+        `INSERT ... ON CONFLICT (user_id) DO UPDATE` and one `UPDATE "user" ... WHERE id IN`, all inside the caller's transaction.
+        The key-share lock keeps the users found by the `SELECT` from being deleted before the insert references them.
+        When a `userId` appears several times, the last submission wins.
+        """
+        latest_by_user = {onboarding_create.userId: onboarding_create for onboarding_create in onboarding_creates}
+        user_ids = list(latest_by_user)
+        saved_user_ids: set[int] = set()
+        chunk_size = settings.DB_BULK_CHUNK_SIZE
+
+        try:
+            for start in range(0, len(user_ids), chunk_size):
+                chunk = user_ids[start : start + chunk_size]
+                existing_ids = set(
+                    (
+                        await self.async_session.scalars(
+                            select(User.id).where(User.id.in_(chunk), User.deleted_at.is_(None))
+                            # Blocks a concurrent delete of these users until the insert below is committed
+                            .with_for_update(key_share=True)
                         )
-                        session.add(new_onboarding)
-                
-                    # Fetch the corresponding user record and update the onboarding status
-                    result = await session.execute(
-                        select(User).where(User.id == onboarding_create.userId)
+                    ).all()
+                )
+                if not existing_ids:
+                    continue
+
+                insert_stmt = postgresql.insert(Onboarding).values(
+                    [
+                        {
+                            "user_id": user_id,
+                            "primary_personality": latest_by_user[user_id].primaryPersonality,
+                            "specific_personality": latest_by_user[user_id].specificPersonality,
+                            "detailed_qa": json.dumps([item.__dict__ for item in latest_by_user[user_id].items]),
+                        }
+                        for user_id in chunk
+                        if user_id in existing_ids
+                    ]
+                )
+                await self.async_session.execute(
+                    insert_stmt.on_conflict_do_update(
+                        index_elements=[Onboarding.user_id],
+                        set_={
+                            "primary_personality": insert_stmt.excluded.primary_personality,
+                            "specific_personality": insert_stmt.excluded.specific_personality,
+                            "detailed_qa": insert_stmt.excluded.detailed_qa,
+                            "updated_at": sqlalchemy.func.now(),
+                        },
                     )
-                    user = result.scalars().first()
-                    
-                    if user:
-                        user.is_onboarding = False
-                    else:
-                        raise NoResultFound(f"User with ID not found.")
-                    
-                    # Commit the transaction if everything went well
-                    await session.commit()
-                    # Refresh the newly created onboarding record if it was created
-                    if new_onboarding:
-                        await session.refresh(new_onboarding)
-                                
-            except NoResultFound:
-                raise NoResultFound(f"User with ID not found.")
-            except ValueError as ve:
-                # Rollback and raise ValueError
-                await session.rollback()
-                raise ValueError(f"Invalid data: {str(ve)}")
-            except Exception as e:
-                # Rollback and raise any other unexpected errors
-                await session.rollback()
-                raise SystemError(f"Unexpected error during onboarding save: {str(e)}")
-             
-                    
+                )
+                await self.async_session.execute(
+                    sqlalchemy.update(User)
+                    .where(User.id.in_(existing_ids))
+                    .values(is_onboarding=False)
+                    .execution_options(synchronize_session=False)
+                )
+                saved_user_ids |= existing_ids
+        except Exception as e:
+            raise SystemError(f"Unexpected error during batch onboarding save: {str(e)}")
+
+        self.mark_written(user_ids=saved_user_ids)
+        self.invalidate_cached_many(keys=[build_user_cache_key(user_id=user_id) for user_id in saved_user_ids])
+        return saved_user_ids
+
     async def save_feedback(self, feedback_create: OnboardingFeedback) -> None:
-        async with self.async_session as session:
-            async with session.begin():
-                try:
-                    result = await session.execute(
-                        select(Onboarding)
-                        .where(Onboarding.user_id == feedback_create.userId)
-                    )
-                    onboarding = result.scalars().first()
-
-                    if onboarding:
-                        onboarding.feedback = feedback_create.feedback
-                        session.add(onboarding)
-                    else:
-                        raise NoResultFound(f"User with ID not found.")
-                    
-                    await session.commit()
-                    
-                except NoResultFound:
-                    raise NoResultFound(f"User with ID not found.")
-                except ValueError as ve:
-                    # Rollback and raise ValueError
-                    await session.rollback()
-                    raise ValueError(f"Invalid data: {str(ve)}")
-                except Exception as e:
-                    # Rollback and raise any other unexpected errors
-                    await session.rollback()
-                    raise SystemError(f"Unexpected error during feedback save: {str(e)}")
-                
\ No newline at end of file
+        try:
+            result = await self.async_session.execute(ONBOARDING_BY_USER_ID, {"user_id": feedback_create.userId})
+            onboarding = result.scalars().first()
+
+            if onboarding:
+                onboarding.feedback = feedback_create.feedback
+            else:
+                raise NoResultFound(f"User with ID not found.")
+
+            await self.async_session.flush()
+
+        except NoResultFound:
+            raise NoResultFound(f"User with ID not found.")
+        except ValueError as ve:
+            raise ValueError(f"Invalid data: {str(ve)}")
+        except Exception as e:
+            raise SystemError(f"Unexpected error during feedback save: {str(e)}")
+
+    async def save_feedback_batch(self, feedbacks: dict[int, str | None]) -> set[int]:
+        """
+        Save many users' feedback with one `UPDATE onboarding ... FROM (VALUES ...)` per `DB_BULK_CHUNK_SIZE` users.
+        Returns the user ids that have an onboarding row and are not deleted, i.e. whose feedback was saved.
+        """
+        saved_user_ids: set[int] = set()
+        items = list(feedbacks.items())
+        for start in range(0, len(items), settings.DB_BULK_CHUNK_SIZE):
+            feedback_values = sqlalchemy.values(
+                sqlalchemy.column("user_id", sqlalchemy.Integer),
+                sqlalchemy.column("feedback", sqlalchemy.Text),
+                name="feedback_values",
+            ).data(items[start : start + settings.DB_BULK_CHUNK_SIZE])
+            stmt = (
+                sqlalchemy.update(Onboarding)
+                .where(
+                    Onboarding.user_id == feedback_values.c.user_id,
+                    User.id == Onboarding.user_id,
+                    User.deleted_at.is_(None),
+                )
+                .values(feedback=feedback_values.c.feedback)
+                .returning(Onboarding.user_id)
+                .execution_options(synchronize_session=False)
+            )
+            saved_user_ids.update(await self.async_session.scalars(stmt))
+        return saved_user_ids
+
+    async def read_onboarding_row_by_user_id(self, user_id: int) -> OnboardingRow:
+        """
+        Core read of a user's onboarding answers into an `OnboardingRow`, bypassing the ORM and its identity map.
+        """
+        result = await self.async_session.execute(
+            ONBOARDING_ROW_BY_USER_ID, {"user_id": user_id}, bind_arguments=self.read_bind_arguments(user_id=user_id)
+        )
+        row = result.first()
+        if row is None:
+            raise NoResultFound(f"Onboarding of user with ID {user_id} not found.")
+        return OnboardingRow.from_row(row)
+
+    async def read_detailed_qa_chunk(self, after_id: int, limit: int) -> typing.Sequence[sqlalchemy.Row]:
+        """
+        Next `limit` answered onboarding rows with `id > after_id`, as a resumable keyset walk over the primary key.
+        """
+        stmt = (
+            select(
+                Onboarding.id,
+                Onboarding.detailed_qa,
+                Onboarding.primary_personality,
+                Onboarding.specific_personality,
+            )
+            .where(Onboarding.id > after_id, Onboarding.detailed_qa.is_not(None))
+            .order_by(Onboarding.id)
+            .limit(limit)
+        )
+        result = await self.async_session.execute(stmt)
+        return result.all()
+
+    async def update_personalities(self, personalities: list[tuple[int, str, dict[str, float]]]) -> int:
+        """
+        Write `(id, primary_personality, specific_personality)` rows back with a single
+        `UPDATE ... FROM (VALUES ...)` statement.
+        """
+        if not personalities:
+            return 0
+
+        rescored = sqlalchemy.values(
+            sqlalchemy.column("id", sqlalchemy.Integer),
+            sqlalchemy.column("primary_personality", sqlalchemy.String),
+            sqlalchemy.column("specific_personality", sqlalchemy.JSON),
+            name="rescored",
+        ).data(personalities)
+        stmt = (
+            sqlalchemy.update(Onboarding)
+            .where(Onboarding.id == rescored.c.id)
+            .values(
+                primary_personality=rescored.c.primary_personality,
+                specific_personality=rescored.c.specific_personality,
+                updated_at=sqlalchemy.func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = typing.cast(CursorResult, await self.async_session.execute(stmt))
+        return result.rowcount
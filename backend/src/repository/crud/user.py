@@ -1,67 +1,279 @@
+import datetime
 import typing
+
 import loguru
 import sqlalchemy
-from sqlalchemy.sql import functions as sqlalchemy_functions
-from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import DBAPIError, IntegrityError, NoResultFound
+from sqlalchemy.sql import functions as sqlalchemy_functions
 
+from src.config.manager import settings
+from src.models.db.onboarding import Onboarding
 from src.models.db.user import User
-from src.models.schemas.user import UserInCreate, UserInUpdate
-from src.repository.crud.base import BaseCRUDRepository
+from src.models.dto.user import UserRow
+from src.models.schemas.user import (
+    UserBulkCreateStatus,
+    UserInBulkCreateResult,
+    UserInCreate,
+    UserInResponse,
+    UserInUpdate,
+)
+from src.repository.cache.base import build_user_cache_key
+from src.repository.crud.base import BaseCRUDRepository, get_violated_constraint_name
+from src.repository.statements import (
+    USER_BY_ID,
+    USER_EMAIL_TAKEN,
+    USER_ROW_BY_ID,
+    USER_ROW_COLUMNS,
+    user_table,
+    USER_USERNAME_TAKEN,
+)
 from src.utilities.exceptions.database import EmailAlreadyExists, UsernameAlreadyExists
 from src.utilities.exceptions.password import PasswordDoesNotMatch
+from src.utilities.formatters.json_formatter import dumps_json
+
+# Names Postgres gives the `unique=True` constraints declared on `User` (`<table>_<column>_key`).
+USER_EMAIL_UNIQUE_CONSTRAINT = "user_email_key"
+USER_USERNAME_UNIQUE_CONSTRAINT = "user_username_key"
+
+
+USER_EXPORT_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.first_name,
+    User.last_name,
+    User.roles,
+    User.is_active,
+    User.is_onboarding,
+    User.last_login,
+    User.created_at,
+    User.updated_at,
+    Onboarding.primary_personality,
+    Onboarding.specific_personality,
+    Onboarding.detailed_qa,
+    Onboarding.feedback,
+)
+
+# `GET /users/{id}/profile` fields: every `UserInResponse` column plus the nested onboarding results
+USER_PROFILE_FIELDS = UserRow.__slots__
+ONBOARDING_PROFILE_FIELDS = ("primary_personality", "specific_personality", "feedback")
+
+
+def parse_profile_fields(fields: str | None) -> tuple[list[str], list[str]]:
+    """
+    Split a `fields=id,email,onboarding.feedback` projection into the user and onboarding columns to select.
+
+    No projection selects everything; a bare `onboarding` selects all of its fields. Unknown names raise `ValueError`.
+    """
+    if not fields:
+        return list(USER_PROFILE_FIELDS), list(ONBOARDING_PROFILE_FIELDS)
+
+    user_fields: list[str] = []
+    onboarding_fields: list[str] = []
+    for name in filter(None, (name.strip() for name in fields.split(","))):
+        if name == "onboarding":
+            onboarding_fields.extend(ONBOARDING_PROFILE_FIELDS)
+        elif name.startswith("onboarding.") and name.removeprefix("onboarding.") in ONBOARDING_PROFILE_FIELDS:
+            onboarding_fields.append(name.removeprefix("onboarding."))
+        elif name in USER_PROFILE_FIELDS:
+            user_fields.append(name)
+        else:
+            raise ValueError(f"Unknown profile field `{name}`.")
+    if not user_fields and not onboarding_fields:
+        raise ValueError("The profile projection is empty.")
+    return list(dict.fromkeys(user_fields)), list(dict.fromkeys(onboarding_fields))
 
 
 class UserCRUDRepository(BaseCRUDRepository):
     async def create_user(self, user_create: UserInCreate) -> User:
-        new_user = User(**user_create.dict())
-        self.async_session.add(instance=new_user)
-        await self.async_session.commit()
-        await self.async_session.refresh(instance=new_user)
+        """
+        One `INSERT ... RETURNING` for the whole row, server defaults included.
+        """
+        stmt = sqlalchemy.insert(User).values(**user_create.dict()).returning(User)
+        try:
+            new_user = (await self.async_session.execute(stmt)).scalar_one()
+        except IntegrityError as e:
+            self._raise_for_unique_violation(error=e, email=user_create.email, username=user_create.username)
+            raise
+        self.mark_written(user_ids=[new_user.id])
 
         return new_user
-    
-    async def update_user(self, user_id: int, user_update: UserInUpdate) -> User:
-        stmt = sqlalchemy.select(User).where(User.id == user_id)
-        result = await self.async_session.execute(stmt)
-        user = result.scalar_one_or_none()
 
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
+    async def create_users_bulk(self, users_create: list[UserInCreate]) -> list[UserInBulkCreateResult]:
+        """
+        Insert many users at once and report a per-row outcome in the order of `users_create`.
+
+        Rows colliding inside the payload are rejected up front, collisions with stored users are found with one
+        set-based SELECT per chunk, and the remaining rows go out as a single multi-row
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING` per chunk, all inside the caller's transaction.
+        """
+        statuses: list[UserBulkCreateStatus | None] = [None] * len(users_create)
+        seen_emails: set[str] = set()
+        seen_usernames: set[str] = set()
+        for index, user_create in enumerate(users_create):
+            if user_create.email in seen_emails:
+                statuses[index] = UserBulkCreateStatus.DUPLICATE_EMAIL
+            elif user_create.username in seen_usernames:
+                statuses[index] = UserBulkCreateStatus.DUPLICATE_USERNAME
+            else:
+                # Only rows that may be inserted claim their email and username
+                seen_emails.add(user_create.email)
+                seen_usernames.add(user_create.username)
 
-        for key, value in user_update.dict(exclude_unset=True).items():
-            setattr(user, key, value)
+        candidates = [index for index, status in enumerate(statuses) if status is None]
+        created_ids: dict[str, int] = {}
+        chunk_size = settings.DB_BULK_CHUNK_SIZE
 
         try:
-            await self.async_session.commit()
-            await self.async_session.refresh(user)
-            return user
-        except IntegrityError:
-            await self.async_session.rollback()
-            raise IntegrityError(f"Updated user collides with other users")
-        
+            for start in range(0, len(candidates), chunk_size):
+                chunk = candidates[start : start + chunk_size]
+                emails = [users_create[index].email for index in chunk]
+                usernames = [users_create[index].username for index in chunk]
+
+                taken_stmt = sqlalchemy.select(User.email, User.username).where(
+                    sqlalchemy.or_(User.email.in_(emails), User.username.in_(usernames))
+                )
+                taken_rows = (await self.async_session.execute(taken_stmt)).all()
+                taken_emails = {row.email for row in taken_rows}
+                taken_usernames = {row.username for row in taken_rows}
+
+                insertable = []
+                for index in chunk:
+                    user_create = users_create[index]
+                    if user_create.email in taken_emails:
+                        statuses[index] = UserBulkCreateStatus.EMAIL_TAKEN
+                    elif user_create.username in taken_usernames:
+                        statuses[index] = UserBulkCreateStatus.USERNAME_TAKEN
+                    else:
+                        insertable.append(user_create.dict())
+
+                if not insertable:
+                    continue
+
+                insert_stmt = (
+                    postgresql.insert(User).values(insertable).on_conflict_do_nothing().returning(User.id, User.email)
+                )
+                inserted_rows = (await self.async_session.execute(insert_stmt)).all()
+                created_ids.update({row.email: row.id for row in inserted_rows})
+            self.mark_written(user_ids=created_ids.values())
+        except DBAPIError as e:
+            # Unique collisions never get here; this is the database itself failing the chunk
+            raise SystemError(f"The database failed while creating {len(users_create)} users.") from e
+
+        results = []
+        for index, user_create in enumerate(users_create):
+            status = statuses[index]
+            user_id = None
+            if status is None:
+                # Rows skipped by `ON CONFLICT DO NOTHING` lost a race against a concurrent insert.
+                user_id = created_ids.get(user_create.email)
+                status = UserBulkCreateStatus.CREATED if user_id is not None else UserBulkCreateStatus.CONFLICT
+            results.append(
+                UserInBulkCreateResult(
+                    index=index,
+                    email=user_create.email,
+                    username=user_create.username,
+                    status=status,
+                    id=user_id,
+                )
+            )
+        return results
+
+    async def update_user(self, user_id: int, user_update: UserInUpdate) -> User:
+        """
+        Partial update of the fields set on `user_update` as one `UPDATE ... RETURNING`, no prior SELECT.
+        """
+        values = user_update.dict(exclude_unset=True)
+        if not values:
+            return await self.get_user_by_id(user_id=user_id)
+
+        stmt = (
+            sqlalchemy.update(User)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+            .values(**values, updated_at=sqlalchemy_functions.now())
+            .returning(User)
+        )
+        try:
+            user = (await self.async_session.execute(stmt)).scalar_one_or_none()
+        except IntegrityError as e:
+            self._raise_for_unique_violation(error=e, email=user_update.email, username=user_update.username)
+            raise
+
+        if user is None:
+            raise NoResultFound(f"User with ID {user_id} not found.")
+        self.mark_written(user_ids=[user_id])
+        self.invalidate_cached(key=build_user_cache_key(user_id=user_id))
+        return user
+
     async def delete_user(self, user_id: int) -> bool:
         try:
             stmt = delete(User).where(User.id == user_id)
-            result = await self.async_session.execute(stmt)
+            result = typing.cast(CursorResult, await self.async_session.execute(stmt))
             if result.rowcount == 0:
                 raise NoResultFound(f"User with ID {user_id} not found.")
-            await self.async_session.commit()
+            self.mark_written(user_ids=[user_id])
+            self.invalidate_cached(key=build_user_cache_key(user_id=user_id))
             return True
         except NoResultFound:
             raise NoResultFound(f"User with ID {user_id} not found.")
         except IntegrityError as e:
-            await self.async_session.rollback()
             raise ValueError(f"Cannot delete user with ID {user_id} due to integrity constraints.") from e
         except Exception as e:
-            await self.async_session.rollback()
             raise SystemError(f"An unexpected error occurred while deleting user with ID {user_id}.") from e
-        
+
+    async def soft_delete_user(self, user_id: int) -> None:
+        """
+        Stamp `deleted_at` instead of deleting: a single-row `UPDATE` that every read then skips. The row and its
+        onboarding row are removed later by `purge_deleted_users`. The username and email stay taken until then.
+        """
+        stmt = (
+            sqlalchemy.update(User)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+            .values(deleted_at=sqlalchemy_functions.now(), is_logged_in=False)
+            .execution_options(synchronize_session=False)
+        )
+        result = typing.cast(CursorResult, await self.async_session.execute(stmt))
+        if result.rowcount == 0:
+            raise NoResultFound(f"User with ID {user_id} not found.")
+        self.mark_written(user_ids=[user_id])
+        self.invalidate_cached(key=build_user_cache_key(user_id=user_id))
+
+    async def purge_deleted_users(self, deleted_before: datetime.datetime, limit: int) -> list[int]:
+        """
+        Hard-delete up to `limit` users soft-deleted before `deleted_before`, oldest first, with their onboarding rows.
+
+        The batch is claimed with `FOR UPDATE SKIP LOCKED` through `ix_user_deleted_at`, so concurrent purges never
+        wait on each other and the locks last only as long as the caller's (short) transaction.
+        """
+        claimed = (
+            sqlalchemy.select(User.id)
+            .where(User.deleted_at < deleted_before)
+            .order_by(User.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        user_ids = list((await self.async_session.scalars(claimed)).all())
+        if not user_ids:
+            return []
+
+        await self.async_session.execute(
+            sqlalchemy.delete(Onboarding)
+            .where(Onboarding.user_id.in_(user_ids))
+            .execution_options(synchronize_session=False)
+        )
+        await self.async_session.execute(
+            sqlalchemy.delete(User).where(User.id.in_(user_ids)).execution_options(synchronize_session=False)
+        )
+        return user_ids
 
     async def get_user_by_id(self, user_id: int) -> User:
         try:
-            stmt = sqlalchemy.select(User).where(User.id == user_id)
-            result = await self.async_session.execute(stmt)
+            result = await self.async_session.execute(
+                USER_BY_ID, {"user_id": user_id}, bind_arguments=self.read_bind_arguments(user_id=user_id)
+            )
             user = result.scalar_one_or_none()
             if user is None:
                 raise NoResultFound(f"User with ID {user_id} not found.")
@@ -71,18 +283,261 @@ class UserCRUDRepository(BaseCRUDRepository):
         except Exception as e:
             raise SystemError(f"An unexpected error occurred while fetching user with ID {user_id}.") from e
 
+    async def read_user_row_by_id(self, user_id: int) -> UserRow:
+        """
+        Core read of just the `UserInResponse` columns into a `UserRow`, bypassing the ORM and its identity map.
+        """
+        result = await self.async_session.execute(
+            USER_ROW_BY_ID, {"user_id": user_id}, bind_arguments=self.read_bind_arguments(user_id=user_id)
+        )
+        row = result.first()
+        if row is None:
+            raise NoResultFound(f"User with ID {user_id} not found.")
+        return UserRow.from_row(row)
+
+    async def read_user_json_by_id(self, user_id: int) -> str:
+        """
+        Read-through cached `UserInResponse` JSON of `read_user_row_by_id`. A cache hit is returned as stored, without
+        being parsed or validated again.
+        """
+        cache_key = build_user_cache_key(user_id=user_id)
+        if self.cache is not None:
+            payload = await self.cache.get(key=cache_key)
+            if payload is not None:
+                return payload
+
+        user_row = await self.read_user_row_by_id(user_id=user_id)
+        payload = dumps_json(user_row.to_dict()).decode()
+        if self.cache is not None:
+            await self.cache.set(key=cache_key, value=payload)
+        return payload
+
+    async def read_user_profile_by_id(
+        self, user_id: int, user_fields: list[str], onboarding_fields: list[str]
+    ) -> dict[str, typing.Any]:
+        """
+        The user and their onboarding results in one `LEFT JOIN` through `User.onboarding`, selecting only the
+        requested columns. `onboarding` is `None` for a user who has not submitted answers yet.
+        """
+        columns = [User.__table__.c[name] for name in user_fields]
+        if onboarding_fields:
+            # `Onboarding.id` tells a missing row apart from a row whose requested columns are all NULL
+            columns.append(Onboarding.id.label("onboarding_id"))
+            columns.extend(Onboarding.__table__.c[name].label(f"onboarding_{name}") for name in onboarding_fields)
+        stmt = (
+            sqlalchemy.select(*columns)
+            .select_from(User)
+            .outerjoin(User.onboarding)
+            .where(User.id == user_id, User.deleted_at.is_(None))
+        )
+
+        result = await self.async_session.execute(stmt, bind_arguments=self.read_bind_arguments(user_id=user_id))
+        row = result.mappings().first()
+        if row is None:
+            raise NoResultFound(f"User with ID {user_id} not found.")
+
+        profile = {name: row[name] for name in user_fields}
+        if onboarding_fields:
+            profile["onboarding"] = (
+                {name: row[f"onboarding_{name}"] for name in onboarding_fields}
+                if row["onboarding_id"] is not None
+                else None
+            )
+        return profile
+
+    async def list_users(
+        self,
+        limit: int,
+        after: tuple[datetime.datetime, int] | None = None,
+        is_active: bool | None = None,
+        is_onboarding: bool | None = None,
+        roles: list[int] | None = None,
+        last_login_from: datetime.datetime | None = None,
+        last_login_to: datetime.datetime | None = None,
+    ) -> list[UserRow]:
+        """
+        Newest-first page of users using keyset pagination on `(created_at, id)`, read as Core rows.
+
+        `after` is the `(created_at, id)` of the last row of the previous page, so every page is an index range scan
+        of `limit` rows no matter how deep it is. Returns up to `limit + 1` rows, the extra one signals a next page.
+        """
+        columns = user_table.c
+        stmt = sqlalchemy.select(*USER_ROW_COLUMNS).where(columns.deleted_at.is_(None))
+        if after is not None:
+            stmt = stmt.where(sqlalchemy.tuple_(columns.created_at, columns.id) < sqlalchemy.tuple_(*after))
+        if is_active is not None:
+            stmt = stmt.where(columns.is_active == is_active)
+        if is_onboarding is not None:
+            stmt = stmt.where(columns.is_onboarding == is_onboarding)
+        if roles:
+            stmt = stmt.where(columns.roles.in_(roles))
+        if last_login_from is not None:
+            stmt = stmt.where(columns.last_login >= last_login_from)
+        if last_login_to is not None:
+            stmt = stmt.where(columns.last_login < last_login_to)
+        stmt = stmt.order_by(columns.created_at.desc(), columns.id.desc()).limit(limit + 1)
+
+        result = await self.async_session.execute(stmt, bind_arguments=self.read_bind_arguments())
+        return [UserRow.from_row(row) for row in result]
+
+    async def stream_users_with_onboarding(
+        self, updated_since: datetime.datetime | None = None
+    ) -> typing.AsyncIterator[typing.Sequence[sqlalchemy.Row]]:
+        """
+        Yield partitions of `user` rows left-joined with their `onboarding` row through a server-side cursor.
+
+        Only `DB_STREAM_CHUNK_SIZE` rows are held in memory at a time. With `updated_since`, only users whose own
+        row or onboarding row was created or updated since then are exported.
+        """
+        stmt = (
+            sqlalchemy.select(*USER_EXPORT_COLUMNS)
+            .outerjoin(Onboarding, Onboarding.user_id == User.id)
+            .where(User.deleted_at.is_(None))
+            .order_by(User.id)
+            .execution_options(yield_per=settings.DB_STREAM_CHUNK_SIZE)
+        )
+        if updated_since is not None:
+            stmt = stmt.where(
+                sqlalchemy.or_(
+                    sqlalchemy.func.coalesce(User.updated_at, User.created_at) >= updated_since,
+                    sqlalchemy.func.coalesce(Onboarding.updated_at, Onboarding.created_at) >= updated_since,
+                )
+            )
+
+        result = await self.async_session.stream(stmt, bind_arguments=self.read_bind_arguments())
+        async for partition in result.partitions():
+            yield partition
+
+    async def count_users(self) -> int:
+        stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(User)
+        return (await self.async_session.execute(stmt, bind_arguments=self.read_bind_arguments())).scalar_one()
+
+    async def read_database_time(self, use_replica: bool = True) -> datetime.datetime:
+        stmt = sqlalchemy.select(sqlalchemy.func.now())
+        bind_arguments = self.read_bind_arguments() if use_replica else {}
+        return (await self.async_session.execute(stmt, bind_arguments=bind_arguments)).scalar_one()
+
+    async def stream_usernames_and_emails(
+        self, changed_since: datetime.datetime | None = None, use_replica: bool = True
+    ) -> typing.AsyncIterator[typing.Sequence[sqlalchemy.Row]]:
+        """
+        Yield partitions of `(username, email)` rows through a server-side cursor, see `stream_users_with_onboarding`.
+        With `changed_since`, only users created or updated since then, found through `ix_user_changed_at`.
+        `use_replica=False` keeps the scan on the primary.
+        """
+        stmt = sqlalchemy.select(User.username, User.email).execution_options(yield_per=settings.DB_STREAM_CHUNK_SIZE)
+        if changed_since is not None:
+            stmt = stmt.where(sqlalchemy.func.coalesce(User.updated_at, User.created_at) >= changed_since)
+        bind_arguments = self.read_bind_arguments() if use_replica else {}
+        result = await self.async_session.stream(stmt, bind_arguments=bind_arguments)
+        async for partition in result.partitions():
+            yield partition
+
+    async def save_activity_batch(
+        self,
+        last_seen: dict[int, datetime.datetime],
+        logged_out: typing.Iterable[int],
+        expired: typing.Iterable[int],
+        session_timeout: float,
+    ) -> set[int]:
+        """
+        One `UPDATE "user" ... FROM (VALUES ...)` for a whole flush: users in `last_seen` are marked logged in with
+        that `last_login`, users in `logged_out` are marked logged out, and so are users in `expired`, but only while
+        their stored `last_login` is older than `session_timeout` seconds, so a session kept alive through another
+        worker stays logged in. Soft-deleted users are left alone. Returns the ids of the users that exist.
+        """
+        # `is_logged_in` of a row: True for activity, False for a logout, NULL for a conditional expiry
+        rows: list[tuple[int, bool | None, datetime.datetime | None]] = [
+            (user_id, True, seen_at) for user_id, seen_at in last_seen.items()
+        ]
+        rows += [(user_id, False, None) for user_id in logged_out if user_id not in last_seen]
+        rows += [(user_id, None, None) for user_id in expired if user_id not in last_seen]
+        if not rows:
+            return set()
+
+        activity_values = sqlalchemy.values(
+            sqlalchemy.column("user_id", sqlalchemy.Integer),
+            sqlalchemy.column("is_logged_in", sqlalchemy.Boolean),
+            sqlalchemy.column("last_login", sqlalchemy.DateTime(timezone=True)),
+            name="activity_values",
+        ).data(rows)
+        # A column that is NULL in every row would otherwise be typed `text` by Postgres
+        is_logged_in = sqlalchemy.cast(activity_values.c.is_logged_in, sqlalchemy.Boolean)
+        last_login = sqlalchemy.cast(activity_values.c.last_login, sqlalchemy.DateTime(timezone=True))
+        cutoff = sqlalchemy_functions.now() - datetime.timedelta(seconds=session_timeout)
+        stmt = (
+            sqlalchemy.update(User)
+            .where(User.id == activity_values.c.user_id, User.deleted_at.is_(None))
+            .values(
+                is_logged_in=sqlalchemy.case(
+                    (is_logged_in.is_not(None), is_logged_in),
+                    (User.last_login >= cutoff, User.is_logged_in),
+                    else_=False,
+                ),
+                last_login=sqlalchemy.func.coalesce(last_login, User.last_login),
+            )
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        user_ids = set(await self.async_session.scalars(stmt))
+
+        # Cached profiles carry `is_logged_in` and `last_login`
+        self.mark_written(user_ids=user_ids)
+        self.invalidate_cached_many(keys=[build_user_cache_key(user_id=user_id) for user_id in user_ids])
+        return user_ids
+
+    async def expire_stale_sessions(self, session_timeout: float) -> int:
+        """
+        Log out every user whose `last_login` is older than `session_timeout` seconds, e.g. the sessions a stopped
+        worker was tracking. Returns how many were logged out.
+        """
+        cutoff = sqlalchemy_functions.now() - datetime.timedelta(seconds=session_timeout)
+        stmt = (
+            sqlalchemy.update(User)
+            .where(User.is_logged_in.is_(True), User.last_login < cutoff)
+            .values(is_logged_in=False)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        user_ids = set(await self.async_session.scalars(stmt))
+        self.mark_written(user_ids=user_ids)
+        self.invalidate_cached_many(keys=[build_user_cache_key(user_id=user_id) for user_id in user_ids])
+        return len(user_ids)
+
     async def is_email_taken(self, email: str) -> bool:
-        email_stmt = sqlalchemy.select(User.email).select_from(User).where(User.email == email)
-        email_query = await self.async_session.execute(email_stmt)
+        email_query = await self.async_session.execute(
+            USER_EMAIL_TAKEN, {"email": email}, bind_arguments=self.read_bind_arguments()
+        )
         db_email = email_query.scalar()
 
         if db_email:
             raise EmailAlreadyExists(f"The email `{email}` is already registered!")
         
     async def is_username_taken(self, username: str) -> bool:
-        username_stmt = sqlalchemy.select(User.username).select_from(User).where(User.username == username)
-        username_query = await self.async_session.execute(username_stmt)
+        username_query = await self.async_session.execute(
+            USER_USERNAME_TAKEN, {"username": username}, bind_arguments=self.read_bind_arguments()
+        )
         db_username = username_query.scalar()
 
         if db_username:
-            raise UsernameAlreadyExists(f"The username `{username}` is already taken!")  # type: ignore
\ No newline at end of file
+            raise UsernameAlreadyExists(f"The username `{username}` is already taken!")  # type: ignore
+
+    async def is_email_registered(self, email: str) -> bool:
+        result = await self.async_session.execute(
+            USER_EMAIL_TAKEN, {"email": email}, bind_arguments=self.read_bind_arguments()
+        )
+        return result.first() is not None
+
+    async def is_username_registered(self, username: str) -> bool:
+        result = await self.async_session.execute(
+            USER_USERNAME_TAKEN, {"username": username}, bind_arguments=self.read_bind_arguments()
+        )
+        return result.first() is not None
+
+    @staticmethod
+    def _raise_for_unique_violation(error: IntegrityError, email: str | None, username: str | None) -> None:
+        constraint_name = get_violated_constraint_name(error=error)
+        if constraint_name == USER_EMAIL_UNIQUE_CONSTRAINT:
+            raise EmailAlreadyExists(f"The email `{email}` is already registered!") from error
+        if constraint_name == USER_USERNAME_UNIQUE_CONSTRAINT:
+            raise UsernameAlreadyExists(f"The username `{username}` is already taken!") from error
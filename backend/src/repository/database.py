@@ -1,12 +1,68 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+
 from src.config.manager import settings
+from src.repository.diagnostics import register_query_detector_event_listeners
+from src.repository.events import (
+    register_pool_event_listeners,
+    register_statement_event_listeners,
+    register_timing_event_listeners,
+    SessionTracker,
+)
+from src.repository.metrics import InstrumentedAsyncAdaptedQueuePool
+from src.repository.routing import ReplicaRouter, RoutingSession
 
 engine = create_async_engine(
     url=settings.DB_ASYNC_URL,
-    echo=False,
+    echo=settings.IS_DB_ECHO_LOG,
     future=True,
-    pool_size=max(5, 10),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_OVERFLOW,
+    pool_timeout=settings.DB_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+)
+register_pool_event_listeners(async_engine=engine)
+register_statement_event_listeners(async_engine=engine)
+register_timing_event_listeners(async_engine=engine)
+if settings.IS_DB_QUERY_DETECTOR_ENABLED:
+    register_query_detector_event_listeners(
+        async_engine=engine,
+        slow_query_threshold=settings.DB_SLOW_QUERY_THRESHOLD,
+        repeated_query_threshold=settings.DB_REPEATED_QUERY_THRESHOLD,
+    )
+session_tracker = SessionTracker()
+
+replica_engines = [
+    create_async_engine(
+        url=replica_url.strip(),
+        echo=settings.IS_DB_ECHO_LOG,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_OVERFLOW,
+        pool_timeout=settings.DB_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    )
+    for replica_url in settings.DB_REPLICA_URLS.split(",")
+    if replica_url.strip()
+]
+for replica_engine in replica_engines:
+    register_statement_event_listeners(async_engine=replica_engine)
+    register_timing_event_listeners(async_engine=replica_engine)
+    if settings.IS_DB_QUERY_DETECTOR_ENABLED:
+        # Reads routed to a replica can be an N+1 as well
+        register_query_detector_event_listeners(
+            async_engine=replica_engine,
+            slow_query_threshold=settings.DB_SLOW_QUERY_THRESHOLD,
+            repeated_query_threshold=settings.DB_REPEATED_QUERY_THRESHOLD,
+        )
+replica_router = (
+    ReplicaRouter(replicas=replica_engines, strategy=settings.DB_REPLICA_SELECTION) if replica_engines else None
 )
 
 SessionLocal = sessionmaker(
@@ -15,15 +71,21 @@ SessionLocal = sessionmaker(
     autoflush=False,
     expire_on_commit=False,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_router=replica_router,
 )
 
 
 async def get_session():
-    async with SessionLocal() as session:
-        try:
-            yield session
-        except Exception as e:
-            await session.rollback()
-            raise e
-        finally:
-            await session.close()
\ No newline at end of file
+    session_tracker.enter()
+    try:
+        async with SessionLocal() as session:
+            try:
+                yield session
+            except Exception as e:
+                await session.rollback()
+                raise e
+            finally:
+                await session.close()
+    finally:
+        session_tracker.exit()
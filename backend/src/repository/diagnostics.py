@@ -0,0 +1,134 @@
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import time
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclasses.dataclass
+class QueryLog:
+    """
+    Every statement executed inside one `query_log_scope`, e.g. one request or one test block. Scopes nest: a
+    statement is recorded in the innermost scope and every scope around it.
+    """
+
+    parent: "QueryLog | None" = None
+    statements: list[tuple[str, float]] = dataclasses.field(default_factory=list)
+    counts: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+    def record(self, statement: str, elapsed: float) -> int:
+        """
+        Record `statement` here and in the enclosing scopes, returning how often this scope has now seen it.
+        """
+        query_log: QueryLog | None = self
+        while query_log is not None:
+            query_log.statements.append((statement, elapsed))
+            query_log.counts[statement] += 1
+            query_log = query_log.parent
+        return self.counts[statement]
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {statement: count for statement, count in self.counts.items() if count >= threshold}
+
+
+current_query_log: contextvars.ContextVar[QueryLog | None] = contextvars.ContextVar("current_query_log", default=None)
+
+
+@contextlib.contextmanager
+def query_log_scope() -> typing.Iterator[QueryLog]:
+    query_log = QueryLog(parent=current_query_log.get())
+    token = current_query_log.set(query_log)
+    try:
+        yield query_log
+    finally:
+        current_query_log.reset(token)
+
+
+EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+EXPLAIN_SAVEPOINT = "query_detector_explain"
+
+
+def explain_statement(connection: sqlalchemy.Connection, statement: str, parameters: typing.Any) -> str | None:
+    """
+    `EXPLAIN` (never `ANALYZE`, so nothing runs twice) through a raw DB-API cursor, which keeps it out of the
+    engine's own events. It runs on the caller's connection inside a savepoint, so a failing `EXPLAIN` (a timeout,
+    a parameter the raw cursor cannot bind) is rolled back without aborting the caller's transaction.
+    """
+    if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+        return None
+    cursor = connection.connection.dbapi_connection.cursor()  # type: ignore
+    try:
+        cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(f"EXPLAIN {statement}", parameters)
+            return "\n".join(row[0] for row in cursor.fetchall())
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            raise
+        finally:
+            cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+    finally:
+        cursor.close()
+
+
+QUERY_STARTED_AT_KEY = "query_detector_started_at"
+
+
+def register_query_detector_event_listeners(
+    async_engine: AsyncEngine, slow_query_threshold: float, repeated_query_threshold: int
+) -> None:
+    """
+    Warn about statements slower than `slow_query_threshold` seconds, and about a statement executed
+    `repeated_query_threshold` times within one `query_log_scope` (the N+1 pattern), logging its `EXPLAIN` plan.
+    Each offending SQL text is explained once per process to keep the log readable.
+    """
+    sync_engine = async_engine.sync_engine
+    explained: set[str] = set()
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def stamp_query_start(
+        connection: sqlalchemy.Connection,
+        cursor: typing.Any,
+        statement: str,
+        parameters: typing.Any,
+        context: typing.Any,
+        executemany: bool,
+    ) -> None:
+        connection.info[QUERY_STARTED_AT_KEY] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def detect_offending_query(
+        connection: sqlalchemy.Connection,
+        cursor: typing.Any,
+        statement: str,
+        parameters: typing.Any,
+        context: typing.Any,
+        executemany: bool,
+    ) -> None:
+        started_at = connection.info.pop(QUERY_STARTED_AT_KEY, None)
+        elapsed = time.perf_counter() - started_at if started_at is not None else 0.0
+        query_log = current_query_log.get()
+        executions = query_log.record(statement, elapsed) if query_log is not None else 1
+
+        offence = None
+        if elapsed >= slow_query_threshold:
+            offence = f"Slow query --- {elapsed * 1000:.1f} ms"
+        elif executions == repeated_query_threshold:
+            offence = f"Repeated query --- executed {executions} times in one scope, likely an N+1"
+        if offence is None:
+            return
+
+        plan = None
+        if not executemany and statement not in explained:
+            explained.add(statement)
+            try:
+                plan = explain_statement(connection, statement, parameters)
+            except Exception as e:
+                loguru.logger.warning(f"EXPLAIN failed --- {e}")
+        loguru.logger.warning(f"{offence}\n{statement}" + (f"\n{plan}" if plan else ""))
@@ -1,41 +1,235 @@
-# import fastapi
-# import loguru
-# from sqlalchemy import event
-# from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_connection
-# from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSessionTransaction
-# from sqlalchemy.pool.base import _ConnectionRecord
+import asyncio
+import time
+import typing
 
-# from src.repository.database import async_db
-# from src.repository.table import Base
+import fastapi
+import loguru
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from src.config.manager import settings
+from src.repository.metrics import pool_metrics
+from src.repository.statements import (
+    ONBOARDING_BY_USER_ID,
+    STATEMENT_NAME_OPTION,
+    statement_registry,
+    USER_BY_ID,
+    USER_EMAIL_TAKEN,
+    USER_ROW_BY_ID,
+    USER_USERNAME_TAKEN,
+)
+from src.utilities.metrics.request_timing import record_statement_time
 
-# @event.listens_for(target=async_db.async_engine.sync_engine, identifier="connect")
-# def inspect_db_server_on_connection(
-#     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
-# ) -> None:
-#     loguru.logger.info(f"New DB API Connection ---\n {db_api_connection}")
-#     loguru.logger.info(f"Connection Record ---\n {connection_record}")
 
+class SessionTracker:
+    """
+    Counts the sessions handed out by `get_session`, so shutdown can wait for in-flight requests to finish.
+    """
 
-# @event.listens_for(target=async_db.async_engine.sync_engine, identifier="close")
-# def inspect_db_server_on_close(
-#     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
-# ) -> None:
-#     loguru.logger.info(f"Closing DB API Connection ---\n {db_api_connection}")
-#     loguru.logger.info(f"Closed Connection Record ---\n {connection_record}")
+    def __init__(self) -> None:
+        self.active: int = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
+    def enter(self) -> None:
+        self.active += 1
+        self._idle.clear()
 
-# async def initialize_db_connection(backend_app: fastapi.FastAPI) -> None:
-#     loguru.logger.info("Database Connection --- Establishing . . .")
+    def exit(self) -> None:
+        self.active -= 1
+        if not self.active:
+            self._idle.set()
 
-#     backend_app.state.db = async_db
+    async def wait_idle(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
 
-#     loguru.logger.info("Database Connection --- Successfully Established!")
 
+CONNECT_STARTED_AT_KEY = "connect_started_at"
 
-# async def dispose_db_connection(backend_app: fastapi.FastAPI) -> None:
-#     loguru.logger.info("Database Connection --- Disposing . . .")
 
-#     await backend_app.state.db.async_engine.dispose()
+def register_pool_event_listeners(async_engine: AsyncEngine) -> None:
+    """
+    Feed `pool_metrics` from the engine's dialect and pool events: `do_connect` stamps the connection record,
+    `connect` turns the stamp into a connect latency sample, `checkout` and `invalidate` are counted.
+    """
+    sync_engine = async_engine.sync_engine
 
-#     loguru.logger.info("Database Connection --- Successfully Disposed!")
+    @event.listens_for(sync_engine, "do_connect")
+    def stamp_connect_start(
+        dialect: typing.Any, connection_record: typing.Any, cargs: typing.Any, cparams: typing.Any
+    ) -> None:
+        connection_record.info[CONNECT_STARTED_AT_KEY] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "connect")
+    def record_connect_latency(db_api_connection: typing.Any, connection_record: typing.Any) -> None:
+        started_at = connection_record.info.pop(CONNECT_STARTED_AT_KEY, None)
+        pool_metrics.connects += 1
+        if started_at is not None:
+            pool_metrics.connect_latency.observe(time.perf_counter() - started_at)
+
+    @event.listens_for(sync_engine, "checkout")
+    def record_checkout(
+        db_api_connection: typing.Any, connection_record: typing.Any, connection_proxy: typing.Any
+    ) -> None:
+        pool_metrics.checkouts += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def record_invalidation(
+        db_api_connection: typing.Any, connection_record: typing.Any, exception: typing.Any
+    ) -> None:
+        pool_metrics.invalidations += 1
+        loguru.logger.warning(f"DB API Connection invalidated --- {exception}")
+
+
+def register_statement_event_listeners(async_engine: AsyncEngine) -> None:
+    """
+    Record, for every execution of a registered statement, whether SQLAlchemy's compiled cache and asyncpg's
+    prepared statement cache already held it.
+    """
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def record_statement_cache_hits(
+        connection: sqlalchemy.Connection,
+        cursor: typing.Any,
+        statement: str,
+        parameters: typing.Any,
+        context: typing.Any,
+        executemany: bool,
+    ) -> None:
+        name = context.execution_options.get(STATEMENT_NAME_OPTION) if context is not None else None
+        if name is None:
+            return
+        # asyncpg adapter internals: the LRU of prepared statements is keyed by the SQL text
+        prepared_cache = getattr(connection.connection.dbapi_connection, "_prepared_statement_cache", None)
+        statement_registry.record(
+            name=name,
+            compiled_cache_hit=context.cache_hit == CacheStats.CACHE_HIT,
+            prepared_cache_hit=prepared_cache is not None and statement in prepared_cache,
+        )
+
+
+CURSOR_STARTED_AT_KEY = "cursor_started_at"
+
+
+def register_timing_event_listeners(async_engine: AsyncEngine) -> None:
+    """
+    Add the round trip of every cursor execution to the current request's `RequestTimings`.
+
+    Statements on one connection never overlap, so a single stamp in `connection.info` is enough; a failed execution
+    leaves it behind to be overwritten by the next one.
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def stamp_cursor_start(
+        connection: sqlalchemy.Connection,
+        cursor: typing.Any,
+        statement: str,
+        parameters: typing.Any,
+        context: typing.Any,
+        executemany: bool,
+    ) -> None:
+        connection.info[CURSOR_STARTED_AT_KEY] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def record_cursor_time(
+        connection: sqlalchemy.Connection,
+        cursor: typing.Any,
+        statement: str,
+        parameters: typing.Any,
+        context: typing.Any,
+        executemany: bool,
+    ) -> None:
+        started_at = connection.info.pop(CURSOR_STARTED_AT_KEY, None)
+        if started_at is not None:
+            record_statement_time(time.perf_counter() - started_at)
+
+
+def build_hot_statements() -> list[tuple[sqlalchemy.Executable, dict[str, typing.Any]]]:
+    """
+    The registered lookups every request path runs, with throwaway parameters. Warming a connection with them
+    fills both SQLAlchemy's compiled cache and asyncpg's per-connection prepared statement cache.
+    """
+    return [
+        (USER_BY_ID, {"user_id": 0}),
+        (USER_ROW_BY_ID, {"user_id": 0}),
+        (USER_EMAIL_TAKEN, {"email": ""}),
+        (USER_USERNAME_TAKEN, {"username": ""}),
+        (ONBOARDING_BY_USER_ID, {"user_id": 0}),
+    ]
+
+
+async def warm_pool(
+    async_engine: AsyncEngine, size: int, statements: list[tuple[sqlalchemy.Executable, dict[str, typing.Any]]]
+) -> int:
+    """
+    Open `size` connections at once, prepare `statements` on each, then check them all back into the pool.
+    Returns the number of connections that were warmed.
+    """
+    outcomes = await asyncio.gather(*(async_engine.connect() for _ in range(size)), return_exceptions=True)
+    connections = [outcome for outcome in outcomes if isinstance(outcome, AsyncConnection)]
+    prepare_error: DBAPIError | None = None
+    try:
+        for connection in connections:
+            try:
+                for statement, parameters in statements:
+                    await connection.execute(statement, parameters)
+            except DBAPIError as e:
+                # e.g. migrations not applied yet: the connection is still open and worth keeping warm.
+                prepare_error = e
+                await connection.rollback()
+    finally:
+        for connection in connections:
+            await connection.close()
+
+    if prepare_error is not None:
+        loguru.logger.warning(f"Database Connection --- Hot statements were not prepared: {prepare_error.orig}")
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            loguru.logger.error(f"Database Connection --- Warm-up connection failed: {outcome}")
+    return len(connections)
+
+
+async def initialize_db_connection(backend_app: fastapi.FastAPI, async_engine: AsyncEngine) -> None:
+    loguru.logger.info("Database Connection --- Establishing . . .")
+
+    backend_app.state.db = async_engine
+    warm_size = min(settings.DB_POOL_WARM_SIZE, settings.DB_POOL_SIZE)
+    try:
+        warmed = await warm_pool(async_engine=async_engine, size=warm_size, statements=build_hot_statements())
+    except Exception as e:
+        # An unreachable database must not keep the worker from booting, connections then open lazily.
+        loguru.logger.error(f"Database Connection --- Warm-up failed, falling back to lazy connections: {e}")
+        return
+
+    loguru.logger.info(f"Database Connection --- Successfully Established! ({warmed}/{warm_size} connections warm)")
+
+
+async def dispose_db_connection(
+    backend_app: fastapi.FastAPI,
+    session_tracker: SessionTracker,
+    before_dispose: typing.Callable[[], typing.Awaitable[None]] | None = None,
+) -> None:
+    """
+    Wait for in-flight sessions, run `before_dispose` (e.g. flushing write-behind buffers those requests filled)
+    while the engine is still usable, then dispose it.
+    """
+    loguru.logger.info("Database Connection --- Draining . . .")
+
+    if not await session_tracker.wait_idle(timeout=settings.DB_DRAIN_TIMEOUT):
+        loguru.logger.warning(
+            f"Database Connection --- {session_tracker.active} sessions still open after {settings.DB_DRAIN_TIMEOUT}s"
+        )
+    if before_dispose is not None:
+        with loguru.logger.catch():
+            await before_dispose()
+    await backend_app.state.db.dispose()
+
+    loguru.logger.info("Database Connection --- Successfully Disposed!")
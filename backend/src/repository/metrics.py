@@ -0,0 +1,55 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
+
+from src.utilities.metrics.histogram import Histogram
+from src.utilities.metrics.request_timing import record_pool_wait
+
+
+class PoolMetrics:
+    """
+    Counters and latency histograms for the connection pool, fed by `InstrumentedAsyncAdaptedQueuePool`
+    (checkout wait time) and the pool event listeners in `src.repository.events` (everything else).
+    """
+
+    def __init__(self) -> None:
+        self.wait_time = Histogram()
+        self.connect_latency = Histogram()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts: int = 0
+        self.connects: int = 0
+        self.timeouts: int = 0
+        self.invalidations: int = 0
+        self.wait_time.reset()
+        self.connect_latency.reset()
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueue(AsyncAdaptedQueue):
+    """
+    Times every `get()` on the pool's idle-connection queue, i.e. how long a checkout waited for a free connection,
+    both for `pool_metrics` and the current request's timings.
+    A blocking `get()` that runs out of time is what surfaces as `QueuePool limit ... reached`.
+    """
+
+    def get(self, block: bool = True, timeout: float | None = None):  # type: ignore
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        except Empty:
+            if block:
+                pool_metrics.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            pool_metrics.wait_time.observe(waited)
+            record_pool_wait(waited)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = InstrumentedAsyncAdaptedQueue  # type: ignore
@@ -0,0 +1,97 @@
+import itertools
+import time
+import typing
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+# `bind_arguments` key a repository passes to ask for a replica
+REPLICA_BIND_ARGUMENT = "replica"
+# `Session.info` key set once the session sent anything but a SELECT to the primary
+SESSION_WROTE_KEY = "wrote_to_primary"
+# `Session.info` key collecting the user ids written in the current transaction
+PENDING_WRITES_KEY = "pending_user_writes"
+
+
+class ReplicaSelectionStrategy:
+    ROUND_ROBIN: str = "round_robin"
+    LEAST_CONNECTIONS: str = "least_connections"
+
+
+class ReplicaRouter:
+    """
+    Picks one of the replica engines, either in turn or the one with the fewest checked-out connections.
+    """
+
+    def __init__(self, replicas: list[AsyncEngine], strategy: str = ReplicaSelectionStrategy.ROUND_ROBIN):
+        if strategy not in (ReplicaSelectionStrategy.ROUND_ROBIN, ReplicaSelectionStrategy.LEAST_CONNECTIONS):
+            raise ValueError(f"Unknown replica selection strategy `{strategy}`.")
+        self.replicas = replicas
+        self.strategy = strategy
+        self._turns = itertools.count()
+
+    def choose(self) -> Engine:
+        turn = next(self._turns)
+        if self.strategy == ReplicaSelectionStrategy.LEAST_CONNECTIONS:
+            # Ties are broken in turn so idle replicas still share the load
+            ordered = self.replicas[turn % len(self.replicas) :] + self.replicas[: turn % len(self.replicas)]
+            replica = min(ordered, key=lambda engine: engine.pool.checkedout())  # type: ignore
+        else:
+            replica = self.replicas[turn % len(self.replicas)]
+        return replica.sync_engine
+
+
+class ReadYourWritesTracker:
+    """
+    Remembers which users were written recently, so their own reads stay on the primary until replicas caught up.
+    The window is per process; pick it above the replicas' usual lag.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self._written_until: dict[int, float] = {}
+
+    def record(self, user_ids: typing.Iterable[int]) -> None:
+        now = time.monotonic()
+        self._written_until = {user_id: until for user_id, until in self._written_until.items() if until > now}
+        for user_id in user_ids:
+            self._written_until[user_id] = now + self.window
+
+    def is_recent(self, user_id: int) -> bool:
+        return self._written_until.get(user_id, 0.0) > time.monotonic()
+
+
+def pop_pending_writes(async_session: typing.Any) -> set[int]:
+    return async_session.info.pop(PENDING_WRITES_KEY, set())
+
+
+class RoutingSession(Session):
+    """
+    `Session` sending SELECTs executed with `bind_arguments={"replica": True}` to a replica and everything else,
+    flushes included, to the primary. Once the session wrote, later reads stay on the primary so the transaction
+    sees its own changes.
+    """
+
+    def __init__(self, *args: typing.Any, replica_router: ReplicaRouter | None = None, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self.replica_router = replica_router
+
+    def get_bind(  # type: ignore
+        self,
+        mapper: typing.Any = None,
+        *,
+        clause: sqlalchemy.ClauseElement | None = None,
+        **kwargs: typing.Any,
+    ) -> Engine | sqlalchemy.Connection:
+        replica_requested = kwargs.pop(REPLICA_BIND_ARGUMENT, False)
+        is_read = isinstance(clause, sqlalchemy.Select) and not self._flushing
+        if not is_read:
+            self.info[SESSION_WROTE_KEY] = True
+        elif replica_requested and self.replica_router is not None and not self.info.get(SESSION_WROTE_KEY):
+            return self.replica_router.choose()
+        return super().get_bind(mapper, clause=clause, **kwargs)
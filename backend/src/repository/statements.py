@@ -0,0 +1,151 @@
+import typing
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+from src.models.dto.base import BaseRowDTO
+from src.models.dto.onboarding import OnboardingRow
+from src.models.dto.user import UserRow
+
+# Execution option carrying the registry name, read back by the cursor event listener
+STATEMENT_NAME_OPTION = "statement_name"
+
+StatementT = typing.TypeVar("StatementT", bound=sqlalchemy.Executable)
+
+
+class StatementStats:
+    def __init__(self) -> None:
+        self.executions: int = 0
+        self.compiled_cache_hits: int = 0
+        self.prepared_cache_hits: int = 0
+
+    @property
+    def compiled_cache_hit_ratio(self) -> float:
+        return self.compiled_cache_hits / self.executions if self.executions else 0.0
+
+    @property
+    def prepared_cache_hit_ratio(self) -> float:
+        return self.prepared_cache_hits / self.executions if self.executions else 0.0
+
+
+class StatementRegistry:
+    """
+    Hot repository statements built once at import time with named `bindparam`s.
+
+    A statement object that never changes keeps its memoized cache key, so every execution is a lookup in
+    SQLAlchemy's compiled cache (no Python-side compilation) and sends the same SQL text, which asyncpg then finds
+    in its per-connection prepared statement cache (no server-side parse/plan).
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[str, StatementStats] = {}
+
+    def register(self, name: str, statement: StatementT) -> StatementT:
+        if name in self.stats:
+            raise ValueError(f"Statement `{name}` is already registered.")
+        self.stats[name] = StatementStats()
+        return statement.execution_options(**{STATEMENT_NAME_OPTION: name})  # type: ignore
+
+    def record(self, name: str, compiled_cache_hit: bool, prepared_cache_hit: bool) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            return
+        stats.executions += 1
+        stats.compiled_cache_hits += compiled_cache_hit
+        stats.prepared_cache_hits += prepared_cache_hit
+
+    def reset(self) -> None:
+        for name in self.stats:
+            self.stats[name] = StatementStats()
+
+
+statement_registry = StatementRegistry()
+
+
+def select_row_columns(table: sqlalchemy.Table, dto_type: type[BaseRowDTO]) -> list[sqlalchemy.Column]:
+    """
+    The Core columns of `table` backing `dto_type`, in `__slots__` order.
+    """
+    return [table.c[name] for name in dto_type.__slots__]
+
+
+user_table: sqlalchemy.Table = User.__table__  # type: ignore
+onboarding_table: sqlalchemy.Table = Onboarding.__table__  # type: ignore
+USER_ROW_COLUMNS = select_row_columns(user_table, UserRow)
+ONBOARDING_ROW_COLUMNS = select_row_columns(onboarding_table, OnboardingRow)
+
+USER_BY_ID = statement_registry.register(
+    "user_by_id",
+    sqlalchemy.select(User).where(User.id == sqlalchemy.bindparam("user_id"), User.deleted_at.is_(None)),
+)
+USER_EMAIL_TAKEN = statement_registry.register(
+    "user_email_taken",
+    sqlalchemy.select(User.email).where(User.email == sqlalchemy.bindparam("email")),
+)
+USER_USERNAME_TAKEN = statement_registry.register(
+    "user_username_taken",
+    sqlalchemy.select(User.username).where(User.username == sqlalchemy.bindparam("username")),
+)
+USER_ROW_BY_ID = statement_registry.register(
+    "user_row_by_id",
+    sqlalchemy.select(*USER_ROW_COLUMNS).where(
+        user_table.c.id == sqlalchemy.bindparam("user_id"), user_table.c.deleted_at.is_(None)
+    ),
+)
+ONBOARDING_ROW_BY_USER_ID = statement_registry.register(
+    "onboarding_row_by_user_id",
+    sqlalchemy.select(*ONBOARDING_ROW_COLUMNS)
+    .join(user_table, user_table.c.id == onboarding_table.c.user_id)
+    .where(onboarding_table.c.user_id == sqlalchemy.bindparam("user_id"), user_table.c.deleted_at.is_(None)),
+)
+ONBOARDING_BY_USER_ID = statement_registry.register(
+    "onboarding_by_user_id",
+    sqlalchemy.select(Onboarding)
+    .join(User, User.id == Onboarding.user_id)
+    .where(Onboarding.user_id == sqlalchemy.bindparam("user_id"), User.deleted_at.is_(None)),
+)
+
+
+def _build_onboarding_upsert() -> sqlalchemy.Executable:
+    """
+    WITH onboarded_user AS (UPDATE "user" SET is_onboarding = false WHERE id = :user_id RETURNING id)
+    INSERT INTO onboarding (...) SELECT onboarded_user.id, ... FROM onboarded_user
+    ON CONFLICT (user_id) DO UPDATE SET ... RETURNING id
+    """
+    onboarded_user = (
+        sqlalchemy.update(User)
+        .where(User.id == sqlalchemy.bindparam("user_id"), User.deleted_at.is_(None))
+        .values(is_onboarding=False)
+        .returning(User.id)
+        .cte("onboarded_user")
+    )
+    insert_stmt = postgresql.insert(Onboarding).from_select(
+        ["user_id", "primary_personality", "specific_personality", "detailed_qa"],
+        sqlalchemy.select(
+            onboarded_user.c.id,
+            sqlalchemy.bindparam("primary_personality", type_=sqlalchemy.String),
+            sqlalchemy.bindparam("specific_personality", type_=sqlalchemy.JSON),
+            sqlalchemy.bindparam("detailed_qa", type_=sqlalchemy.JSON),
+        ),
+    )
+    return (
+        insert_stmt.on_conflict_do_update(
+            index_elements=[Onboarding.user_id],
+            set_={
+                "primary_personality": insert_stmt.excluded.primary_personality,
+                "specific_personality": insert_stmt.excluded.specific_personality,
+                "detailed_qa": insert_stmt.excluded.detailed_qa,
+                "updated_at": sqlalchemy.func.now(),
+            },
+        )
+        .returning(Onboarding.id)
+        .execution_options(
+            # Parameters are bindparam values, not the rows of an ORM bulk INSERT
+            dml_strategy="raw"
+        )
+    )
+
+
+ONBOARDING_UPSERT = statement_registry.register("onboarding_upsert", _build_onboarding_upsert())
@@ -0,0 +1,59 @@
+import types
+import typing
+
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.repository.cache.base import BaseCacheBackend
+from src.repository.crud.base import BaseCRUDRepository, pop_pending_invalidations, read_your_writes
+from src.repository.routing import pop_pending_writes
+
+RepositoryT = typing.TypeVar("RepositoryT", bound=BaseCRUDRepository)
+
+
+class UnitOfWork:
+    """
+    One session and one transaction shared by every repository taking part in a request.
+
+    Repositories only flush; the unit of work commits once on a clean exit (or rolls back on an exception) and only
+    then drops the cache entries the repositories asked to invalidate and opens the read-your-writes window of the
+    users they wrote. The session checks out a connection on its
+    first statement, so a request answered from the cache never touches the pool.
+    """
+
+    def __init__(self, async_session: SQLAlchemyAsyncSession, cache: BaseCacheBackend | None = None):
+        self.async_session = async_session
+        self.cache = cache
+        self._repositories: dict[type[BaseCRUDRepository], BaseCRUDRepository] = {}
+
+    def repository(self, repo_type: type[RepositoryT]) -> RepositoryT:
+        if repo_type not in self._repositories:
+            self._repositories[repo_type] = repo_type(async_session=self.async_session, cache=self.cache)
+        return self._repositories[repo_type]  # type: ignore
+
+    async def commit(self) -> None:
+        if self.async_session.in_transaction():
+            await self.async_session.commit()
+        read_your_writes.record(pop_pending_writes(async_session=self.async_session))
+        keys = pop_pending_invalidations(async_session=self.async_session)
+        if keys and self.cache is not None:
+            await self.cache.delete_many(sorted(keys))
+
+    async def rollback(self) -> None:
+        if self.async_session.in_transaction():
+            await self.async_session.rollback()
+        pop_pending_writes(async_session=self.async_session)
+        pop_pending_invalidations(async_session=self.async_session)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -0,0 +1,147 @@
+import asyncio
+import time
+import typing
+from functools import lru_cache
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.database import SessionLocal
+from src.repository.unit_of_work import UnitOfWork
+from src.utilities.exceptions.database import WriteBufferFull
+
+
+class FeedbackBufferStats:
+    def __init__(self) -> None:
+        self.accepted: int = 0
+        self.saved: int = 0
+        self.superseded: int = 0
+        self.unknown_users: int = 0
+        self.failed: int = 0
+        self.flushes: int = 0
+
+
+class FeedbackBuffer:
+    """
+    Write-behind buffer for onboarding feedback: `submit()` only enqueues, and one background task saves whatever
+    accumulated every `flush_interval` seconds or `batch_size` items, with one `UPDATE ... FROM (VALUES ...)`.
+
+    The queue is bounded; when it is full `submit()` waits up to `enqueue_timeout` and then raises `WriteBufferFull`,
+    which pushes back on the clients instead of growing memory. Within a batch the last feedback of a user wins.
+    Feedback of a user without an onboarding row is dropped and counted, since its request was already answered.
+    """
+
+    def __init__(
+        self,
+        session_factory: typing.Callable[[], AsyncSession],
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.stats = FeedbackBufferStats()
+        self._queue: asyncio.Queue[tuple[int, str | None]] = asyncio.Queue(maxsize=max_size)
+        self._collecting: list[tuple[int, str | None]] = []
+        self._task: asyncio.Task | None = None
+        self._flushing: asyncio.Future | None = None
+
+    @property
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="feedback-write-behind")
+
+    async def submit(self, user_id: int, feedback: str | None) -> None:
+        try:
+            await asyncio.wait_for(self._queue.put((user_id, feedback)), timeout=self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            raise WriteBufferFull(f"Feedback buffer is full ({self._queue.maxsize} items).")
+        self.stats.accepted += 1
+
+    async def close(self) -> None:
+        """
+        Stop the background task, then save everything it was holding or that is still queued. Called on shutdown,
+        before the engine is disposed.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        remaining, self._collecting = self._collecting, []
+        remaining.extend(self._take_ready(limit=self._queue.qsize()))
+        for start in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[start : start + self.batch_size])
+
+    def _take_ready(self, limit: int) -> list[tuple[int, str | None]]:
+        batch: list[tuple[int, str | None]] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _collect_batch(self) -> None:
+        """
+        Block for the first item, then gather more into `_collecting` until the batch is full or `flush_interval` has
+        passed. Items live on the instance, not in a local, so a cancellation in between does not lose them.
+        """
+        self._collecting.append(await self._queue.get())
+        deadline = time.monotonic() + self.flush_interval
+        while len(self._collecting) < self.batch_size:
+            self._collecting.extend(self._take_ready(limit=self.batch_size - len(self._collecting)))
+            remaining = deadline - time.monotonic()
+            if len(self._collecting) >= self.batch_size or remaining <= 0:
+                return
+            try:
+                self._collecting.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                return
+
+    async def _run(self) -> None:
+        while True:
+            await self._collect_batch()
+            batch, self._collecting = self._collecting, []
+            # Shielded, so a shutdown mid-flush lets the statement finish; `close()` waits for it
+            self._flushing = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+
+    async def _flush(self, batch: list[tuple[int, str | None]]) -> None:
+        feedbacks = dict(batch)
+        try:
+            async with self.session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+                saved_user_ids = await unit_of_work.repository(OnboardingCRUDRepository).save_feedback_batch(
+                    feedbacks=feedbacks
+                )
+        except Exception as e:
+            self.stats.failed += len(feedbacks)
+            loguru.logger.error(f"Feedback write-behind --- dropped {len(feedbacks)} feedbacks --- {e}")
+            return
+
+        self.stats.flushes += 1
+        self.stats.saved += len(saved_user_ids)
+        self.stats.superseded += len(batch) - len(feedbacks)
+        self.stats.unknown_users += len(feedbacks) - len(saved_user_ids)
+
+
+@lru_cache()
+def get_feedback_buffer() -> FeedbackBuffer:
+    return FeedbackBuffer(
+        session_factory=SessionLocal,
+        max_size=settings.FEEDBACK_BUFFER_SIZE,
+        batch_size=settings.FEEDBACK_FLUSH_BATCH_SIZE,
+        flush_interval=settings.FEEDBACK_FLUSH_INTERVAL_MS / 1000,
+        enqueue_timeout=settings.FEEDBACK_ENQUEUE_TIMEOUT,
+    )
@@ -18,3 +18,8 @@ class UsernameAlreadyExists(Exception):
     """
     Throw an exception when the username already exist in the database.
     """
+
+class WriteBufferFull(Exception):
+    """
+    Throw an exception when a write-behind buffer stayed full for longer than the caller was willing to wait.
+    """
@@ -7,7 +7,10 @@ cannot or will not process the request due to something that is perceivedto be a
 import fastapi
 
 from src.utilities.messages.exceptions.http.exc_details import (
+    http_400_availability_details,
+    http_400_cursor_details,
     http_400_email_details,
+    http_400_fields_details,
     http_400_sigin_credentials_details,
     http_400_signup_credentials_details,
     http_400_username_details,
@@ -40,3 +43,24 @@ async def http_400_exc_bad_email_request(email: str) -> Exception:
         status_code=fastapi.status.HTTP_400_BAD_REQUEST,
         detail=http_400_email_details(email=email),
     )
+
+
+async def http_400_exc_bad_cursor_request(cursor: str) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_cursor_details(cursor=cursor),
+    )
+
+
+async def http_400_exc_bad_fields_request(fields: str) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_fields_details(fields=fields),
+    )
+
+
+async def http_400_exc_bad_availability_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_availability_details(),
+    )
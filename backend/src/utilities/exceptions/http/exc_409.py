@@ -5,7 +5,8 @@ The HTTP 404 Not Found response status code indicates that the server cannot fin
 import fastapi
 
 from src.utilities.messages.exceptions.http.exc_details import (
-    http_409_user_collision_details
+    http_409_rebuild_in_progress_details,
+    http_409_user_collision_details,
 )
 
 
@@ -14,3 +15,10 @@ async def http_409_exc_bad_user_collision_request(id: str) -> Exception:
         status_code=fastapi.status.HTTP_409_CONFLICT,
         detail=http_409_user_collision_details(id=id),
     )
+
+
+async def http_409_exc_rebuild_in_progress_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_409_CONFLICT,
+        detail=http_409_rebuild_in_progress_details(),
+    )
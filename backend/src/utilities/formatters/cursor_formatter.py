@@ -0,0 +1,20 @@
+import base64
+import datetime
+import json
+
+
+def encode_keyset_cursor(created_at: datetime.datetime, id: int) -> str:
+    raw_cursor = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(raw_cursor).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime.datetime, int]:
+    """
+    Reverse `encode_keyset_cursor`, raising `ValueError` for anything that was not produced by it.
+    """
+    try:
+        raw_cursor = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw_cursor)
+        return datetime.datetime.fromisoformat(created_at), int(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor `{cursor}`") from e
@@ -0,0 +1,67 @@
+import csv
+import datetime
+import io
+import json
+import typing
+import zlib
+
+from src.models.schemas.export import ExportFormat
+from src.utilities.formatters.datetime_formatter import format_datetime_into_isoformat
+from src.utilities.onboarding.detailed_qa import load_detailed_qa
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def format_export_value(key: str, value: typing.Any) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return format_datetime_into_isoformat(value)
+    if key == "detailed_qa":
+        return load_detailed_qa(value)
+    return value
+
+
+def format_export_record(row: typing.Any) -> dict[str, typing.Any]:
+    return {key: format_export_value(key, value) for key, value in row._mapping.items()}
+
+
+async def encode_export_rows(
+    partitions: typing.AsyncIterator[typing.Sequence[typing.Any]],
+    export_format: ExportFormat,
+    columns: list[str],
+) -> typing.AsyncIterator[bytes]:
+    """
+    Turn partitions of result rows into one encoded chunk per partition, so memory is bounded by the partition size.
+    """
+    if export_format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        writer.writeheader()
+        yield buffer.getvalue().encode()
+
+    async for partition in partitions:
+        records = [format_export_record(row) for row in partition]
+        if export_format == ExportFormat.NDJSON:
+            yield "".join(json.dumps(record) + "\n" for record in records).encode()
+        else:
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=columns)
+            for record in records:
+                writer.writerow(
+                    {
+                        key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                        for key, value in record.items()
+                    }
+                )
+            yield buffer.getvalue().encode()
+
+
+async def gzip_chunks(chunks: typing.AsyncIterator[bytes]) -> typing.AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 16 + MAX_WBITS writes a gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
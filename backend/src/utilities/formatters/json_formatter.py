@@ -0,0 +1,17 @@
+import datetime
+import typing
+
+import orjson
+
+from src.utilities.formatters.datetime_formatter import format_datetime_into_isoformat
+
+
+def encode_json_default(value: typing.Any) -> typing.Any:
+    # `OPT_PASSTHROUGH_DATETIME` hands datetimes to us, so they keep the `...Z` format of `BaseSchemaModel`
+    if isinstance(value, datetime.datetime):
+        return format_datetime_into_isoformat(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(content: typing.Any) -> bytes:
+    return orjson.dumps(content, default=encode_json_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
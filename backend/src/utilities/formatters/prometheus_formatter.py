@@ -0,0 +1,31 @@
+import typing
+
+from src.utilities.metrics.histogram import Histogram
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def format_counter(name: str, help: str, value: float) -> list[str]:
+    return [f"# HELP {name} {help}", f"# TYPE {name} counter", f"{name} {value}"]
+
+
+def format_histogram(name: str, help: str, histograms: typing.Iterable[tuple[dict[str, str], Histogram]]) -> list[str]:
+    """
+    Prometheus text exposition of one histogram family: a `_bucket` line per cumulative bound, then `_sum` and
+    `_count`, for every label set.
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+    for labels, histogram in histograms:
+        for bound, count in histogram.cumulative_buckets().items():
+            lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}")
+        lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+        lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return lines
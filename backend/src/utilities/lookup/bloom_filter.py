@@ -0,0 +1,47 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings, sized for `capacity` items at `false_positive_rate`.
+
+    `in` never misses an added item; for anything else it is wrong with roughly `false_positive_rate` probability
+    while no more than `capacity` items were added. Items cannot be removed.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        if capacity < 1:
+            raise ValueError("A Bloom filter needs a capacity of at least 1.")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("The false positive rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count: int = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher: two 64-bit halves of one digest stand in for `hash_count` independent hashes
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.bit_count for index in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def estimated_false_positive_rate(self) -> float:
+        """
+        The expected false positive rate for the number of items added so far.
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
@@ -6,6 +6,18 @@ def http_400_email_details(email: str) -> str:
     return f"The email {email} is already registered! Be creative and choose another one!"
 
 
+def http_400_cursor_details(cursor: str) -> str:
+    return f"The cursor `{cursor}` is invalid! Use the `next_cursor` value of a previous page."
+
+
+def http_400_fields_details(fields: str) -> str:
+    return f"The fields `{fields}` are invalid! Pick from the user fields, `onboarding` or `onboarding.<field>`."
+
+
+def http_400_availability_details() -> str:
+    return "Nothing to check! Pass a `username`, an `email` or both."
+
+
 def http_400_signup_credentials_details() -> str:
     return "Signup failed! Recheck all your credentials!"
 
@@ -35,3 +47,7 @@ def http_404_email_details(email: str) -> str:
 
 def http_409_user_collision_details(id: int) -> str:
     return f"Updated user with id `{id}` collides with other users"
+
+
+def http_409_rebuild_in_progress_details() -> str:
+    return "The availability filter is already being rebuilt! Try again once it is done."
@@ -0,0 +1,59 @@
+import bisect
+import threading
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of observations in seconds, with a final `+Inf` bucket for everything above the last bound.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts: list[int] = [0] * (len(self.buckets) + 1)
+            self.count: int = 0
+            self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate the `q` quantile by linear interpolation inside the bucket that holds it.
+        Values in the `+Inf` bucket are reported as the last finite bound.
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def cumulative_buckets(self) -> dict[str, int]:
+        """
+        Prometheus-style cumulative counts keyed by upper bound.
+        """
+        cumulative = 0
+        result: dict[str, int] = {}
+        for bound, bucket_count in zip((*(str(bucket) for bucket in self.buckets), "+Inf"), self.counts):
+            cumulative += bucket_count
+            result[bound] = cumulative
+        return result
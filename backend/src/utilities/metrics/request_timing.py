@@ -0,0 +1,90 @@
+import contextvars
+import threading
+
+from src.utilities.metrics.histogram import Histogram
+
+
+class RequestTimings:
+    """
+    Where the time of one request went. Filled by the engine's cursor hooks and the pool's queue while the request is
+    the current context, see `current_request_timings`.
+    """
+
+    __slots__ = ("db_time", "statements", "pool_wait")
+
+    def __init__(self) -> None:
+        self.db_time: float = 0.0
+        self.statements: int = 0
+        self.pool_wait: float = 0.0
+
+
+# `None` outside of a request (startup warm-up, jobs), so the hooks only pay for a lookup there
+current_request_timings: contextvars.ContextVar[RequestTimings | None] = contextvars.ContextVar(
+    "current_request_timings", default=None
+)
+
+
+def record_statement_time(elapsed: float) -> None:
+    timings = current_request_timings.get()
+    if timings is not None:
+        timings.db_time += elapsed
+        timings.statements += 1
+
+
+def record_pool_wait(elapsed: float) -> None:
+    timings = current_request_timings.get()
+    if timings is not None:
+        timings.pool_wait += elapsed
+
+
+STATEMENT_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+class RouteMetrics:
+    """
+    Per-route histograms of request duration, handler time (everything but database and pool wait), database time,
+    pool wait and statement count. Routes are labelled by their name, so cardinality is bounded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.duration: dict[tuple[str, str], Histogram] = {}
+            self.handler_time: dict[tuple[str, str], Histogram] = {}
+            self.db_time: dict[tuple[str, str], Histogram] = {}
+            self.pool_wait: dict[tuple[str, str], Histogram] = {}
+            self.statements: dict[tuple[str, str], Histogram] = {}
+
+    def _histograms(self, labels: tuple[str, str]) -> tuple[Histogram, ...]:
+        if labels not in self.duration:
+            with self._lock:
+                if labels not in self.duration:
+                    self.handler_time[labels] = Histogram()
+                    self.db_time[labels] = Histogram()
+                    self.pool_wait[labels] = Histogram()
+                    self.statements[labels] = Histogram(buckets=STATEMENT_COUNT_BUCKETS)
+                    # Last, since its key is what marks the set as complete
+                    self.duration[labels] = Histogram()
+        return (
+            self.duration[labels],
+            self.handler_time[labels],
+            self.db_time[labels],
+            self.pool_wait[labels],
+            self.statements[labels],
+        )
+
+    def observe(self, method: str, route: str, duration: float, timings: RequestTimings) -> None:
+        duration_histogram, handler_histogram, db_histogram, pool_histogram, statements_histogram = self._histograms(
+            (method, route)
+        )
+        duration_histogram.observe(duration)
+        handler_histogram.observe(max(duration - timings.db_time - timings.pool_wait, 0.0))
+        db_histogram.observe(timings.db_time)
+        pool_histogram.observe(timings.pool_wait)
+        statements_histogram.observe(timings.statements)
+
+
+route_metrics = RouteMetrics()
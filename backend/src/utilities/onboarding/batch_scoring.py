@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from src.models.schemas.onboarding import AnswerItem
+from src.utilities.onboarding.calculate_points import ANSWER_TYPE_WEIGHTS, PERSONALITIES
+
+# Byte value of a single-letter option -> its column, -1 for anything that is not a personality
+OPTION_INDEX = np.full(256, -1, dtype=np.int64)
+OPTION_INDEX[[ord(personality) for personality in PERSONALITIES]] = np.arange(len(PERSONALITIES))
+
+
+def compile_weight_matrix(answer_type_weights: Optional[Mapping[int, Sequence[int]]] = None) -> np.ndarray:
+    """
+    Compile the per-answer-type weights into a `(answer type, position in answer)` lookup matrix.
+    """
+    resolved_weights = ANSWER_TYPE_WEIGHTS if answer_type_weights is None else answer_type_weights
+    weight_matrix = np.zeros((max(resolved_weights) + 1, len(PERSONALITIES)), dtype=np.int64)
+    for answer_type, weights in resolved_weights.items():
+        weight_matrix[int(answer_type), : len(weights)] = weights
+    return weight_matrix
+
+
+class BatchScores:
+    def __init__(self, points: np.ndarray, percentages: np.ndarray, primary_indexes: np.ndarray):
+        self.points = points
+        self.percentages = percentages
+        self.primary_indexes = primary_indexes
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @property
+    def primary_personalities(self) -> List[str]:
+        return [PERSONALITIES[index] for index in self.primary_indexes.tolist()]
+
+    @property
+    def specific_personalities(self) -> List[Dict[str, float]]:
+        return [dict(zip(PERSONALITIES, row)) for row in self.percentages.tolist()]
+
+
+def is_valid_submission(submission: Sequence[Union[AnswerItem, Dict[str, Any]]]) -> bool:
+    """
+    Whether every option of every item is a single personality letter, i.e. `encode_submissions` accepts it.
+    """
+    for item in submission:
+        answer = item["answer"] if isinstance(item, dict) else item.answer
+        if not all(option in PERSONALITIES for option in answer):
+            return False
+    return True
+
+
+def encode_submissions(submissions: Sequence[Sequence[Union[AnswerItem, Dict[str, Any]]]]) -> np.ndarray:
+    """
+    Flatten submissions into a `(4, n_options)` array of submission index, answer type, position and option index.
+
+    Items can be `AnswerItem`s or the dicts stored in `Onboarding.detailed_qa`. Python only touches each answer
+    item once, the per-option expansion happens in NumPy.
+    """
+    items = [item for submission in submissions for item in submission]
+    if not items:
+        return np.zeros((4, 0), dtype=np.int64)
+    answer_types: List[int] = []
+    answer_lists: List[List[str]] = []
+    for item in items:
+        if isinstance(item, dict):
+            answer_types.append(item["answerType"])
+            answer_lists.append(item["answer"])
+        else:
+            answer_types.append(item.answerType)
+            answer_lists.append(item.answer)
+
+    # All single-letter options of all items land in one byte buffer, expanded per option by NumPy
+    answer_lengths = np.fromiter(map(len, answer_lists), dtype=np.int64, count=len(answer_lists))
+    answer_bytes = np.frombuffer("".join(map("".join, answer_lists)).encode("ascii"), dtype=np.uint8)
+    if len(answer_bytes) != answer_lengths.sum():
+        raise KeyError(f"Answers must be one of {PERSONALITIES}")
+    options = OPTION_INDEX[answer_bytes]
+    if (options < 0).any():
+        raise KeyError(f"Answers must be one of {PERSONALITIES}")
+
+    item_rows = np.repeat(np.arange(len(submissions)), [len(submission) for submission in submissions])
+    option_starts = np.repeat(np.cumsum(answer_lengths) - answer_lengths, answer_lengths)
+    return np.stack(
+        [
+            np.repeat(item_rows, answer_lengths),
+            np.repeat(np.asarray(answer_types, dtype=np.int64), answer_lengths),
+            np.arange(len(options)) - option_starts,
+            options,
+        ]
+    )
+
+
+def score_submissions(
+    submissions: Sequence[Sequence[Union[AnswerItem, Dict[str, Any]]]],
+    weight_matrix: Optional[np.ndarray] = None,
+) -> BatchScores:
+    """
+    Vectorized equivalent of `calculate_points` + `calculate_percentage` for many submissions at once.
+
+    Percentages use `np.round`, which can differ from the builtin `round` by 0.1 on values sitting exactly on a
+    rounding boundary after binary conversion.
+    """
+    weight_matrix = compile_weight_matrix() if weight_matrix is None else weight_matrix
+    n_submissions, n_personalities = len(submissions), len(PERSONALITIES)
+    rows, answer_types, positions, options = encode_submissions(submissions)
+
+    known = (answer_types >= 0) & (answer_types < weight_matrix.shape[0]) & (positions < weight_matrix.shape[1])
+    weights = weight_matrix[answer_types[known], positions[known]]
+    points = (
+        np.bincount(
+            rows[known] * n_personalities + options[known],
+            weights=weights,
+            minlength=n_submissions * n_personalities,
+        )
+        .astype(np.int64)
+        .reshape(n_submissions, n_personalities)
+    )
+
+    totals = points.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = np.where(totals > 0, np.round((points / totals) * 100, 1), 0.0)
+    return BatchScores(points=points, percentages=percentages, primary_indexes=points.argmax(axis=1))
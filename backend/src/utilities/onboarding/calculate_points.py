@@ -1,27 +1,35 @@
-from typing import Dict, List
-from enum import Enum
+from enum import IntEnum
+from typing import Dict, List, Mapping, Sequence
 
 from src.models.schemas.onboarding import AnswerItem
 
+
 # Define an Enum for answer types
-class AnswerType(Enum):
+class AnswerType(IntEnum):
     single = 0
     tie = 1
     rank = 2
 
+
+PERSONALITIES = ("A", "B", "C", "D")
+
+# Points given to the option at each position of `AnswerItem.answer`, per answer type
+ANSWER_TYPE_WEIGHTS: Mapping[int, Sequence[int]] = {
+    AnswerType.single: [6, 6, 6, 6],
+    AnswerType.tie: [3, 3, 3, 3],
+    AnswerType.rank: [4, 2, 0, 0],
+}
+
+
 # Function to calculate points
 def calculate_points(answers: List[AnswerItem]) -> Dict[str, int]:
-    points = {'A': 0, 'B': 0, 'C': 0, 'D': 0}
-    
+    points = {personality: 0 for personality in PERSONALITIES}
+
     for item in answers:
-        if item.answerType == AnswerType.single:
-            for ans in item.answer:
-                points[ans] += 6
-        elif item.answerType == AnswerType.tie:
-            for ans in item.answer:
-                points[ans] += 3
-        elif item.answerType == AnswerType.rank:
-            points[item.answer[0]] += 4
-            points[item.answer[1]] += 2
-    
-    return points
\ No newline at end of file
+        weights = ANSWER_TYPE_WEIGHTS.get(item.answerType)
+        if weights is None:
+            continue
+        for position, ans in enumerate(item.answer[: len(weights)]):
+            points[ans] += weights[position]
+
+    return points
@@ -0,0 +1,11 @@
+import json
+from typing import Dict, List, Union
+
+
+def load_detailed_qa(detailed_qa: Union[str, List[Dict], None]) -> List[Dict]:
+    # `detailed_qa` has been stored both as a JSON array and as a JSON-encoded string of that array
+    if detailed_qa is None:
+        return []
+    if isinstance(detailed_qa, str):
+        return json.loads(detailed_qa)
+    return detailed_qa
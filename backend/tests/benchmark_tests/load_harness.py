@@ -0,0 +1,267 @@
+"""
+In-process load test of the API routes: the app runs behind `httpx.ASGITransport` against the local test database,
+and every route gets `concurrency` asyncio workers sharing a fixed number of requests.
+
+Reports are plain JSON so runs can be compared across commits:
+
+    pytest tests/benchmark_tests/test_api_load_benchmark.py --benchmark --numprocesses=0 --no-cov \
+        --benchmark-output=load-<commit>.json
+    python -m tests.benchmark_tests.load_harness load-<old>.json load-<new>.json
+"""
+
+import asyncio
+import dataclasses
+import datetime
+import itertools
+import json
+import pathlib
+import random
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import httpx
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+
+PERSONALITIES = ("A", "B", "C", "D")
+
+
+@dataclasses.dataclass(frozen=True)
+class SeedData:
+    user_ids: list[int]
+    onboarded_user_ids: list[int]
+
+    @property
+    def not_onboarded_user_ids(self) -> list[int]:
+        onboarded = set(self.onboarded_user_ids)
+        return [user_id for user_id in self.user_ids if user_id not in onboarded]
+
+
+async def seed_database(
+    async_session: SQLAlchemyAsyncSession, users: int, onboarded_ratio: float = 0.5, seed: int = 0
+) -> SeedData:
+    """
+    Insert `users` deterministic users, and an onboarding row for `onboarded_ratio` of them, with one statement each.
+    """
+    rng = random.Random(seed)
+    user_rows = [
+        {
+            "email": f"load{idx}@example.com",
+            "username": f"load{idx}",
+            "first_name": rng.choice(("Ada", "Grace", "Linus", "Barbara", None)),
+            "last_name": rng.choice(("Lovelace", "Hopper", "Torvalds", "Liskov", None)),
+            "roles": rng.randrange(3),
+            "is_onboarding": True,
+        }
+        for idx in range(users)
+    ]
+    user_ids = list(await async_session.scalars(sqlalchemy.insert(User).returning(User.id), user_rows))
+
+    onboarded_user_ids = rng.sample(user_ids, k=int(users * onboarded_ratio))
+    if onboarded_user_ids:
+        onboarding_rows = []
+        for user_id in onboarded_user_ids:
+            primary = rng.choice(PERSONALITIES)
+            onboarding_rows.append(
+                {
+                    "user_id": user_id,
+                    "primary_personality": primary,
+                    "specific_personality": {name: 100.0 if name == primary else 0.0 for name in PERSONALITIES},
+                    "detailed_qa": [{"questionNumber": 1, "answer": [primary], "answerType": 0}],
+                }
+            )
+        await async_session.execute(sqlalchemy.insert(Onboarding), onboarding_rows)
+        await async_session.execute(
+            sqlalchemy.update(User).where(User.id.in_(onboarded_user_ids)).values(is_onboarding=False)
+        )
+    await async_session.commit()
+    return SeedData(user_ids=user_ids, onboarded_user_ids=onboarded_user_ids)
+
+
+@dataclasses.dataclass(frozen=True)
+class RouteScenario:
+    """
+    One route under load. `build_request(idx)` returns the `(url, json body)` of the `idx`-th request.
+    """
+
+    name: str
+    method: str
+    build_request: typing.Callable[[int], tuple[str, dict | None]]
+    expected_status: int = 200
+
+
+def build_route_scenarios(seed_data: SeedData) -> list[RouteScenario]:
+    """
+    A scenario per route of `src/api/routes/user.py` and `src/api/routes/onboarding.py`.
+
+    Answers and feedback go to users that already have an onboarding row, and deletes to users that do not, since
+    `onboarding.user_id` has no `ON DELETE CASCADE`. Each delete targets a different user, so a run needs more
+    not-onboarded users than requests per scenario.
+    """
+    user_ids = seed_data.user_ids
+    onboarded_user_ids = seed_data.onboarded_user_ids
+    deletable_user_ids = seed_data.not_onboarded_user_ids
+    created = itertools.count()
+
+    def create_user(idx: int) -> tuple[str, dict]:
+        number = next(created)
+        return "/api/users", {
+            "email": f"new{number}@example.com",
+            "username": f"new{number}",
+            "first_name": None,
+            "last_name": None,
+            "roles": 0,
+        }
+
+    def submit_answers(idx: int) -> tuple[str, dict]:
+        answer = PERSONALITIES[idx % len(PERSONALITIES)]
+        return "/api/onboarding/submit-answers", {
+            "userId": onboarded_user_ids[idx % len(onboarded_user_ids)],
+            "items": [{"questionNumber": 1, "answer": [answer], "answerType": 0}],
+        }
+
+    return [
+        RouteScenario("users:create-user", "POST", create_user, expected_status=201),
+        RouteScenario("users:get-user", "GET", lambda idx: (f"/api/users/{user_ids[idx % len(user_ids)]}", None)),
+        RouteScenario(
+            "users:get-user-profile", "GET", lambda idx: (f"/api/users/{user_ids[idx % len(user_ids)]}/profile", None)
+        ),
+        RouteScenario("users:list-users", "GET", lambda idx: ("/api/users?limit=50", None)),
+        RouteScenario(
+            "users:update-user",
+            "PUT",
+            lambda idx: (f"/api/users/{user_ids[idx % len(user_ids)]}", {"first_name": f"Renamed{idx}"}),
+        ),
+        RouteScenario("onboarding:create-onboarding", "POST", submit_answers),
+        RouteScenario(
+            "onboarding:save-feedback",
+            "POST",
+            lambda idx: (
+                "/api/onboarding/save-feedback",
+                {"userId": onboarded_user_ids[idx % len(onboarded_user_ids)], "feedback": f"Feedback {idx}"},
+            ),
+        ),
+        RouteScenario(
+            "users:delete-user",
+            "DELETE",
+            lambda idx: (f"/api/users/{deletable_user_ids[idx]}", None),
+            expected_status=204,
+        ),
+    ]
+
+
+@dataclasses.dataclass(frozen=True)
+class RouteReport:
+    name: str
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def summarize(name: str, latencies: list[float], errors: int, elapsed: float) -> RouteReport:
+    """
+    Throughput in requests/sec and latency percentiles in milliseconds, computed from the raw samples.
+    """
+    cut_points = statistics.quantiles(latencies, n=100, method="inclusive")
+    return RouteReport(
+        name=name,
+        requests=len(latencies),
+        errors=errors,
+        throughput=round(len(latencies) / elapsed, 1),
+        p50_ms=round(cut_points[49] * 1000, 3),
+        p95_ms=round(cut_points[94] * 1000, 3),
+        p99_ms=round(cut_points[98] * 1000, 3),
+        max_ms=round(max(latencies) * 1000, 3),
+    )
+
+
+async def run_scenario(
+    async_client: httpx.AsyncClient, scenario: RouteScenario, requests: int, concurrency: int
+) -> RouteReport:
+    """
+    Send `requests` requests with `concurrency` workers pulling the next request index from a shared counter.
+    """
+    latencies: list[float] = []
+    errors = 0
+    indexes = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for idx in indexes:
+            url, body = scenario.build_request(idx)
+            started = time.perf_counter()
+            response = await async_client.request(scenario.method, url, json=body)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != scenario.expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(scenario.name, latencies, errors, time.perf_counter() - started)
+
+
+def current_commit() -> str | None:
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL)
+        return commit.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(reports: list[RouteReport], **parameters: typing.Any) -> dict[str, typing.Any]:
+    return {
+        "commit": current_commit(),
+        "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "parameters": parameters,
+        "routes": {report.name: dataclasses.asdict(report) for report in reports},
+    }
+
+
+def format_report(report: dict[str, typing.Any]) -> str:
+    lines = [f"{'route':<30} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}"]
+    for name, route in report["routes"].items():
+        lines.append(
+            f"{name:<30} {route['throughput']:>9,.1f} {route['p50_ms']:>8.2f} {route['p95_ms']:>8.2f}"
+            f" {route['p99_ms']:>8.2f} {route['errors']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def compare_reports(baseline: dict[str, typing.Any], candidate: dict[str, typing.Any]) -> str:
+    """
+    Per-route relative change of throughput and p95/p99 latency between two saved reports.
+    """
+    lines = [
+        f"{baseline.get('commit')} -> {candidate.get('commit')}",
+        f"{'route':<30} {'req/s':>9} {'p95':>9} {'p99':>9}",
+    ]
+    for name, route in candidate["routes"].items():
+        before = baseline["routes"].get(name)
+        if before is None:
+            lines.append(f"{name:<30} {'new':>9}")
+            continue
+        changes = (
+            (route[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            for key in ("throughput", "p95_ms", "p99_ms")
+        )
+        lines.append(f"{name:<30} " + " ".join(f"{change:>+8.1f}%" for change in changes))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    baseline_path, candidate_path = sys.argv[1:3]
+    print(
+        compare_reports(
+            json.loads(pathlib.Path(baseline_path).read_text()), json.loads(pathlib.Path(candidate_path).read_text())
+        )
+    )
@@ -0,0 +1,38 @@
+import json
+import pathlib
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from tests.benchmark_tests.load_harness import (
+    build_report,
+    build_route_scenarios,
+    format_report,
+    run_scenario,
+    seed_database,
+)
+
+SEED_USERS = 2000
+REQUESTS_PER_ROUTE = 500
+CONCURRENCY = 10
+
+
+@pytest.mark.benchmark
+async def test_benchmark_api_routes_under_load(
+    async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession, request: pytest.FixtureRequest
+) -> None:
+    seed_data = await seed_database(async_session, users=SEED_USERS)
+
+    reports = [
+        await run_scenario(async_client, scenario, requests=REQUESTS_PER_ROUTE, concurrency=CONCURRENCY)
+        for scenario in build_route_scenarios(seed_data)
+    ]
+
+    report = build_report(
+        reports, seed_users=SEED_USERS, requests_per_route=REQUESTS_PER_ROUTE, concurrency=CONCURRENCY
+    )
+    print("\n" + format_report(report))
+    if output := request.config.getoption("--benchmark-output"):
+        pathlib.Path(output).write_text(json.dumps(report, indent=2))
+    assert all(route.errors == 0 for route in reports), [route for route in reports if route.errors]
@@ -0,0 +1,58 @@
+import json
+import os
+import random
+import time
+
+import pytest
+
+from src.models.schemas.onboarding import AnswerItem
+from src.utilities.onboarding.batch_scoring import score_submissions
+from src.utilities.onboarding.calculate_percentage import calculate_percentage
+from src.utilities.onboarding.calculate_points import calculate_points
+from src.utilities.onboarding.detailed_qa import load_detailed_qa
+
+BENCHMARK_ROWS = int(os.environ.get("BENCHMARK_ROWS", 1_000_000))
+SCALAR_SAMPLE_ROWS = 50_000
+
+
+def build_stored_detailed_qa(n_rows: int, n_questions: int = 12) -> list[str]:
+    rng = random.Random(7)
+    answers = {0: [["A"], ["B"], ["C"], ["D"]], 1: [["A", "B"], ["C", "D"]], 2: [["A", "C"], ["D", "B"]]}
+    rows = []
+    for _ in range(n_rows):
+        items = []
+        for question_number in range(n_questions):
+            answer_type = rng.randrange(3)
+            items.append(
+                {
+                    "questionNumber": question_number,
+                    "answer": rng.choice(answers[answer_type]),
+                    "answerType": answer_type,
+                }
+            )
+        rows.append(json.dumps(items))
+    return rows
+
+
+@pytest.mark.benchmark
+def test_benchmark_batch_scoring_of_stored_rows() -> None:
+    stored_rows = build_stored_detailed_qa(n_rows=BENCHMARK_ROWS)
+
+    started = time.perf_counter()
+    submissions = [load_detailed_qa(row) for row in stored_rows]
+    decoded = time.perf_counter()
+    scores = score_submissions(submissions)
+    scored = time.perf_counter()
+
+    sample = [[AnswerItem(**item) for item in items] for items in submissions[:SCALAR_SAMPLE_ROWS]]
+    scalar_started = time.perf_counter()
+    for items in sample:
+        calculate_percentage(calculate_points(items))
+    scalar_elapsed = time.perf_counter() - scalar_started
+
+    print(
+        f"\n{len(scores)} rows --- decode {decoded - started:.2f}s, batch score {scored - decoded:.2f}s "
+        f"({len(scores) / (scored - decoded):,.0f} rows/s), "
+        f"scalar {len(sample) / scalar_elapsed:,.0f} rows/s on {len(sample)} rows"
+    )
+    assert len(scores) == BENCHMARK_ROWS
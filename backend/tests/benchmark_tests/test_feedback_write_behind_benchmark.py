@@ -0,0 +1,80 @@
+import contextlib
+import typing
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.main import backend_app
+from src.repository.write_behind import FeedbackBuffer, get_feedback_buffer
+from tests.benchmark_tests.load_harness import RouteScenario, run_scenario, seed_database
+
+BURST = 2000
+CONCURRENCY = 50
+
+
+@contextlib.contextmanager
+def count_statements(async_engine: SQLAlchemyAsyncEngine) -> typing.Iterator[list[int]]:
+    counter = [0]
+
+    def count_statement(*args: typing.Any) -> None:
+        counter[0] += 1
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        yield counter
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_feedback_write_behind_under_burst(
+    async_client: httpx.AsyncClient,
+    async_engine: SQLAlchemyAsyncEngine,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seed_data = await seed_database(async_session, users=1000, onboarded_ratio=1.0)
+    user_ids = seed_data.onboarded_user_ids
+
+    def build_scenario(expected_status: int) -> RouteScenario:
+        return RouteScenario(
+            "onboarding:save-feedback",
+            "POST",
+            lambda idx: (
+                "/api/onboarding/save-feedback",
+                {"userId": user_ids[idx % len(user_ids)], "feedback": f"Feedback {idx}"},
+            ),
+            expected_status=expected_status,
+        )
+
+    with count_statements(async_engine) as direct_statements:
+        direct = await run_scenario(async_client, build_scenario(200), requests=BURST, concurrency=CONCURRENCY)
+
+    feedback_buffer = FeedbackBuffer(
+        session_factory=async_session_factory, max_size=10000, batch_size=500, flush_interval=0.2, enqueue_timeout=1
+    )
+    feedback_buffer.start()
+    monkeypatch.setattr("src.api.routes.onboarding.settings.IS_FEEDBACK_WRITE_BEHIND_ENABLED", True)
+    backend_app.dependency_overrides[get_feedback_buffer] = lambda: feedback_buffer
+    with count_statements(async_engine) as buffered_statements:
+        buffered = await run_scenario(async_client, build_scenario(202), requests=BURST, concurrency=CONCURRENCY)
+        await feedback_buffer.close()
+
+    for label, report, (statements,) in (
+        ("direct", direct, direct_statements),
+        ("write-behind", buffered, buffered_statements),
+    ):
+        print(
+            f"\n{label:>12}: {report.throughput:,.0f} req/s, p99 {report.p99_ms:.1f} ms, "
+            f"{statements} statements for {BURST} feedbacks"
+        )
+    assert feedback_buffer.stats.saved + feedback_buffer.stats.superseded == BURST
+    assert buffered.p99_ms < direct.p99_ms
+    assert buffered_statements[0] < direct_statements[0] / 10
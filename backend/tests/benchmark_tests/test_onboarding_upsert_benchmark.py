@@ -0,0 +1,113 @@
+import json
+import time
+import typing
+
+import pytest
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+from src.models.schemas.onboarding import AnswerItem, OnboardingRequest
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.unit_of_work import UnitOfWork
+
+ITERATIONS = 200
+
+
+async def legacy_create_or_update_onboarding(
+    session: SQLAlchemyAsyncSession, onboarding_create: OnboardingRequest
+) -> None:
+    """
+    The SELECT / add-or-update / SELECT user / commit / refresh flow the upsert replaced, kept for comparison.
+    """
+    result = await session.execute(sqlalchemy.select(Onboarding).where(Onboarding.user_id == onboarding_create.userId))
+    existing_onboarding = result.scalars().first()
+    # The legacy flow stored the answers as a JSON string
+    detailed_qa_serialized: typing.Any = json.dumps([item.__dict__ for item in onboarding_create.items])
+    new_onboarding = None
+    if existing_onboarding:
+        existing_onboarding.primary_personality = onboarding_create.primaryPersonality
+        existing_onboarding.specific_personality = onboarding_create.specificPersonality
+        existing_onboarding.detailed_qa = detailed_qa_serialized
+    else:
+        new_onboarding = Onboarding(
+            user_id=onboarding_create.userId,
+            primary_personality=onboarding_create.primaryPersonality,
+            specific_personality=onboarding_create.specificPersonality,
+            detailed_qa=detailed_qa_serialized,
+        )
+        session.add(new_onboarding)
+    user = (await session.execute(sqlalchemy.select(User).where(User.id == onboarding_create.userId))).scalar_one()
+    user.is_onboarding = False
+    await session.commit()
+    if new_onboarding:
+        await session.refresh(new_onboarding)
+
+
+async def measure(
+    async_engine: SQLAlchemyAsyncEngine,
+    submit: typing.Callable[[OnboardingRequest], typing.Awaitable[None]],
+    user_ids: list[int],
+) -> tuple[float, float]:
+    statements = 0
+
+    def count_statement(*args: typing.Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    started = time.perf_counter()
+    for user_id in user_ids:
+        onboarding_create = OnboardingRequest(
+            userId=user_id, items=[AnswerItem(questionNumber=1, answer=["A"], answerType=0)]
+        )
+        # Set after validation, like the submit-answers route does
+        onboarding_create.primaryPersonality = "A"
+        onboarding_create.specificPersonality = {"A": 100.0, "B": 0.0, "C": 0.0, "D": 0.0}
+        await submit(onboarding_create)
+    elapsed = time.perf_counter() - started
+    event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    return statements / len(user_ids), elapsed / len(user_ids) * 1000
+
+
+@pytest.mark.benchmark
+async def test_benchmark_onboarding_upsert_round_trips(
+    async_engine: SQLAlchemyAsyncEngine,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    async with async_session_factory() as session:
+        await session.execute(
+            sqlalchemy.insert(User),
+            [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(ITERATIONS)],
+        )
+        await session.commit()
+        user_ids = list((await session.scalars(sqlalchemy.select(User.id).order_by(User.id))).all())
+
+    async def legacy(onboarding_create: OnboardingRequest) -> None:
+        async with async_session_factory() as session:
+            await legacy_create_or_update_onboarding(session=session, onboarding_create=onboarding_create)
+
+    async def upsert(onboarding_create: OnboardingRequest) -> None:
+        async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            await unit_of_work.repository(OnboardingCRUDRepository).create_or_update_onboarding(onboarding_create)
+
+    legacy_inserts = await measure(async_engine, legacy, user_ids[: ITERATIONS // 2])
+    legacy_updates = await measure(async_engine, legacy, user_ids[: ITERATIONS // 2])
+    upsert_inserts = await measure(async_engine, upsert, user_ids[ITERATIONS // 2 :])
+    upsert_updates = await measure(async_engine, upsert, user_ids[ITERATIONS // 2 :])
+
+    for label, (statements, latency_ms) in {
+        "legacy insert": legacy_inserts,
+        "legacy update": legacy_updates,
+        "upsert insert": upsert_inserts,
+        "upsert update": upsert_updates,
+    }.items():
+        print(f"\n{label:>14}: {statements:.1f} statements/call, {latency_ms:.2f} ms/call")
+    assert upsert_inserts[0] == upsert_updates[0] == 1
+    assert legacy_inserts[0] > upsert_inserts[0]
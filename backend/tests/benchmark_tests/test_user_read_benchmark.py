@@ -0,0 +1,133 @@
+import datetime
+import json
+import time
+import typing
+
+import fastapi
+import httpx
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.api.dependencies.repository import get_repository
+from src.models.db.user import User
+from src.models.schemas.user import UserInResponse
+from src.repository.cache.base import build_user_cache_key
+from src.repository.cache.manager import get_cache
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.crud.user import UserCRUDRepository
+from src.utilities.formatters.json_formatter import dumps_json
+
+REQUESTS = 2000
+
+
+def build_legacy_app() -> fastapi.FastAPI:
+    """
+    `GET /users/{id}` as it was: a hand-built `UserInResponse`, re-validated through `response_model` and encoded
+    by the stdlib `json` module.
+    """
+    app = fastapi.FastAPI()
+
+    @app.get("/api/users/{user_id}", response_model=UserInResponse)
+    async def get_user(
+        user_id: int,
+        user_repo: UserCRUDRepository = fastapi.Depends(get_repository(repo_type=UserCRUDRepository)),
+    ) -> UserInResponse:
+        user = await user_repo.get_user_by_id(user_id=user_id)
+        return UserInResponse(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            auth_id=user.auth_id,
+            is_onboarding=user.is_onboarding,
+            is_active=user.is_active,
+            is_logged_in=user.is_logged_in,
+            last_login=user.last_login,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    return app
+
+
+async def requests_per_second(app: fastapi.FastAPI, url: str) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        assert (await client.get(url)).status_code == 200
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get(url)
+        return REQUESTS / (time.perf_counter() - started)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_get_user_requests_per_second(
+    async_client: httpx.AsyncClient,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    cache: InMemoryCacheBackend,
+    user_payload: typing.Callable[..., dict],
+) -> None:
+    user_id = (await async_client.post("/api/users", json=user_payload(first_name="Ada"))).json()["id"]
+    url = f"/api/users/{user_id}"
+    current_app = async_client._transport.app  # type: ignore
+
+    legacy_app = build_legacy_app()
+    legacy_app.dependency_overrides = current_app.dependency_overrides
+    legacy = await requests_per_second(legacy_app, url)
+
+    # Same database round trip on every request as the legacy route: drop the entry before each call
+    class NoCache(InMemoryCacheBackend):
+        async def get(self, key: str) -> str | None:
+            return None
+
+    no_cache = NoCache(default_ttl=60, max_entries=1)
+    current_app.dependency_overrides[get_cache] = lambda: no_cache
+    uncached = await requests_per_second(current_app, url)
+
+    current_app.dependency_overrides[get_cache] = lambda: cache
+    await cache.delete(build_user_cache_key(user_id=user_id))
+    cached = await requests_per_second(current_app, url)
+
+    print(f"\n  legacy GET /users/{{id}}: {legacy:,.0f} req/s")
+    print(f"uncached GET /users/{{id}}: {uncached:,.0f} req/s")
+    print(f"  cached GET /users/{{id}}: {cached:,.0f} req/s")
+    assert cached > legacy
+
+
+@pytest.mark.benchmark
+def test_benchmark_user_serialization() -> None:
+    user = User(
+        id=1,
+        email="a@example.com",
+        username="a",
+        first_name="Ada",
+        last_name=None,
+        auth_id=None,
+        is_onboarding=True,
+        is_active=False,
+        is_logged_in=False,
+        last_login=datetime.datetime.now(tz=datetime.timezone.utc),
+        created_at=datetime.datetime.now(tz=datetime.timezone.utc),
+        updated_at=None,
+    )
+
+    def legacy() -> bytes:
+        built = UserInResponse(**{name: getattr(user, name) for name in UserInResponse.model_fields})
+        revalidated = UserInResponse.model_validate(built)  # `response_model` check
+        return json.dumps(jsonable_encoder(revalidated), separators=(",", ":")).encode()
+
+    def current() -> bytes:
+        return dumps_json(UserInResponse.model_validate(user).model_dump())
+
+    timings = {}
+    for label, serialize in {"legacy": legacy, "current": current}.items():
+        started = time.perf_counter()
+        for _ in range(REQUESTS * 10):
+            serialize()
+        timings[label] = (time.perf_counter() - started) / (REQUESTS * 10) * 1e6
+        print(f"\n{label:>7} serialization: {timings[label]:.1f} us/response")
+    assert timings["current"] < timings["legacy"]
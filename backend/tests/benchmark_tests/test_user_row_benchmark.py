@@ -0,0 +1,54 @@
+import time
+import tracemalloc
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.user import User
+from src.models.dto.user import UserRow
+from src.repository.crud.user import UserCRUDRepository
+
+USERS = 1000
+
+
+async def measure(read_page) -> tuple[float, int]:
+    """
+    Rows/sec of loading every seeded user, and the bytes still allocated while the page is held.
+    """
+    await read_page()
+    tracemalloc.start()
+    started = time.perf_counter()
+    page = await read_page()
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(page) == USERS
+    return USERS / elapsed, retained
+
+
+@pytest.mark.benchmark
+async def test_benchmark_core_rows_against_orm_entities(async_session: SQLAlchemyAsyncSession) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "first_name": "Ada"} for idx in range(USERS)],
+    )
+    await async_session.commit()
+    user_repo = UserCRUDRepository(async_session=async_session)
+
+    # Entities stay in the identity map until the session closes, which is part of what the ORM path costs
+    async def orm_page() -> list[User]:
+        async_session.expunge_all()
+        return list((await async_session.scalars(sqlalchemy.select(User).order_by(User.id))).all())
+
+    async def core_page() -> list[UserRow]:
+        async_session.expunge_all()
+        return await user_repo.list_users(limit=USERS - 1)
+
+    orm_rate, orm_bytes = await measure(orm_page)
+    core_rate, core_bytes = await measure(core_page)
+
+    print(f"\n        ORM entities: {orm_rate:,.0f} rows/s, {orm_bytes / USERS:,.0f} B/row retained")
+    print(f"Core rows, __slots__: {core_rate:,.0f} rows/s, {core_bytes / USERS:,.0f} B/row retained")
+    assert core_bytes < orm_bytes
+    assert core_rate > orm_rate
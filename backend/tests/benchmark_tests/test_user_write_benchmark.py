@@ -0,0 +1,110 @@
+import functools
+import time
+import typing
+
+import pytest
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.models.db.user import User
+from src.models.schemas.user import UserInCreate, UserInUpdate
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.unit_of_work import UnitOfWork
+
+ITERATIONS = 200
+
+
+async def legacy_create_user(session: SQLAlchemyAsyncSession, user_create: UserInCreate) -> User:
+    """
+    The add / commit / refresh flow `create_user` replaced, kept for comparison.
+    """
+    new_user = User(**user_create.dict())
+    session.add(instance=new_user)
+    await session.commit()
+    await session.refresh(instance=new_user)
+    return new_user
+
+
+async def legacy_update_user(session: SQLAlchemyAsyncSession, user_id: int, user_update: UserInUpdate) -> User:
+    """
+    The SELECT / setattr / commit / refresh flow `update_user` replaced, kept for comparison.
+    """
+    user = (await session.execute(sqlalchemy.select(User).where(User.id == user_id))).scalar_one()
+    for key, value in user_update.dict(exclude_unset=True).items():
+        setattr(user, key, value)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+async def measure(
+    async_engine: SQLAlchemyAsyncEngine, calls: list[typing.Callable[[], typing.Awaitable[typing.Any]]]
+) -> tuple[float, float]:
+    statements = 0
+
+    def count_statement(*args: typing.Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    started = time.perf_counter()
+    for call in calls:
+        await call()
+    elapsed = time.perf_counter() - started
+    event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    return statements / len(calls), elapsed / len(calls) * 1000
+
+
+@pytest.mark.benchmark
+async def test_benchmark_user_write_round_trips(
+    async_engine: SQLAlchemyAsyncEngine,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    build_user: typing.Callable[..., UserInCreate],
+) -> None:
+    legacy_ids: list[int] = []
+    returning_ids: list[int] = []
+
+    async def legacy_create(idx: int) -> None:
+        async with async_session_factory() as session:
+            legacy_ids.append((await legacy_create_user(session=session, user_create=build_user(idx))).id)
+
+    async def returning_create(idx: int) -> None:
+        async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            new_user = await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(idx))
+        returning_ids.append(new_user.id)
+
+    async def legacy_update(user_id: int) -> None:
+        async with async_session_factory() as session:
+            await legacy_update_user(session=session, user_id=user_id, user_update=UserInUpdate(first_name="Ada"))
+
+    async def returning_update(user_id: int) -> None:
+        async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            await unit_of_work.repository(UserCRUDRepository).update_user(
+                user_id=user_id, user_update=UserInUpdate(first_name="Ada")
+            )
+
+    results = {
+        "legacy create": await measure(
+            async_engine, [functools.partial(legacy_create, idx) for idx in range(ITERATIONS)]
+        ),
+        "returning create": await measure(
+            async_engine, [functools.partial(returning_create, idx) for idx in range(ITERATIONS, 2 * ITERATIONS)]
+        ),
+    }
+    results["legacy update"] = await measure(
+        async_engine, [functools.partial(legacy_update, user_id) for user_id in legacy_ids]
+    )
+    results["returning update"] = await measure(
+        async_engine, [functools.partial(returning_update, user_id) for user_id in returning_ids]
+    )
+
+    for label, (statements, latency_ms) in results.items():
+        print(f"\n{label:>16}: {statements:.1f} statements/call, {latency_ms:.2f} ms/call")
+    assert results["returning create"][0] == results["returning update"][0] == 1
+    assert results["legacy create"][0] > results["returning create"][0]
+    assert results["legacy update"][0] > results["returning update"][0]
@@ -0,0 +1,165 @@
+import contextlib
+import typing
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+    create_async_engine,
+)
+
+from src.config.manager import settings
+from src.main import backend_app
+from src.models.db.user import User  # noqa: F401 -- registers every table on `Base.metadata`
+from src.models.schemas.user import UserInCreate
+from src.repository.cache.manager import get_cache
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.database import get_session
+from src.repository.diagnostics import query_log_scope, QueryLog, register_query_detector_event_listeners
+from src.repository.table import Base
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmark", action="store_true", default=False, help="Run the `benchmark` marked tests.")
+    parser.addoption("--benchmark-output", default=None, help="Write the API load test report to this JSON file.")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with `--benchmark`.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture
+async def async_engine(worker_id: str) -> typing.AsyncGenerator[SQLAlchemyAsyncEngine, None]:
+    """
+    An engine bound to a throwaway schema, so every `pytest-xdist` worker gets its own set of tables.
+    """
+    schema = f"test_{worker_id}"
+    engine = create_async_engine(
+        url=settings.DB_ASYNC_URL,
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(sqlalchemy.text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            await connection.execute(sqlalchemy.text(f"CREATE SCHEMA {schema}"))
+            await connection.run_sync(Base.metadata.create_all)
+    except (OSError, DBAPIError) as e:
+        await engine.dispose()
+        pytest.skip(f"Database at `DB_ASYNC_URL` is not reachable: {e}")
+
+    yield engine
+
+    async with engine.begin() as connection:
+        await connection.execute(sqlalchemy.text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    await engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(
+    async_engine: SQLAlchemyAsyncEngine,
+) -> sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession]:
+    return sqlalchemy_async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+async def async_session(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> typing.AsyncGenerator[SQLAlchemyAsyncSession, None]:
+    async with async_session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def cache() -> InMemoryCacheBackend:
+    return InMemoryCacheBackend(default_ttl=60, max_entries=100)
+
+
+@pytest.fixture
+async def async_client(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    cache: InMemoryCacheBackend,
+) -> typing.AsyncGenerator[httpx.AsyncClient, None]:
+    async def _get_test_session() -> typing.AsyncGenerator[SQLAlchemyAsyncSession, None]:
+        async with async_session_factory() as session:
+            yield session
+
+    backend_app.dependency_overrides[get_session] = _get_test_session
+    backend_app.dependency_overrides[get_cache] = lambda: cache
+    transport = httpx.ASGITransport(app=backend_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+    backend_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def user_payload() -> typing.Callable[..., dict[str, typing.Any]]:
+    """
+    `user_payload("a", first_name="Ada")` is the `POST /api/users` body of user `a` with `a@example.com`.
+    """
+
+    def build_user_payload(name: str = "a", **overrides: typing.Any) -> dict[str, typing.Any]:
+        payload = {"email": f"{name}@example.com", "username": name, "first_name": None, "last_name": None, "roles": 0}
+        payload.update(overrides)
+        return payload
+
+    return build_user_payload
+
+
+@pytest.fixture
+def build_user(
+    user_payload: typing.Callable[..., dict[str, typing.Any]],
+) -> typing.Callable[..., UserInCreate]:
+    """
+    `build_user(3)` is the `UserInCreate` of `user3` with `user3@example.com`, for repository level tests.
+    """
+
+    def build_user_in_create(idx: int, **overrides: typing.Any) -> UserInCreate:
+        return UserInCreate(**user_payload(f"user{idx}", **overrides))
+
+    return build_user_in_create
+
+
+@pytest.fixture
+def build_submission() -> typing.Callable[[int, str], dict[str, typing.Any]]:
+    """
+    `build_submission(user_id, "B")` is a one-question `POST /api/onboarding/submit-answers` body answering `B`.
+    """
+
+    def build_single_answer_submission(user_id: int, answer: str) -> dict[str, typing.Any]:
+        return {"userId": user_id, "items": [{"questionNumber": 1, "answer": [answer], "answerType": 0}]}
+
+    return build_single_answer_submission
+
+
+@pytest.fixture
+def query_budget(
+    async_engine: SQLAlchemyAsyncEngine,
+) -> typing.Callable[[int], typing.ContextManager[QueryLog]]:
+    """
+    `with query_budget(2): await async_client.get(...)` fails the test when the block executes more than 2 statements.
+    Slow and repeated statements are logged with their `EXPLAIN` plan along the way.
+    """
+    register_query_detector_event_listeners(
+        async_engine=async_engine,
+        slow_query_threshold=settings.DB_SLOW_QUERY_THRESHOLD,
+        repeated_query_threshold=settings.DB_REPEATED_QUERY_THRESHOLD,
+    )
+
+    @contextlib.contextmanager
+    def assert_within_budget(max_statements: int) -> typing.Iterator[QueryLog]:
+        with query_log_scope() as query_log:
+            yield query_log
+        if len(query_log.statements) > max_statements:
+            executed = "\n".join(f"  {statement}" for statement, _ in query_log.statements)
+            pytest.fail(f"{len(query_log.statements)} statements over a budget of {max_statements}:\n{executed}")
+
+    return assert_within_budget
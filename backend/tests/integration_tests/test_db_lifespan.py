@@ -0,0 +1,40 @@
+import asyncio
+
+import fastapi
+from sqlalchemy.ext.asyncio import AsyncEngine as SQLAlchemyAsyncEngine
+
+from src.repository.events import build_hot_statements, dispose_db_connection, SessionTracker, warm_pool
+
+
+async def test_warm_pool_leaves_prepared_connections_checked_in(async_engine: SQLAlchemyAsyncEngine) -> None:
+    warmed = await warm_pool(async_engine=async_engine, size=3, statements=build_hot_statements())
+
+    assert warmed == 3
+    assert async_engine.pool.checkedin() == 3  # type: ignore
+    assert async_engine.pool.checkedout() == 0  # type: ignore
+
+
+async def test_dispose_waits_for_in_flight_sessions(async_engine: SQLAlchemyAsyncEngine) -> None:
+    app = fastapi.FastAPI()
+    app.state.db = async_engine
+    session_tracker = SessionTracker()
+    session_tracker.enter()
+
+    async def finish_request() -> None:
+        await asyncio.sleep(0.05)
+        session_tracker.exit()
+
+    finishing = asyncio.create_task(finish_request())
+    await dispose_db_connection(backend_app=app, session_tracker=session_tracker)
+
+    assert finishing.done()
+    assert session_tracker.active == 0
+
+
+async def test_session_tracker_gives_up_after_timeout() -> None:
+    session_tracker = SessionTracker()
+    session_tracker.enter()
+
+    assert await session_tracker.wait_idle(timeout=0.01) is False
+    session_tracker.exit()
+    assert await session_tracker.wait_idle(timeout=0.01) is True
@@ -0,0 +1,61 @@
+import typing
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine as SQLAlchemyAsyncEngine, create_async_engine
+
+from src.config.manager import settings
+from src.repository.events import register_pool_event_listeners
+from src.repository.metrics import InstrumentedAsyncAdaptedQueuePool, pool_metrics
+
+
+@pytest.fixture
+async def single_connection_engine() -> typing.AsyncGenerator[SQLAlchemyAsyncEngine, None]:
+    engine = create_async_engine(
+        url=settings.DB_ASYNC_URL,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    register_pool_event_listeners(async_engine=engine)
+    pool_metrics.reset()
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(sqlalchemy.text("SELECT 1"))
+    except OSError as e:
+        await engine.dispose()
+        pytest.skip(f"Database at `DB_ASYNC_URL` is not reachable: {e}")
+
+    yield engine
+
+    await engine.dispose()
+
+
+async def test_pool_metrics_track_connects_checkouts_and_timeouts(
+    single_connection_engine: SQLAlchemyAsyncEngine,
+) -> None:
+    async with single_connection_engine.connect() as connection:
+        await connection.execute(sqlalchemy.text("SELECT 1"))
+        assert single_connection_engine.pool.checkedout() == 1  # type: ignore
+
+        with pytest.raises(PoolTimeoutError):
+            await single_connection_engine.connect()
+
+    assert pool_metrics.connects == 1
+    assert pool_metrics.connect_latency.count == 1
+    assert pool_metrics.checkouts == 2
+    assert pool_metrics.timeouts == 1
+    assert pool_metrics.wait_time.count == 3
+    assert pool_metrics.wait_time.sum >= 0.2
+
+
+async def test_health_db_route_reports_pool_state(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.get("/api/health/db")
+
+    assert response.status_code == 200
+    assert response.json()["pool_class"] == "InstrumentedAsyncAdaptedQueuePool"
+    assert response.json()["size"] == settings.DB_POOL_SIZE
+    assert "+Inf" in response.json()["wait_time"]["buckets"]
@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.main import backend_app
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+from src.repository.write_behind import FeedbackBuffer, get_feedback_buffer
+from src.utilities.exceptions.database import WriteBufferFull
+
+
+async def seed_onboarded_users(async_session: SQLAlchemyAsyncSession, count: int) -> list[int]:
+    user_ids = list(
+        await async_session.scalars(
+            sqlalchemy.insert(User).returning(User.id),
+            [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(count)],
+        )
+    )
+    await async_session.execute(sqlalchemy.insert(Onboarding), [{"user_id": user_id} for user_id in user_ids])
+    await async_session.commit()
+    return user_ids
+
+
+def build_buffer(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession], **overrides: float
+) -> FeedbackBuffer:
+    options = {"max_size": 100, "batch_size": 10, "flush_interval": 0.01, "enqueue_timeout": 0.01}
+    options.update(overrides)
+    return FeedbackBuffer(session_factory=async_session_factory, **options)  # type: ignore
+
+
+async def read_feedbacks(async_session: SQLAlchemyAsyncSession) -> dict[int, str | None]:
+    async_session.expire_all()
+    return dict((await async_session.execute(sqlalchemy.select(Onboarding.user_id, Onboarding.feedback))).all())
+
+
+async def test_buffer_flushes_in_batches_last_feedback_wins(
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    user_ids = await seed_onboarded_users(async_session, count=15)
+    feedback_buffer = build_buffer(async_session_factory)
+    feedback_buffer.start()
+
+    for user_id in user_ids:
+        await feedback_buffer.submit(user_id=user_id, feedback="first")
+    await feedback_buffer.submit(user_id=user_ids[-1], feedback="second")
+    await feedback_buffer.submit(user_id=404, feedback="nobody")
+    await asyncio.sleep(0.1)
+
+    assert feedback_buffer.stats.flushes >= 2
+    assert await read_feedbacks(async_session) == {
+        **{user_id: "first" for user_id in user_ids[:-1]},
+        user_ids[-1]: "second",
+    }
+    # Both feedbacks of the last user count as saved unless they landed in the same batch
+    assert feedback_buffer.stats.saved + feedback_buffer.stats.superseded == 16
+    assert feedback_buffer.stats.unknown_users == 1
+    await feedback_buffer.close()
+
+
+async def test_buffer_pushes_back_when_full_and_flushes_on_close(
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    user_ids = await seed_onboarded_users(async_session, count=3)
+    feedback_buffer = build_buffer(async_session_factory, max_size=2)  # never started, so nothing drains it
+
+    await feedback_buffer.submit(user_id=user_ids[0], feedback="a")
+    await feedback_buffer.submit(user_id=user_ids[1], feedback="b")
+    with pytest.raises(WriteBufferFull):
+        await feedback_buffer.submit(user_id=user_ids[2], feedback="c")
+
+    await feedback_buffer.close()
+
+    assert await read_feedbacks(async_session) == {user_ids[0]: "a", user_ids[1]: "b", user_ids[2]: None}
+
+
+async def test_save_feedback_route_accepts_in_write_behind_mode(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (user_id,) = await seed_onboarded_users(async_session, count=1)
+    feedback_buffer = build_buffer(async_session_factory)
+    monkeypatch.setattr("src.api.routes.onboarding.settings.IS_FEEDBACK_WRITE_BEHIND_ENABLED", True)
+    backend_app.dependency_overrides[get_feedback_buffer] = lambda: feedback_buffer
+
+    response = await async_client.post("/api/onboarding/save-feedback", json={"userId": user_id, "feedback": "Nice"})
+
+    assert response.status_code == 202
+    assert await read_feedbacks(async_session) == {user_id: None}
+    await feedback_buffer.close()
+    assert await read_feedbacks(async_session) == {user_id: "Nice"}
@@ -0,0 +1,107 @@
+import typing
+
+import httpx
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+
+
+async def test_submit_answers_upserts_onboarding_and_flips_user_flag(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    user_payload: typing.Callable[..., dict],
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    user_id = (await async_client.post("/api/users", json=user_payload())).json()["id"]
+
+    first = await async_client.post("/api/onboarding/submit-answers", json=build_submission(user_id, "B"))
+    second = await async_client.post("/api/onboarding/submit-answers", json=build_submission(user_id, "C"))
+
+    assert first.json() == {
+        "primaryPersonality": "B",
+        "specificPersonality": {"A": 0.0, "B": 100.0, "C": 0.0, "D": 0.0},
+    }
+    assert second.json()["primaryPersonality"] == "C"
+    onboarding_rows = (await async_session.scalars(sqlalchemy.select(Onboarding))).all()
+    assert [(row.user_id, row.primary_personality) for row in onboarding_rows] == [(user_id, "C")]
+    assert onboarding_rows[0].updated_at is not None
+    assert await async_session.scalar(sqlalchemy.select(User.is_onboarding).where(User.id == user_id)) is False
+    assert (await async_client.get(f"/api/users/{user_id}")).json()["is_onboarding"] is False
+
+
+async def test_submit_answers_for_unknown_user_is_not_found(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    response = await async_client.post("/api/onboarding/submit-answers", json=build_submission(404, "A"))
+
+    assert response.status_code == 404
+    assert (await async_session.scalars(sqlalchemy.select(Onboarding))).all() == []
+
+
+async def test_submit_answers_batch_reports_per_item_results(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(3)],
+    )
+    await async_session.commit()
+    user_ids = list((await async_session.scalars(sqlalchemy.select(User.id).order_by(User.id))).all())
+
+    response = await async_client.post(
+        "/api/onboarding/submit-answers/batch",
+        json=[
+            build_submission(user_ids[0], "A"),
+            build_submission(user_ids[1], "B"),
+            build_submission(404, "C"),
+            build_submission(user_ids[0], "D"),
+        ],
+    )
+
+    assert [(item["status"], item["primaryPersonality"]) for item in response.json()] == [
+        ("superseded", "A"),
+        ("saved", "B"),
+        ("user_not_found", None),
+        ("saved", "D"),
+    ]
+    stored = (await async_session.execute(sqlalchemy.select(Onboarding.user_id, Onboarding.primary_personality))).all()
+    assert sorted(stored) == [(user_ids[0], "D"), (user_ids[1], "B")]
+    flags = (await async_session.execute(sqlalchemy.select(User.id, User.is_onboarding).order_by(User.id))).all()
+    assert [flag for _, flag in flags] == [False, False, True]
+
+
+async def test_submit_answers_batch_rejects_invalid_answers_per_item(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(2)],
+    )
+    await async_session.commit()
+    user_ids = list((await async_session.scalars(sqlalchemy.select(User.id).order_by(User.id))).all())
+
+    response = await async_client.post(
+        "/api/onboarding/submit-answers/batch",
+        json=[
+            build_submission(user_ids[0], "A"),
+            build_submission(user_ids[1], "E"),
+            build_submission(user_ids[0], "AB"),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert [(item["status"], item["primaryPersonality"]) for item in response.json()] == [
+        ("saved", "A"),
+        ("invalid_answers", None),
+        ("invalid_answers", None),
+    ]
+    stored = (await async_session.execute(sqlalchemy.select(Onboarding.user_id, Onboarding.primary_personality))).all()
+    assert stored == [(user_ids[0], "A")]
@@ -0,0 +1,68 @@
+import typing
+
+import httpx
+import loguru
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.user import User
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.diagnostics import explain_statement, query_log_scope
+
+
+async def test_user_routes_stay_within_their_query_budget(
+    async_client: httpx.AsyncClient,
+    query_budget,
+    user_payload: typing.Callable[..., dict],
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    with query_budget(1):
+        user_id = (await async_client.post("/api/users", json=user_payload())).json()["id"]
+    with query_budget(1):
+        await async_client.get(f"/api/users/{user_id}/profile")
+    with query_budget(1):
+        await async_client.put(f"/api/users/{user_id}", json={"first_name": "Ada"})
+    with query_budget(1):
+        await async_client.post("/api/onboarding/submit-answers", json=build_submission(user_id, "A"))
+
+
+async def test_query_budget_fails_an_n_plus_one(async_session: SQLAlchemyAsyncSession, query_budget) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    warnings: list[str] = []
+    sink_id = loguru.logger.add(warnings.append, level="WARNING", format="{message}")
+
+    try:
+        with pytest.raises(pytest.fail.Exception, match="4 statements over a budget of 2"):
+            with query_budget(2) as query_log:
+                for user_id in range(4):
+                    await user_repo.is_email_taken(email=f"user{user_id}@example.com")
+    finally:
+        loguru.logger.remove(sink_id)
+
+    assert query_log.repeated(threshold=3) == {query_log.statements[0][0]: 4}
+    assert len(warnings) == 1
+    assert warnings[0].startswith("Repeated query --- executed 3 times")
+    assert "Index Only Scan" in warnings[0] or "Index Scan" in warnings[0]
+
+
+async def test_query_log_scopes_nest(async_session: SQLAlchemyAsyncSession, query_budget) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+
+    with query_budget(2) as outer:
+        with query_log_scope() as inner:
+            await user_repo.is_email_taken(email="a@example.com")
+        await user_repo.is_username_taken(username="a")
+
+    assert len(inner.statements) == 1
+    assert len(outer.statements) == 2
+
+
+async def test_failed_explain_leaves_the_transaction_usable(async_session: SQLAlchemyAsyncSession) -> None:
+    await async_session.execute(sqlalchemy.select(User.id))
+    connection = await async_session.connection()
+
+    with pytest.raises(Exception, match="missing_table"):
+        await connection.run_sync(explain_statement, "SELECT * FROM missing_table", None)
+
+    assert await async_session.scalar(sqlalchemy.select(sqlalchemy.literal(1))) == 1
@@ -0,0 +1,112 @@
+import asyncio
+import typing
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+    create_async_engine,
+)
+
+from src.config.manager import settings
+from src.models.db.user import User
+from src.models.schemas.user import UserInUpdate
+from src.repository.crud.base import read_your_writes
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.routing import ReplicaRouter, ReplicaSelectionStrategy, RoutingSession
+from src.repository.table import Base
+from src.repository.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+async def replica_engine(
+    async_engine: SQLAlchemyAsyncEngine, worker_id: str
+) -> typing.AsyncGenerator[SQLAlchemyAsyncEngine, None]:
+    """
+    A second schema standing in for a replica that has not caught up with the primary.
+    """
+    schema = f"test_{worker_id}_replica"
+    engine = create_async_engine(url=settings.DB_ASYNC_URL, connect_args={"server_settings": {"search_path": schema}})
+    async with engine.begin() as connection:
+        await connection.execute(sqlalchemy.text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await connection.execute(sqlalchemy.text(f"CREATE SCHEMA {schema}"))
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    async with engine.begin() as connection:
+        await connection.execute(sqlalchemy.text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    await engine.dispose()
+
+
+@pytest.fixture
+async def routing_session_factory(
+    async_engine: SQLAlchemyAsyncEngine, replica_engine: SQLAlchemyAsyncEngine
+) -> sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession]:
+    user = {"id": 1, "email": "a@example.com", "username": "a", "roles": 0}
+    for engine, first_name in ((async_engine, "primary"), (replica_engine, "replica")):
+        async with engine.begin() as connection:
+            await connection.execute(sqlalchemy.insert(User).values(**user, first_name=first_name))
+    read_your_writes.reset()
+
+    return sqlalchemy_async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replica_router=ReplicaRouter(replicas=[replica_engine]),
+    )
+
+
+async def read_first_name(session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession]) -> str:
+    async with session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+        return (await unit_of_work.repository(UserCRUDRepository).get_user_by_id(user_id=1)).first_name
+
+
+async def test_reads_go_to_replica_and_writes_to_primary(
+    routing_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession], monkeypatch
+) -> None:
+    monkeypatch.setattr(read_your_writes, "window", 0.05)
+    assert await read_first_name(routing_session_factory) == "replica"
+
+    async with routing_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+        await unit_of_work.repository(UserCRUDRepository).update_user(
+            user_id=1, user_update=UserInUpdate(first_name="updated")
+        )
+
+    # Read-your-writes: the writer's own user is read from the primary until the window closes
+    assert await read_first_name(routing_session_factory) == "updated"
+    await asyncio.sleep(0.1)
+    assert await read_first_name(routing_session_factory) == "replica"
+
+
+async def test_reads_after_a_write_in_the_same_session_stay_on_primary(
+    routing_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    async with routing_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+        user_repo = unit_of_work.repository(UserCRUDRepository)
+        await session.execute(sqlalchemy.update(User).where(User.id == 1).values(last_name="pending"))
+        user = await user_repo.get_user_by_id(user_id=1)
+
+        assert (user.first_name, user.last_name) == ("primary", "pending")
+
+
+async def test_replica_router_strategies(replica_engine: SQLAlchemyAsyncEngine) -> None:
+    other_replica = create_async_engine(url=settings.DB_ASYNC_URL)
+    replicas = [replica_engine, other_replica]
+    round_robin = ReplicaRouter(replicas=replicas)
+    least_connections = ReplicaRouter(replicas=replicas, strategy=ReplicaSelectionStrategy.LEAST_CONNECTIONS)
+
+    assert [round_robin.choose() for _ in range(3)] == [
+        replica_engine.sync_engine,
+        other_replica.sync_engine,
+        replica_engine.sync_engine,
+    ]
+    async with replica_engine.connect():
+        assert {least_connections.choose() for _ in range(3)} == {other_replica.sync_engine}
+    await other_replica.dispose()
+
+    with pytest.raises(ValueError):
+        ReplicaRouter(replicas=replicas, strategy="random")
@@ -0,0 +1,47 @@
+import typing
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine as SQLAlchemyAsyncEngine
+
+from src.repository.events import register_timing_event_listeners
+from src.utilities.metrics.request_timing import route_metrics
+
+
+@pytest.fixture
+def timed_engine(async_engine: SQLAlchemyAsyncEngine) -> SQLAlchemyAsyncEngine:
+    register_timing_event_listeners(async_engine=async_engine)
+    route_metrics.reset()
+    return async_engine
+
+
+def parse_server_timing(header: str) -> dict[str, str]:
+    return {metric.split(";")[0].strip(): metric for metric in header.split(",")}
+
+
+async def test_server_timing_reports_db_time_and_statements(
+    async_client: httpx.AsyncClient, timed_engine: SQLAlchemyAsyncEngine, user_payload: typing.Callable[..., dict]
+) -> None:
+    response = await async_client.post("/api/users", json=user_payload())
+
+    server_timing = parse_server_timing(response.headers["server-timing"])
+    assert set(server_timing) == {"db", "pool", "app", "total"}
+    # The single INSERT ... RETURNING, COMMIT is not a cursor execution
+    assert 'desc="statements: 1"' in server_timing["db"]
+
+
+async def test_metrics_endpoint_exposes_route_histograms(
+    async_client: httpx.AsyncClient, timed_engine: SQLAlchemyAsyncEngine
+) -> None:
+    await async_client.get("/api/users/404")
+    await async_client.get("/api/users/405")
+    await async_client.get("/no-such-route")
+
+    response = await async_client.get("/api/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE http_request_duration_seconds histogram" in lines
+    assert 'http_request_duration_seconds_count{method="GET",route="users:get-user"} 2' in lines
+    assert 'http_request_db_statements_bucket{method="GET",route="users:get-user",le="1"} 2' in lines
+    assert 'http_request_duration_seconds_count{method="GET",route="unmatched"} 1' in lines
@@ -0,0 +1,84 @@
+import json
+import pathlib
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.jobs.rescore_onboarding import rescore_onboarding
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+
+STALE_SCORE = {"A": 0, "B": 0, "C": 0, "D": 0}
+
+
+async def seed_onboarding(async_session: SQLAlchemyAsyncSession, count: int) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(count)],
+    )
+    user_ids = (await async_session.scalars(sqlalchemy.select(User.id).order_by(User.id))).all()
+    await async_session.execute(
+        sqlalchemy.insert(Onboarding),
+        [
+            {
+                "user_id": user_id,
+                "primary_personality": "A",
+                "specific_personality": STALE_SCORE,
+                "detailed_qa": json.dumps([{"questionNumber": 1, "answer": ["ABCD"[idx % 4]], "answerType": 0}]),
+            }
+            for idx, user_id in enumerate(user_ids)
+        ],
+    )
+    await async_session.commit()
+
+
+async def test_rescore_updates_changed_rows_and_checkpoints(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    async_session: SQLAlchemyAsyncSession,
+    tmp_path: pathlib.Path,
+) -> None:
+    await seed_onboarding(async_session=async_session, count=10)
+    checkpoint_path = tmp_path / "rescore.json"
+
+    summary = await rescore_onboarding(
+        session_factory=async_session_factory, chunk_size=3, checkpoint_path=checkpoint_path
+    )
+
+    rows = (await async_session.execute(sqlalchemy.select(Onboarding).order_by(Onboarding.id))).scalars().all()
+    assert (summary.scanned, summary.changed) == (10, 10)
+    assert [row.primary_personality for row in rows] == list("ABCDABCDAB")
+    assert rows[1].specific_personality == {"A": 0.0, "B": 100.0, "C": 0.0, "D": 0.0}
+    assert json.loads(checkpoint_path.read_text()) == {"last_id": rows[-1].id}
+
+    resumed = await rescore_onboarding(session_factory=async_session_factory, checkpoint_path=checkpoint_path)
+    assert resumed.scanned == 0
+
+
+async def test_rescore_dry_run_reports_diff_without_writing(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    async_session: SQLAlchemyAsyncSession,
+) -> None:
+    await seed_onboarding(async_session=async_session, count=4)
+
+    summary = await rescore_onboarding(session_factory=async_session_factory, chunk_size=2, dry_run=True)
+
+    assert summary.changed == 4
+    assert summary.diffs[1].endswith(
+        "A -> B, {'A': 0, 'B': 0, 'C': 0, 'D': 0} -> {'A': 0.0, 'B': 100.0, 'C': 0.0, 'D': 0.0}"
+    )
+    stored = (await async_session.scalars(sqlalchemy.select(Onboarding.specific_personality))).all()
+    assert all(value == STALE_SCORE for value in stored)
+
+
+async def test_rescore_with_process_pool(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    async_session: SQLAlchemyAsyncSession,
+) -> None:
+    await seed_onboarding(async_session=async_session, count=8)
+
+    summary = await rescore_onboarding(session_factory=async_session_factory, chunk_size=2, workers=2)
+
+    assert (summary.scanned, summary.changed) == (8, 8)
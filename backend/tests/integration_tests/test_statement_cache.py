@@ -0,0 +1,40 @@
+import httpx
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.events import register_statement_event_listeners
+from src.repository.statements import statement_registry
+from src.utilities.exceptions.database import EmailAlreadyExists
+
+
+async def test_registered_statements_hit_both_caches_after_first_use(
+    async_engine: SQLAlchemyAsyncEngine,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    register_statement_event_listeners(async_engine=async_engine)
+    statement_registry.reset()
+
+    async with async_session_factory() as session:
+        user_repo = UserCRUDRepository(async_session=session)
+        for email in ("a@example.com", "b@example.com", "c@example.com"):
+            try:
+                await user_repo.is_email_taken(email=email)
+            except EmailAlreadyExists:
+                pass
+
+    stats = statement_registry.stats["user_email_taken"]
+    assert stats.executions == 3
+    assert stats.compiled_cache_hits == 2
+    assert stats.prepared_cache_hits == 2
+    assert statement_registry.stats["user_by_id"].executions == 0
+
+
+async def test_health_statements_route_lists_every_registered_statement(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.get("/api/health/statements")
+
+    assert response.status_code == 200
+    assert {statement["name"] for statement in response.json()["statements"]} == set(statement_registry.stats)
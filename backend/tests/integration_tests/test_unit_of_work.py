@@ -0,0 +1,100 @@
+import typing
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.models.db.user import User
+from src.models.schemas.user import UserInCreate, UserInUpdate
+from src.repository.cache.base import build_user_cache_key
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.crud.base import PENDING_INVALIDATIONS_KEY
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.unit_of_work import UnitOfWork
+from src.utilities.exceptions.database import UsernameAlreadyExists
+
+
+async def test_cached_read_never_checks_out_a_connection(
+    async_client: httpx.AsyncClient, async_engine: SQLAlchemyAsyncEngine, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_id = (await async_client.post("/api/users", json=user_payload())).json()["id"]
+    await async_client.get(f"/api/users/{user_id}")
+
+    checkouts = []
+    record_checkout = lambda *args: checkouts.append(args)  # noqa: E731
+    event.listen(async_engine.sync_engine, "checkout", record_checkout)
+    response = await async_client.get(f"/api/users/{user_id}")
+    event.remove(async_engine.sync_engine, "checkout", record_checkout)
+
+    assert response.status_code == 200
+    assert checkouts == []
+
+
+async def test_repositories_share_one_session(async_session: SQLAlchemyAsyncSession) -> None:
+    unit_of_work = UnitOfWork(async_session=async_session)
+
+    assert unit_of_work.repository(UserCRUDRepository) is unit_of_work.repository(UserCRUDRepository)
+    assert (
+        unit_of_work.repository(UserCRUDRepository).async_session
+        is unit_of_work.repository(OnboardingCRUDRepository).async_session
+    )
+
+
+async def test_exception_rolls_back_every_write(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    build_user: typing.Callable[..., UserInCreate],
+) -> None:
+    with pytest.raises(RuntimeError):
+        async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(0))
+            await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(1))
+            raise RuntimeError("request failed")
+
+    async with async_session_factory() as session:
+        assert await session.scalar(sqlalchemy.select(sqlalchemy.func.count()).select_from(User)) == 0
+
+
+async def test_failed_repository_write_leaves_the_rollback_to_the_unit_of_work(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    build_user: typing.Callable[..., UserInCreate],
+) -> None:
+    async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+        user = await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(0))
+
+    with pytest.raises(UsernameAlreadyExists):
+        async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+            await unit_of_work.repository(UserCRUDRepository).update_user(
+                user_id=user.id, user_update=UserInUpdate(first_name="Ada")
+            )
+            await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(1, username="user0"))
+
+    # The earlier update is rolled back with the failed insert, and its cache invalidation is dropped
+    assert PENDING_INVALIDATIONS_KEY not in session.info
+    async with async_session_factory() as session:
+        assert await session.scalar(sqlalchemy.select(User.first_name).where(User.id == user.id)) is None
+
+
+async def test_cache_is_invalidated_only_after_commit(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    cache: InMemoryCacheBackend,
+    build_user: typing.Callable[..., UserInCreate],
+) -> None:
+    async with async_session_factory() as session, UnitOfWork(async_session=session, cache=cache) as unit_of_work:
+        user = await unit_of_work.repository(UserCRUDRepository).create_user(user_create=build_user(0))
+    cache_key = build_user_cache_key(user_id=user.id)
+    await cache.set(key=cache_key, value="stale")
+
+    async with async_session_factory() as session, UnitOfWork(async_session=session, cache=cache) as unit_of_work:
+        await unit_of_work.repository(UserCRUDRepository).update_user(
+            user_id=user.id, user_update=UserInUpdate(first_name="Ada")
+        )
+        assert await cache.get(key=cache_key) == "stale"
+
+    assert await cache.get(key=cache_key) is None
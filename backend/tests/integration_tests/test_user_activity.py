@@ -0,0 +1,117 @@
+import asyncio
+import typing
+
+import httpx
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncEngine as SQLAlchemyAsyncEngine,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.main import backend_app
+from src.models.db.user import User
+from src.repository.activity import ActivityTracker, get_activity_tracker
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.crud.user import UserCRUDRepository
+
+
+async def seed_users(async_session: SQLAlchemyAsyncSession, count: int) -> list[int]:
+    user_ids = list(
+        await async_session.scalars(
+            sqlalchemy.insert(User).returning(User.id),
+            [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(count)],
+        )
+    )
+    await async_session.commit()
+    return user_ids
+
+
+async def read_presence(async_session: SQLAlchemyAsyncSession) -> dict[int, bool]:
+    return dict((await async_session.execute(sqlalchemy.select(User.id, User.is_logged_in))).all())
+
+
+async def test_heartbeats_are_coalesced_into_one_statement(
+    async_engine: SQLAlchemyAsyncEngine,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    user_ids = await seed_users(async_session, count=3)
+    activity_tracker = ActivityTracker(session_factory=async_session_factory, flush_interval=60, session_timeout=60)
+    for _ in range(100):
+        for user_id in user_ids:
+            activity_tracker.record_activity(user_id=user_id)
+    statements: list[str] = []
+
+    def record_statement(conn: typing.Any, cursor: typing.Any, statement: str, *args: typing.Any) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+    await activity_tracker.flush()
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 1
+    assert await read_presence(async_session) == {user_id: True for user_id in user_ids}
+    assert None not in (await async_session.scalars(sqlalchemy.select(User.last_login))).all()
+
+
+async def test_inactive_and_logged_out_sessions_are_logged_out(
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    idle_user_id, leaving_user_id, active_user_id = await seed_users(async_session, count=3)
+    activity_tracker = ActivityTracker(session_factory=async_session_factory, flush_interval=60, session_timeout=0.2)
+    for user_id in (idle_user_id, leaving_user_id, active_user_id):
+        activity_tracker.record_activity(user_id=user_id)
+    await activity_tracker.flush()
+
+    await asyncio.sleep(0.3)
+    activity_tracker.record_activity(user_id=active_user_id)
+    activity_tracker.record_logout(user_id=leaving_user_id)
+    await activity_tracker.flush()
+
+    assert await read_presence(async_session) == {idle_user_id: False, leaving_user_id: False, active_user_id: True}
+    assert activity_tracker.active_sessions == 1
+
+
+async def test_expiry_keeps_sessions_refreshed_elsewhere(async_session: SQLAlchemyAsyncSession) -> None:
+    (user_id,) = await seed_users(async_session, count=1)
+    user_repo = UserCRUDRepository(async_session=async_session)
+    last_seen: dict[int, typing.Any] = {user_id: await async_session.scalar(sqlalchemy.select(sqlalchemy.func.now()))}
+    await user_repo.save_activity_batch(last_seen=last_seen, logged_out=[], expired=[], session_timeout=60)
+
+    # Another worker still saw this user within the timeout
+    await user_repo.save_activity_batch(last_seen={}, logged_out=[], expired=[user_id], session_timeout=60)
+    assert await read_presence(async_session) == {user_id: True}
+
+    assert await user_repo.expire_stale_sessions(session_timeout=60) == 0
+    assert await user_repo.expire_stale_sessions(session_timeout=-1) == 1
+    assert await read_presence(async_session) == {user_id: False}
+
+
+async def test_login_route_updates_presence_on_flush(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    cache: InMemoryCacheBackend,
+) -> None:
+    (user_id,) = await seed_users(async_session, count=1)
+    activity_tracker = ActivityTracker(
+        session_factory=async_session_factory, flush_interval=60, session_timeout=60, cache=cache
+    )
+    backend_app.dependency_overrides[get_activity_tracker] = lambda: activity_tracker
+    assert (await async_client.get(f"/api/users/{user_id}")).json()["is_logged_in"] is False  # now cached
+
+    assert (await async_client.post("/api/users/404/login")).status_code == 404
+    assert (await async_client.post(f"/api/users/{user_id}/login")).status_code == 202
+    assert (await async_client.post(f"/api/users/{user_id}/heartbeat")).status_code == 202
+    await activity_tracker.flush()
+
+    user = (await async_client.get(f"/api/users/{user_id}")).json()
+    assert user["is_logged_in"] is True
+    assert user["last_login"] is not None
+
+    assert (await async_client.post(f"/api/users/{user_id}/logout")).status_code == 202
+    await activity_tracker.close()
+    assert (await async_client.get(f"/api/users/{user_id}")).json()["is_logged_in"] is False
@@ -0,0 +1,182 @@
+import typing
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.jobs.size_availability_filter import size_availability_filter
+from src.main import backend_app
+from src.models.db.user import User
+from src.repository.availability import AvailabilityIndex, get_availability_index
+
+
+async def seed_users(async_session: SQLAlchemyAsyncSession, count: int) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(count)],
+    )
+    await async_session.commit()
+
+
+def build_availability_index(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> AvailabilityIndex:
+    availability_index = AvailabilityIndex(
+        session_factory=async_session_factory,
+        capacity=100,
+        false_positive_rate=0.01,
+        rebuild_stale_ratio=0.1,
+        refresh_interval=60,
+    )
+    backend_app.dependency_overrides[get_availability_index] = lambda: availability_index
+    return availability_index
+
+
+async def test_availability_only_queries_the_database_on_a_probable_hit(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    await seed_users(async_session, count=20)
+    availability_index = build_availability_index(async_session_factory)
+
+    # Not built yet, so the database answers
+    response = await async_client.get("/api/users/availability", params={"username": "user1"})
+    assert response.json()["is_username_available"] is False
+    assert availability_index.stats.database_checks == 1
+
+    await availability_index.rebuild()
+    assert availability_index.describe()["entries"] == 40
+
+    response = await async_client.get(
+        "/api/users/availability", params={"username": "newcomer", "email": "newcomer@example.com"}
+    )
+    assert response.json() == {
+        "username": "newcomer",
+        "is_username_available": True,
+        "email": "newcomer@example.com",
+        "is_email_available": True,
+    }
+    response = await async_client.get("/api/users/availability", params={"email": "user5@example.com"})
+    assert response.json()["is_email_available"] is False
+    assert availability_index.stats.filtered == 2
+    assert availability_index.stats.database_checks == 2
+
+    assert (await async_client.get("/api/users/availability")).status_code == 400
+
+
+async def test_writes_keep_the_filter_current(
+    async_client: httpx.AsyncClient,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+    user_payload: typing.Callable[..., dict],
+) -> None:
+    monkeypatch.setattr("src.api.routes.user.settings.IS_USER_SOFT_DELETE_ENABLED", False)
+    availability_index = build_availability_index(async_session_factory)
+    await availability_index.rebuild()
+
+    response = await async_client.post("/api/users", json=user_payload("fresh"))
+    assert "fresh" in availability_index.usernames  # type: ignore
+    assert "fresh@example.com" in availability_index.emails  # type: ignore
+    user_id = response.json()["id"]
+
+    await async_client.put(f"/api/users/{user_id}", json={"username": "renamed"})
+    assert "renamed" in availability_index.usernames  # type: ignore
+    # The old username is still in the filter, the database clears it
+    response = await async_client.get("/api/users/availability", params={"username": "fresh"})
+    assert response.json()["is_username_available"] is True
+    assert availability_index.stats.false_positives == 1
+
+    assert (await async_client.delete(f"/api/users/{user_id}")).status_code == 204
+    assert availability_index.stale == 3
+    assert availability_index.needs_rebuild
+
+    response = await async_client.post("/api/users/availability/rebuild")
+    assert response.json()["stale"] == 0
+    assert response.json()["entries"] == 0
+    assert response.json()["needs_rebuild"] is False
+
+
+async def test_soft_deleted_user_keeps_its_values_in_the_filter(
+    async_client: httpx.AsyncClient,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+    user_payload: typing.Callable[..., dict],
+) -> None:
+    monkeypatch.setattr("src.api.routes.user.settings.IS_USER_SOFT_DELETE_ENABLED", True)
+    availability_index = build_availability_index(async_session_factory)
+    await availability_index.rebuild()
+
+    user_id = (await async_client.post("/api/users", json=user_payload("gone"))).json()["id"]
+    assert (await async_client.delete(f"/api/users/{user_id}")).status_code == 204
+
+    # Still taken until the purge, so nothing went stale
+    assert availability_index.stale == 0
+    response = await async_client.get("/api/users/availability", params={"username": "gone"})
+    assert response.json()["is_username_available"] is False
+
+    response = await async_client.post("/api/users/availability/rebuild")
+    assert response.json()["entries"] == 2
+
+
+async def test_refresh_adds_users_written_elsewhere(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    await seed_users(async_session, count=2)
+    availability_index = build_availability_index(async_session_factory)
+    await availability_index.refresh()
+    assert availability_index.stats.rebuilds == 1
+
+    # Written by another worker, or a job, without going through this worker's routes
+    await async_session.execute(
+        sqlalchemy.insert(User).values(email="elsewhere@example.com", username="elsewhere", roles=0)
+    )
+    await async_session.execute(
+        sqlalchemy.update(User)
+        .where(User.username == "user0")
+        .values(username="moved", updated_at=sqlalchemy.func.now())
+    )
+    await async_session.commit()
+    assert "elsewhere" not in availability_index.usernames  # type: ignore
+
+    assert await availability_index.refresh() >= 2
+    assert "elsewhere" in availability_index.usernames  # type: ignore
+    assert "moved" in availability_index.usernames  # type: ignore
+    # The next refresh sees the same rows again, which must not count as new entries
+    entries = availability_index.entries
+    await availability_index.refresh()
+    assert availability_index.entries == entries
+    response = await async_client.get("/api/users/availability", params={"username": "elsewhere"})
+    assert response.json()["is_username_available"] is False
+    assert availability_index.stats.rebuilds == 1
+
+
+async def test_rebuild_is_refused_while_one_is_running(
+    async_client: httpx.AsyncClient,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    availability_index = build_availability_index(async_session_factory)
+
+    async with availability_index._rebuilding:
+        assert (await async_client.post("/api/users/availability/rebuild")).status_code == 409
+    assert (await async_client.post("/api/users/availability/rebuild")).status_code == 200
+
+
+async def test_size_availability_filter_job_measures_false_positives(
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+) -> None:
+    await seed_users(async_session, count=50)
+
+    sizing = await size_availability_filter(
+        session_factory=async_session_factory, capacity=50, false_positive_rate=0.05, probes=2000
+    )
+
+    assert sizing.entries == 100
+    assert sizing.measured_false_positive_rate < 0.1
@@ -0,0 +1,85 @@
+import typing
+
+import httpx
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.user import User
+from src.models.schemas.user import UserBulkCreateStatus, UserInCreate
+from src.repository.crud.user import UserCRUDRepository
+
+
+async def test_create_users_bulk_reports_per_row_outcomes(
+    async_session: SQLAlchemyAsyncSession, build_user: typing.Callable[..., UserInCreate]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    await user_repo.create_user(user_create=build_user(0))
+
+    results = await user_repo.create_users_bulk(
+        users_create=[
+            build_user(1),
+            build_user(2, email="user0@example.com"),
+            build_user(3, username="user0"),
+            build_user(4, email="user1@example.com"),
+            build_user(5, username="user1"),
+            build_user(6),
+        ]
+    )
+
+    assert [result.status for result in results] == [
+        UserBulkCreateStatus.CREATED,
+        UserBulkCreateStatus.EMAIL_TAKEN,
+        UserBulkCreateStatus.USERNAME_TAKEN,
+        UserBulkCreateStatus.DUPLICATE_EMAIL,
+        UserBulkCreateStatus.DUPLICATE_USERNAME,
+        UserBulkCreateStatus.CREATED,
+    ]
+    assert results[0].id is not None and results[5].id is not None
+    assert await async_session.scalar(sqlalchemy.select(sqlalchemy.func.count()).select_from(User)) == 3
+
+
+async def test_create_users_bulk_rejected_rows_do_not_claim_their_values(
+    async_session: SQLAlchemyAsyncSession, build_user: typing.Callable[..., UserInCreate]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+
+    results = await user_repo.create_users_bulk(
+        users_create=[
+            build_user(1),
+            build_user(2, email="user1@example.com"),
+            build_user(3, username="user2"),
+        ]
+    )
+
+    assert [result.status for result in results] == [
+        UserBulkCreateStatus.CREATED,
+        UserBulkCreateStatus.DUPLICATE_EMAIL,
+        UserBulkCreateStatus.CREATED,
+    ]
+
+
+async def test_create_users_bulk_spans_several_chunks(
+    async_session: SQLAlchemyAsyncSession, monkeypatch, build_user: typing.Callable[..., UserInCreate]
+) -> None:
+    monkeypatch.setattr("src.repository.crud.user.settings.DB_BULK_CHUNK_SIZE", 7)
+    user_repo = UserCRUDRepository(async_session=async_session)
+
+    results = await user_repo.create_users_bulk(users_create=[build_user(idx) for idx in range(50)])
+
+    assert all(result.status == UserBulkCreateStatus.CREATED for result in results)
+    assert len({result.id for result in results}) == 50
+
+
+async def test_create_users_bulk_route(
+    async_client: httpx.AsyncClient, build_user: typing.Callable[..., UserInCreate]
+) -> None:
+    payload = [build_user(idx).model_dump() for idx in range(3)] + [
+        build_user(9, email="user0@example.com").model_dump()
+    ]
+
+    response = await async_client.post("/api/users/bulk", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 3
+    assert response.json()["rejected"] == 1
+    assert response.json()["results"][3]["status"] == "duplicate_email"
@@ -0,0 +1,26 @@
+import typing
+
+import httpx
+
+from src.repository.cache.memory import InMemoryCacheBackend
+
+
+async def test_get_user_is_served_from_cache_until_update(
+    async_client: httpx.AsyncClient, cache: InMemoryCacheBackend, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_id = (await async_client.post("/api/users", json=user_payload())).json()["id"]
+
+    first = await async_client.get(f"/api/users/{user_id}")
+    second = await async_client.get(f"/api/users/{user_id}")
+
+    assert first.json() == second.json()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    await async_client.put(f"/api/users/{user_id}", json={"first_name": "Ada"})
+    third = await async_client.get(f"/api/users/{user_id}")
+
+    assert third.json()["first_name"] == "Ada"
+    assert cache.stats.misses == 2
+
+    stats = (await async_client.get("/api/health/cache")).json()
+    assert stats["hits"] == 1 and stats["misses"] == 2 and stats["backend"] == "memory"
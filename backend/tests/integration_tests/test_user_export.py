@@ -0,0 +1,68 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+
+import httpx
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+
+
+async def seed_users_with_onboarding(async_session: SQLAlchemyAsyncSession) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [{"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": 0} for idx in range(5)],
+    )
+    user_id = await async_session.scalar(sqlalchemy.select(User.id).where(User.username == "user0"))
+    await async_session.execute(
+        sqlalchemy.insert(Onboarding).values(
+            user_id=user_id,
+            primary_personality="A",
+            specific_personality={"A": 100.0},
+            detailed_qa=json.dumps([{"questionNumber": 1, "answer": ["A"], "answerType": 0}]),
+        )
+    )
+    await async_session.commit()
+
+
+async def test_export_users_as_ndjson(async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession) -> None:
+    await seed_users_with_onboarding(async_session=async_session)
+
+    response = await async_client.get("/api/exports/users")
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(records) == 5
+    assert records[0]["primary_personality"] == "A"
+    assert records[0]["detailed_qa"] == [{"questionNumber": 1, "answer": ["A"], "answerType": 0}]
+    assert records[0]["created_at"].endswith("Z")
+    assert records[1]["primary_personality"] is None
+
+
+async def test_export_users_as_gzipped_csv(
+    async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession
+) -> None:
+    await seed_users_with_onboarding(async_session=async_session)
+
+    async with async_client.stream("GET", "/api/exports/users", params={"format": "csv", "gzip": True}) as response:
+        raw_body = b"".join([chunk async for chunk in response.aiter_raw()])
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(raw_body).decode())))
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert [row["username"] for row in rows] == [f"user{idx}" for idx in range(5)]
+    assert json.loads(rows[0]["specific_personality"]) == {"A": 100.0}
+
+
+async def test_export_users_updated_since(
+    async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession
+) -> None:
+    await seed_users_with_onboarding(async_session=async_session)
+    tomorrow = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=1)
+
+    response = await async_client.get("/api/exports/users", params={"updated_since": tomorrow.isoformat()})
+
+    assert response.text == ""
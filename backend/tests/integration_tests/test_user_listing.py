@@ -0,0 +1,50 @@
+import httpx
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.db.user import User
+
+
+async def seed_users(async_session: SQLAlchemyAsyncSession, count: int) -> None:
+    await async_session.execute(
+        sqlalchemy.insert(User),
+        [
+            {"email": f"user{idx}@example.com", "username": f"user{idx}", "roles": idx % 3, "is_active": idx % 2 == 0}
+            for idx in range(count)
+        ],
+    )
+    await async_session.commit()
+
+
+async def test_list_users_walks_every_page_exactly_once(
+    async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession
+) -> None:
+    await seed_users(async_session=async_session, count=23)
+
+    seen_ids: list[int] = []
+    cursor = None
+    while True:
+        params = {"limit": 5} | ({"cursor": cursor} if cursor else {})
+        page = (await async_client.get("/api/users", params=params)).json()
+        seen_ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen_ids) == 23
+    assert len(set(seen_ids)) == 23
+
+
+async def test_list_users_filters(async_client: httpx.AsyncClient, async_session: SQLAlchemyAsyncSession) -> None:
+    await seed_users(async_session=async_session, count=12)
+
+    page = (await async_client.get("/api/users", params={"is_active": True, "roles": [1, 2]})).json()
+
+    assert {item["username"] for item in page["items"]} == {"user2", "user4", "user8", "user10"}
+    assert page["next_cursor"] is None
+
+
+async def test_list_users_rejects_malformed_cursor(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.get("/api/users", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
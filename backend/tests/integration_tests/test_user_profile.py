@@ -0,0 +1,79 @@
+import typing
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine as SQLAlchemyAsyncEngine
+
+
+@pytest.fixture
+async def created_user(async_client: httpx.AsyncClient, user_payload: typing.Callable[..., dict]) -> dict:
+    return (await async_client.post("/api/users", json=user_payload(first_name="Ada"))).json()
+
+
+async def test_profile_joins_onboarding_in_one_statement(
+    async_client: httpx.AsyncClient,
+    async_engine: SQLAlchemyAsyncEngine,
+    created_user: dict,
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    user_id = created_user["id"]
+    await async_client.post("/api/onboarding/submit-answers", json=build_submission(user_id, "B"))
+    user = (await async_client.get(f"/api/users/{user_id}")).json()
+    statements: list[str] = []
+
+    def record_statement(conn: typing.Any, cursor: typing.Any, statement: str, *args: typing.Any) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+    response = await async_client.get(f"/api/users/{user_id}/profile")
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record_statement)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        **user,
+        "onboarding": {
+            "primary_personality": "B",
+            "specific_personality": {"A": 0.0, "B": 100.0, "C": 0.0, "D": 0.0},
+            "feedback": None,
+        },
+    }
+    assert len([statement for statement in statements if statement.lstrip().startswith("SELECT")]) == 1
+
+
+async def test_profile_without_onboarding(async_client: httpx.AsyncClient, created_user: dict) -> None:
+    response = await async_client.get(f"/api/users/{created_user['id']}/profile")
+
+    assert response.json() == {**created_user, "onboarding": None}
+
+
+async def test_profile_fields_prune_selected_columns(
+    async_client: httpx.AsyncClient,
+    async_engine: SQLAlchemyAsyncEngine,
+    created_user: dict,
+    build_submission: typing.Callable[[int, str], dict],
+) -> None:
+    user_id = created_user["id"]
+    await async_client.post("/api/onboarding/submit-answers", json=build_submission(user_id, "C"))
+    statements: list[str] = []
+
+    def record_statement(conn: typing.Any, cursor: typing.Any, statement: str, *args: typing.Any) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+    response = await async_client.get(
+        f"/api/users/{user_id}/profile", params={"fields": "id,email,onboarding.primary_personality"}
+    )
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record_statement)
+
+    assert response.json() == {"id": user_id, "email": "a@example.com", "onboarding": {"primary_personality": "C"}}
+    select_statement = next(statement for statement in statements if statement.lstrip().startswith("SELECT"))
+    assert "username" not in select_statement
+    assert "detailed_qa" not in select_statement and "feedback" not in select_statement
+
+
+async def test_profile_rejects_unknown_fields_and_users(async_client: httpx.AsyncClient, created_user: dict) -> None:
+    user_id = created_user["id"]
+
+    assert (await async_client.get(f"/api/users/{user_id}/profile", params={"fields": "password"})).status_code == 400
+    assert (await async_client.get("/api/users/404/profile")).status_code == 404
@@ -0,0 +1,61 @@
+import typing
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+from src.models.dto.user import UserRow
+from src.models.schemas.onboarding import AnswerItem, OnboardingRequest
+from src.models.schemas.user import UserInCreate, UserInResponse
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.crud.user import UserCRUDRepository
+
+
+async def test_read_user_row_matches_orm_response(
+    async_session: SQLAlchemyAsyncSession, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    new_user = await user_repo.create_user(user_create=UserInCreate(**user_payload(first_name="Ada")))
+    expected = UserInResponse.model_validate(new_user).model_dump()
+    async_session.expunge_all()
+
+    user_row = await user_repo.read_user_row_by_id(user_id=new_user.id)
+
+    assert isinstance(user_row, UserRow)
+    assert not hasattr(user_row, "__dict__")
+    assert user_row.to_dict() == expected
+    assert len(async_session.identity_map) == 0
+
+
+async def test_read_onboarding_row_is_not_tracked_by_the_session(
+    async_session: SQLAlchemyAsyncSession, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    new_user = await user_repo.create_user(user_create=UserInCreate(**user_payload()))
+    onboarding_repo = OnboardingCRUDRepository(async_session=async_session)
+    await onboarding_repo.create_or_update_onboarding(
+        onboarding_create=OnboardingRequest(
+            items=[AnswerItem(questionNumber=1, answer=["a"], answerType=0)],
+            userId=new_user.id,
+            primaryPersonality="Explorer",
+            specificPersonality={"Explorer": 1.0},
+        )
+    )
+    async_session.expunge_all()
+
+    onboarding_row = await onboarding_repo.read_onboarding_row_by_user_id(user_id=new_user.id)
+
+    assert onboarding_row.user_id == new_user.id
+    assert onboarding_row.primary_personality == "Explorer"
+    assert onboarding_row.specific_personality == {"Explorer": 1.0}
+    assert len(async_session.identity_map) == 0
+
+
+async def test_list_users_route_serializes_rows(
+    async_client: httpx.AsyncClient, user_payload: typing.Callable[..., dict]
+) -> None:
+    created = (await async_client.post("/api/users", json=user_payload(first_name="Ada"))).json()
+
+    response = await async_client.get("/api/users")
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [created]
@@ -0,0 +1,125 @@
+import typing
+
+import httpx
+import pytest
+import sqlalchemy
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.jobs.purge_deleted_users import purge_deleted_users
+from src.models.db.onboarding import Onboarding
+from src.models.db.user import User
+from src.models.schemas.onboarding import OnboardingFeedback
+from src.repository.crud.onboarding import OnboardingCRUDRepository
+from src.repository.crud.user import UserCRUDRepository
+
+
+@pytest.fixture(autouse=True)
+def soft_delete_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.api.routes.user.settings.IS_USER_SOFT_DELETE_ENABLED", True)
+
+
+@pytest.fixture
+def create_onboarded_user(
+    async_client: httpx.AsyncClient,
+    user_payload: typing.Callable[..., dict],
+    build_submission: typing.Callable[[int, str], dict],
+) -> typing.Callable[[str], typing.Awaitable[int]]:
+    async def create(name: str) -> int:
+        user_id = (await async_client.post("/api/users", json=user_payload(name))).json()["id"]
+        submission = build_submission(user_id, "A")
+        assert (await async_client.post("/api/onboarding/submit-answers", json=submission)).status_code == 200
+        return user_id
+
+    return create
+
+
+async def test_soft_deleted_user_is_hidden_from_reads(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    create_onboarded_user: typing.Callable[[str], typing.Awaitable[int]],
+) -> None:
+    kept_id = await create_onboarded_user("kept")
+    deleted_id = await create_onboarded_user("deleted")
+    assert (await async_client.get(f"/api/users/{deleted_id}")).status_code == 200  # now cached
+
+    # Referenced by an onboarding row, which made a hard delete fail with a 409
+    assert (await async_client.delete(f"/api/users/{deleted_id}")).status_code == 204
+
+    assert (await async_client.get(f"/api/users/{deleted_id}")).status_code == 404
+    assert (await async_client.get(f"/api/users/{deleted_id}/profile")).status_code == 404
+    assert (await async_client.put(f"/api/users/{deleted_id}", json={"first_name": "x"})).status_code == 404
+    assert (await async_client.delete(f"/api/users/{deleted_id}")).status_code == 404
+    assert [user["id"] for user in (await async_client.get("/api/users")).json()["items"]] == [kept_id]
+    # The row stays until it is purged, so its username is still taken
+    response = await async_client.get("/api/users/availability", params={"username": "deleted"})
+    assert response.json()["is_username_available"] is False
+    assert await async_session.scalar(sqlalchemy.select(User.deleted_at).where(User.id == deleted_id)) is not None
+
+
+async def test_soft_deleted_user_is_skipped_by_onboarding_and_activity_writes(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    create_onboarded_user: typing.Callable[[str], typing.Awaitable[int]],
+) -> None:
+    deleted_id = await create_onboarded_user("deleted")
+    assert (await async_client.delete(f"/api/users/{deleted_id}")).status_code == 204
+
+    onboarding_repo = OnboardingCRUDRepository(async_session=async_session)
+    with pytest.raises(NoResultFound):
+        await onboarding_repo.read_onboarding_row_by_user_id(user_id=deleted_id)
+    with pytest.raises(NoResultFound):
+        await onboarding_repo.save_feedback(OnboardingFeedback(userId=deleted_id, feedback="late"))
+    assert await onboarding_repo.save_feedback_batch(feedbacks={deleted_id: "late"}) == set()
+
+    user_repo = UserCRUDRepository(async_session=async_session)
+    now = await async_session.scalar(sqlalchemy.select(sqlalchemy.func.now()))
+    last_seen: dict[int, typing.Any] = {deleted_id: now}
+    saved = await user_repo.save_activity_batch(last_seen=last_seen, logged_out=[], expired=[], session_timeout=60)
+    assert saved == set()
+    user = (await async_session.execute(sqlalchemy.select(User.is_logged_in).where(User.id == deleted_id))).one()
+    assert user.is_logged_in is False
+    feedback_stmt = sqlalchemy.select(Onboarding.feedback).where(Onboarding.user_id == deleted_id)
+    assert await async_session.scalar(feedback_stmt) is None
+
+
+async def test_purge_removes_users_and_onboarding_rows_in_batches(
+    async_client: httpx.AsyncClient,
+    async_session: SQLAlchemyAsyncSession,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    create_onboarded_user: typing.Callable[[str], typing.Awaitable[int]],
+) -> None:
+    user_ids = [await create_onboarded_user(f"user{idx}") for idx in range(5)]
+    for user_id in user_ids[:4]:
+        await async_client.delete(f"/api/users/{user_id}")
+
+    # Still within the grace period
+    summary = await purge_deleted_users(session_factory=async_session_factory, grace_period=3600)
+    assert summary.purged == 0
+
+    summary = await purge_deleted_users(
+        session_factory=async_session_factory, grace_period=0, batch_size=3, batch_interval=0
+    )
+
+    assert (summary.purged, summary.batches) == (4, 2)
+    assert (await async_session.scalars(sqlalchemy.select(User.id))).all() == [user_ids[4]]
+    assert (await async_session.scalars(sqlalchemy.select(Onboarding.user_id))).all() == [user_ids[4]]
+
+
+async def test_purge_stops_after_max_batches(
+    async_client: httpx.AsyncClient,
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    user_payload: typing.Callable[..., dict],
+) -> None:
+    for idx in range(4):
+        user_id = (await async_client.post("/api/users", json=user_payload(f"u{idx}"))).json()["id"]
+        await async_client.delete(f"/api/users/{user_id}")
+
+    summary = await purge_deleted_users(
+        session_factory=async_session_factory, grace_period=0, batch_size=1, batch_interval=0, max_batches=2
+    )
+
+    assert summary.purged == 2
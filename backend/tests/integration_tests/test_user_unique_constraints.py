@@ -0,0 +1,70 @@
+import asyncio
+import typing
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker as sqlalchemy_async_sessionmaker,
+    AsyncSession as SQLAlchemyAsyncSession,
+)
+
+from src.models.schemas.user import UserInCreate, UserInUpdate
+from src.repository.crud.user import UserCRUDRepository
+from src.repository.unit_of_work import UnitOfWork
+from src.utilities.exceptions.database import EmailAlreadyExists, UsernameAlreadyExists
+
+
+async def create_user_in_own_session(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession], user_create: UserInCreate
+) -> int:
+    async with async_session_factory() as session, UnitOfWork(async_session=session) as unit_of_work:
+        new_user = await unit_of_work.repository(UserCRUDRepository).create_user(user_create=user_create)
+    return new_user.id
+
+
+async def test_parallel_duplicate_signups_create_exactly_one_user(
+    async_session_factory: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession],
+    user_payload: typing.Callable[..., dict],
+) -> None:
+    signups = [UserInCreate(**user_payload(f"racer{idx}", email="race@example.com")) for idx in range(10)]
+
+    outcomes = await asyncio.gather(
+        *(create_user_in_own_session(async_session_factory, user_create) for user_create in signups),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(outcome, int) for outcome in outcomes) == 1
+    assert sum(isinstance(outcome, EmailAlreadyExists) for outcome in outcomes) == 9
+
+
+async def test_duplicate_username_maps_to_username_already_exists(
+    async_session: SQLAlchemyAsyncSession, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    await user_repo.create_user(user_create=UserInCreate(**user_payload("taken", email="a@example.com")))
+
+    with pytest.raises(UsernameAlreadyExists):
+        await user_repo.create_user(user_create=UserInCreate(**user_payload("taken", email="b@example.com")))
+
+
+async def test_update_into_taken_email_maps_to_email_already_exists(
+    async_session: SQLAlchemyAsyncSession, user_payload: typing.Callable[..., dict]
+) -> None:
+    user_repo = UserCRUDRepository(async_session=async_session)
+    await user_repo.create_user(user_create=UserInCreate(**user_payload("a")))
+    other = await user_repo.create_user(user_create=UserInCreate(**user_payload("b")))
+
+    with pytest.raises(EmailAlreadyExists):
+        await user_repo.update_user(user_id=other.id, user_update=UserInUpdate(email="a@example.com"))
+
+
+async def test_create_user_route_rejects_taken_email(
+    async_client: httpx.AsyncClient, user_payload: typing.Callable[..., dict]
+) -> None:
+    payload = user_payload()
+    assert (await async_client.post("/api/users", json=payload)).status_code == 201
+
+    response = await async_client.post("/api/users", json={**payload, "username": "b"})
+
+    assert response.status_code == 400
+    assert "a@example.com" in response.json()["detail"]
@@ -0,0 +1,23 @@
+import typing
+
+import httpx
+
+
+async def test_update_changes_only_the_fields_sent(
+    async_client: httpx.AsyncClient, user_payload: typing.Callable[..., dict]
+) -> None:
+    payload = user_payload(first_name="Ada", last_name="Lovelace")
+    created = (await async_client.post("/api/users", json=payload)).json()
+
+    response = await async_client.put(f"/api/users/{created['id']}", json={"first_name": "Augusta"})
+
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Augusta"
+    assert response.json()["last_name"] == "Lovelace"
+    assert created["updated_at"] is None and response.json()["updated_at"] is not None
+
+
+async def test_update_unknown_user_returns_404(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.put("/api/users/404", json={"first_name": "Nobody"})
+
+    assert response.status_code == 404
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from src.models.schemas.onboarding import AnswerItem
+from src.utilities.onboarding.batch_scoring import compile_weight_matrix, is_valid_submission, score_submissions
+from src.utilities.onboarding.calculate_percentage import calculate_percentage
+from src.utilities.onboarding.calculate_points import AnswerType, calculate_points, PERSONALITIES
+
+
+def random_submission(rng: random.Random, n_questions: int) -> list[AnswerItem]:
+    items = []
+    for question_number in range(n_questions):
+        answer_type = rng.choice(list(AnswerType))
+        size = {AnswerType.single: 1, AnswerType.tie: rng.randint(2, 3), AnswerType.rank: 2}[answer_type]
+        items.append(
+            AnswerItem(questionNumber=question_number, answer=rng.sample(PERSONALITIES, size), answerType=answer_type)
+        )
+    return items
+
+
+def test_calculate_points_applies_answer_type_weights() -> None:
+    answers = [
+        AnswerItem(questionNumber=1, answer=["A"], answerType=0),
+        AnswerItem(questionNumber=2, answer=["B", "C"], answerType=1),
+        AnswerItem(questionNumber=3, answer=["D", "A"], answerType=2),
+    ]
+
+    assert calculate_points(answers) == {"A": 8, "B": 3, "C": 3, "D": 4}
+
+
+def test_weight_matrix_matches_rubric() -> None:
+    assert compile_weight_matrix().tolist() == [[6, 6, 6, 6], [3, 3, 3, 3], [4, 2, 0, 0]]
+
+
+def test_score_submissions_matches_scalar_functions() -> None:
+    rng = random.Random(42)
+    submissions = [random_submission(rng, n_questions=rng.randint(0, 12)) for _ in range(500)]
+
+    scores = score_submissions(submissions)
+
+    for submission, points, percentages, primary in zip(
+        submissions, scores.points.tolist(), scores.specific_personalities, scores.primary_personalities
+    ):
+        expected_points = calculate_points(submission)
+        expected_percentages, expected_primary = calculate_percentage(expected_points)
+        assert dict(zip(PERSONALITIES, points)) == expected_points
+        assert percentages == pytest.approx(expected_percentages, abs=0.1 + 1e-9)
+        assert primary == expected_primary
+
+
+def test_score_submissions_accepts_stored_detailed_qa() -> None:
+    detailed_qa = [{"questionNumber": 1, "answer": ["C", "B"], "answerType": 2}]
+
+    scores = score_submissions([detailed_qa, []])
+
+    assert scores.primary_personalities == ["C", "A"]
+    assert scores.specific_personalities == [
+        {"A": 0.0, "B": 33.3, "C": 66.7, "D": 0.0},
+        {"A": 0.0, "B": 0.0, "C": 0.0, "D": 0.0},
+    ]
+
+
+def test_is_valid_submission_rejects_unknown_and_multi_letter_options() -> None:
+    assert is_valid_submission([AnswerItem(questionNumber=1, answer=["A", "D"], answerType=AnswerType.tie)])
+    assert is_valid_submission([{"questionNumber": 1, "answer": ["B"], "answerType": AnswerType.single}])
+    assert not is_valid_submission([AnswerItem(questionNumber=1, answer=["E"], answerType=AnswerType.single)])
+    assert not is_valid_submission([AnswerItem(questionNumber=1, answer=["AB"], answerType=AnswerType.single)])
@@ -0,0 +1,30 @@
+import pytest
+
+from src.utilities.lookup.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_never_misses_an_added_item() -> None:
+    bloom_filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for idx in range(1000):
+        bloom_filter.add(f"user{idx}")
+
+    assert all(f"user{idx}" in bloom_filter for idx in range(1000))
+    assert bloom_filter.count == 1000
+
+
+def test_bloom_filter_false_positive_rate_stays_near_configured_one() -> None:
+    bloom_filter = BloomFilter(capacity=5000, false_positive_rate=0.01)
+    for idx in range(5000):
+        bloom_filter.add(f"user{idx}@example.com")
+
+    false_positives = sum(f"other{idx}@example.com" in bloom_filter for idx in range(20000))
+    assert false_positives / 20000 < 0.02
+    assert bloom_filter.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.2)
+    # ~9.6 bits per item at 1%
+    assert bloom_filter.size_bytes < 5000 * 10 / 8 + 1
+
+
+@pytest.mark.parametrize("capacity, false_positive_rate", [(0, 0.01), (100, 0), (100, 1)])
+def test_bloom_filter_rejects_invalid_sizing(capacity: int, false_positive_rate: float) -> None:
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, false_positive_rate=false_positive_rate)
@@ -0,0 +1,136 @@
+import asyncio
+import typing
+
+import pytest
+
+from src.repository.cache.memory import InMemoryCacheBackend
+from src.repository.cache.redis import read_reply, RedisCacheBackend
+
+
+class FakeRedisServer:
+    """
+    Just enough of a RESP server (GET/SET PX/DEL/DBSIZE/SELECT) to exercise `RedisCacheBackend` locally.
+    """
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[str, str] = {}
+        self.commands: list[list[str]] = []
+        # Seconds to wait before answering a GET of these keys
+        self.delays: dict[str, float] = {}
+        self.server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> "FakeRedisServer":
+        self.server = await asyncio.start_server(self._handle, host="127.0.0.1", port=0)
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        assert self.server is not None
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/1"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            try:
+                command = await read_reply(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                break
+            self.commands.append(command)
+            name, args = command[0].upper(), command[1:]
+            if name == "AUTH":
+                reply = b"+OK\r\n" if args[0] == self.password else b"-WRONGPASS invalid password\r\n"
+            elif name == "GET":
+                await asyncio.sleep(self.delays.get(args[0], 0))
+                value = self.data.get(args[0])
+                reply = b"$-1\r\n" if value is None else f"${len(value.encode())}\r\n{value}\r\n".encode()
+            elif name == "SET":
+                self.data[args[0]] = args[1]
+                reply = b"+OK\r\n"
+            elif name == "DEL":
+                reply = f":{int(self.data.pop(args[0], None) is not None)}\r\n".encode()
+            elif name == "DBSIZE":
+                reply = f":{len(self.data)}\r\n".encode()
+            else:
+                reply = b"+OK\r\n"
+            writer.write(reply)
+            await writer.drain()
+        writer.close()
+
+
+async def test_memory_cache_evicts_least_recently_used_entry() -> None:
+    cache = InMemoryCacheBackend(default_ttl=60, max_entries=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    assert await cache.get("a") == "1"
+
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert cache.stats.evictions == 1
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+async def test_memory_cache_expires_entries() -> None:
+    cache = InMemoryCacheBackend(default_ttl=60, max_entries=10)
+    await cache.set("a", "1", ttl=0)
+
+    assert await cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+async def test_redis_cache_round_trip_against_fake_server() -> None:
+    async with FakeRedisServer() as server:
+        cache = RedisCacheBackend(url=server.url, default_ttl=30)
+
+        assert await cache.get("user:1") is None
+        await cache.set("user:1", '{"id": 1}')
+        assert await cache.get("user:1") == '{"id": 1}'
+        assert await cache.size() == 1
+        await cache.delete("user:1")
+        assert await cache.get("user:1") is None
+        await cache.close()
+
+    assert ["SELECT", "1"] in server.commands
+    assert ["SET", "user:1", '{"id": 1}', "PX", "30000"] in server.commands
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+async def test_redis_cache_degrades_to_miss_when_server_is_down() -> None:
+    async with FakeRedisServer() as server:
+        url = server.url
+
+    cache = RedisCacheBackend(url=url, default_ttl=30)
+
+    assert await cache.get("user:1") is None
+    assert cache.stats.misses == 1
+
+
+async def test_redis_cache_drops_the_connection_of_a_cancelled_command() -> None:
+    async with FakeRedisServer() as server:
+        server.data = {"user:1": '{"id": 1}', "user:2": '{"id": 2}'}
+        server.delays["user:1"] = 0.2
+        cache = RedisCacheBackend(url=server.url, default_ttl=30)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(cache.get("user:1"), timeout=0.05)
+
+        # The late reply to `GET user:1` must not be read as the reply to `GET user:2`
+        assert await cache.get("user:2") == '{"id": 2}'
+        await cache.close()
+
+
+async def test_redis_cache_drops_a_connection_that_failed_auth() -> None:
+    async with FakeRedisServer(password="secret") as server:
+        host, port = server.url.removeprefix("redis://").split("/")[0].split(":")
+        cache = RedisCacheBackend(url=f"redis://:wrong@{host}:{port}/1", default_ttl=30)
+
+        assert await cache.get("user:1") is None
+        assert cache._writer is None
+        assert ["SELECT", "1"] not in server.commands
@@ -0,0 +1,20 @@
+from src.utilities.metrics.histogram import Histogram
+
+
+def test_histogram_counts_observations_into_buckets() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.cumulative_buckets() == {"0.1": 2, "1.0": 3, "+Inf": 4}
+
+
+def test_histogram_quantile_interpolates_within_bucket() -> None:
+    histogram = Histogram(buckets=(1.0, 2.0))
+    for _ in range(10):
+        histogram.observe(1.5)
+
+    assert histogram.quantile(0.5) == 1.5
+    assert histogram.quantile(1.0) == 2.0
+    assert Histogram().quantile(0.5) is None
@@ -0,0 +1,26 @@
+import datetime
+
+from src.models.db.user import User
+from src.models.schemas.user import UserInResponse
+from src.utilities.formatters.json_formatter import dumps_json
+
+
+def test_dumps_json_matches_base_schema_model_encoding() -> None:
+    user = User(
+        id=1,
+        email="a@example.com",
+        username="a",
+        first_name="Ada",
+        last_name=None,
+        auth_id=None,
+        is_onboarding=True,
+        is_active=False,
+        is_logged_in=False,
+        last_login=datetime.datetime(2024, 5, 1, 8, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        updated_at=None,
+    )
+    user_in_response = UserInResponse.model_validate(user)
+
+    assert dumps_json(user_in_response.model_dump()) == user_in_response.model_dump_json().encode()
+    assert b'"created_at":"2024-01-01T00:00:00Z"' in dumps_json(user_in_response.model_dump())